@@ -0,0 +1,189 @@
+"""
+
+Measure the bytes wasted by built packages, ranking the worst offenders.
+
+For every package folder, the files are compared with the layout declared in the
+`package_info()` of its recipe (statically, with Python's `ast` module):
+
+  - leftovers: files never used by consumers wherever they are (`lib/cmake`,
+    `lib/pkgconfig`, `share/doc`, `share/man`, `share/info`, `*.pdb`, `*.la`), unless the
+    folder is declared in the `cpp_info`
+  - undeclared: files outside all the `includedirs`, `libdirs`, `bindirs`, `resdirs`,
+    `builddirs` and `frameworkdirs` declared by the recipe and the default ones
+
+Packages are given as `reference=folder`, or found in a Conan 1.x cache (`~/.conan/data`).
+
+    PYTHONPATH=.ci python3 -m cci.audit_package_bloat --conan-data ~/.conan/data --top 20 --output bloat.json
+    PYTHONPATH=.ci python3 -m cci.audit_package_bloat zlib/1.3.1=/tmp/zlib-package
+
+"""
+
+import argparse
+import ast
+import fnmatch
+import glob
+import json
+import os
+import sys
+
+from .recipe_index import RecipeIndex, build as build_index, load_index
+
+
+DIR_ATTRIBUTES = ("includedirs", "libdirs", "bindirs", "resdirs", "builddirs", "frameworkdirs")
+DEFAULT_DIRS = {"includedirs": ["include"], "libdirs": ["lib"], "bindirs": ["bin"], "resdirs": ["res"],
+                "builddirs": [], "frameworkdirs": ["Frameworks"]}
+LEFTOVERS = ("lib/cmake", "lib/pkgconfig", "share/doc", "share/man", "share/info", "share/pkgconfig", "share/cmake")
+LEFTOVER_PATTERNS = ("*.pdb", "*.la")
+ALWAYS_PACKAGED = ("licenses", "conaninfo.txt", "conanmanifest.txt")
+
+
+def _path(node):
+    """ Literal path of `"lib"`, `os.path.join("lib", "cmake")` or `["lib"]`, None if not static """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value.strip("/")
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "join":
+        parts = [_path(arg) for arg in node.args]
+        return None if None in parts else "/".join(part for part in parts if part)
+    return None
+
+
+def _dirs_attribute(node):
+    """ Name of the `*dirs` attribute of a cpp_info (or a component) assigned or modified by the node """
+    if isinstance(node, ast.Attribute) and node.attr in DIR_ATTRIBUTES:
+        return node.attr
+    return None
+
+
+def declared_dirs(conanfile_path):
+    """ Return ({attribute: [paths]}, dynamic) from the package_info() of the recipe """
+    with open(conanfile_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=conanfile_path)
+    package_info = next((node for node in ast.walk(tree)
+                         if isinstance(node, ast.FunctionDef) and node.name == "package_info"), None)
+    # Assignments are often conditional (e.g. `libdirs = []` for header only), so the default
+    # folders are always considered declared: only files outside all of them are reported
+    declared = {attribute: set(DEFAULT_DIRS[attribute]) for attribute in DIR_ATTRIBUTES}
+    dynamic = False
+    for node in ast.walk(package_info) if package_info else ():
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                attribute = _dirs_attribute(target)
+                if attribute is None:
+                    continue
+                if isinstance(node.value, (ast.List, ast.Tuple)):
+                    paths = [_path(elt) for elt in node.value.elts]
+                    dynamic |= None in paths
+                    declared[attribute].update(p for p in paths if p is not None)
+                else:
+                    dynamic = True
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and \
+                node.func.attr in ("append", "extend") and _dirs_attribute(node.func.value):
+            attribute = _dirs_attribute(node.func.value)
+            values = node.args[0].elts if node.func.attr == "extend" and node.args and \
+                isinstance(node.args[0], (ast.List, ast.Tuple)) else node.args
+            paths = [_path(value) for value in values]
+            dynamic |= None in paths or not paths
+            declared[attribute].update(p for p in paths if p is not None)
+    return {attribute: sorted(paths) for attribute, paths in declared.items()}, dynamic
+
+
+def _under(path, folder):
+    return folder == "" or path == folder or path.startswith(folder + "/")
+
+
+def audit_package(folder, dirs, dynamic=False):
+    """ Return {"total": bytes, "wasted": bytes, "categories": {...}, "files": [[path, bytes, category]]} """
+    declared = [d for values in dirs.values() for d in values]
+    result = {"total": 0, "wasted": 0, "categories": {}, "files": []}
+    for root, _, filenames in os.walk(folder):
+        for filename in filenames:
+            full_path = os.path.join(root, filename)
+            path = os.path.relpath(full_path, folder).replace(os.sep, "/")
+            size = os.path.getsize(full_path)
+            result["total"] += size
+            if any(_under(path, kept) for kept in ALWAYS_PACKAGED):
+                continue
+            category = None
+            leftover = next((leftover for leftover in LEFTOVERS if _under(path, leftover)), None)
+            # e.g. builddirs = ["lib/cmake/foo"] for CMake modules used by consumers
+            if leftover and not any(_under(d, leftover) and _under(path, d) for d in declared):
+                category = "leftover"
+            elif any(fnmatch.fnmatch(filename, pattern) for pattern in LEFTOVER_PATTERNS):
+                category = "leftover"
+            elif not dynamic and not any(_under(path, d) for d in declared):
+                category = "undeclared"
+            if category:
+                result["wasted"] += size
+                result["categories"][category] = result["categories"].get(category, 0) + size
+                result["files"].append([path, size, category])
+    result["files"].sort(key=lambda item: item[1], reverse=True)
+    return result
+
+
+def conan_v1_packages(data_folder):
+    """ Yield (reference, package_id, folder) for every package in a Conan 1.x data folder """
+    for package_folder in sorted(os.scandir(data_folder), key=lambda e: e.name) if os.path.isdir(data_folder) else ():
+        pattern = os.path.join(package_folder.path, "*", "*", "*", "package", "*")
+        for path in sorted(p for p in glob.glob(pattern) if os.path.isdir(p)):
+            version, user, channel = path.split(os.sep)[-5:-2]
+            reference = f"{package_folder.name}/{version}"
+            if (user, channel) != ("_", "_"):
+                reference += f"@{user}/{channel}"
+            yield reference, os.path.basename(path), path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report the bytes wasted by package folders compared with the layout declared by their recipes."
+    )
+    parser.add_argument("packages", nargs="*", metavar="REF=FOLDER", help="package folders to audit.")
+    parser.add_argument("--conan-data", default=None, help="audit every package of a Conan 1.x data folder.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--top", type=int, default=10, help="number of packages in the ranking.")
+    parser.add_argument("--output", default=None, help="write the full report as JSON to this file.")
+    args = parser.parse_args()
+
+    packages = []
+    for item in args.packages:
+        reference, _, folder = item.partition("=")
+        if "/" not in reference.split("@", 1)[0] or not folder:
+            parser.error(f"invalid package `{item}`, expected name/version=folder")
+        packages.append((reference, None, folder))
+    if args.conan_data:
+        packages.extend(conan_v1_packages(args.conan_data))
+    if not packages:
+        parser.error("no packages to audit")
+
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    layouts = {}
+    report = []
+    for reference, package_id, folder in packages:
+        name, version = reference.split("@", 1)[0].split("/", 1)
+        if name not in index or version not in index.versions(name):
+            print(f"Skipping {reference}: not in the recipes folder", file=sys.stderr)
+            continue
+        conanfile = os.path.join(args.recipes, index.recipe_folder(name, version), "conanfile.py")
+        if conanfile not in layouts:
+            layouts[conanfile] = declared_dirs(conanfile)
+        dirs, dynamic = layouts[conanfile]
+        result = audit_package(folder, dirs, dynamic)
+        report.append(dict(reference=reference, package_id=package_id, folder=folder, dynamic_layout=dynamic,
+                           **result))
+
+    report.sort(key=lambda item: item["wasted"], reverse=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    for item in report[:args.top]:
+        if not item["wasted"]:
+            break
+        categories = ", ".join(f"{category} {size} B" for category, size in sorted(item["categories"].items()))
+        largest = ", ".join(path for path, _, _ in item["files"][:3])
+        print(f"{item['reference']} {item['package_id'] or ''}: {item['wasted']} of {item['total']} B wasted "
+              f"({categories}), e.g. {largest}")
+    print(f"Packages: {len(report)}, wasted: {sum(item['wasted'] for item in report)} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+
+Audit a local mirror of the backup sources against the `sha256` of every `conandata.yml`.
+
+Mirror files are named after their sha256 (`<mirror>/<sha256>`, or `<mirror>/s/<sha256>`
+for stores created by `prefetch_sources.py`). The audit reports:
+
+  - missing: checksums referenced by recipes that are not in the mirror
+  - corrupt: files whose content does not match their name
+  - orphaned: files not referenced by any recipe
+
+Files are hashed in parallel with memory-mapped reads. Results are stored in a state
+file, so following runs only hash the files whose size or mtime changed.
+
+    PYTHONPATH=.ci python3 -m cci.audit_sources_mirror --mirror /data/backup-sources --state audit_state.json
+
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .recipe_index import RecipeIndex, build as build_index, load_index
+
+
+STATE_FORMAT = 1
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def hash_file(path):
+    """ sha256 of a file, reading it through mmap """
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha.update(mapped)
+    return sha.hexdigest()
+
+
+def _hash_entry(path):
+    try:
+        return path, hash_file(path), None
+    except OSError as error:
+        return path, None, str(error)
+
+
+def expected_checksums(index: RecipeIndex):
+    """ Return {sha256: [references]} for every source of every recipe """
+    expected = {}
+    for name in index.names():
+        for version in index.versions(name):
+            for source in index.sources(name, version):
+                if source["sha256"]:
+                    expected.setdefault(source["sha256"].lower(), []).append(f"{name}/{version}")
+    return expected
+
+
+def mirror_files(mirror):
+    """ Return {sha256: path} of the blobs in the mirror, ignoring summaries and partial downloads """
+    folder = os.path.join(mirror, "s") if os.path.isdir(os.path.join(mirror, "s")) else mirror
+    return {entry.name: entry.path for entry in os.scandir(folder)
+            if entry.is_file() and _SHA256_RE.match(entry.name)}
+
+
+def audit(expected, files, state=None, jobs=None):
+    """ Compare the mirror files with the expected checksums, hashing only the files that changed since `state` """
+    previous = (state or {}).get("files", {})
+    new_state = {}
+    to_hash = []
+    for sha256, path in files.items():
+        stat = os.stat(path)
+        old = previous.get(sha256)
+        if old and old["size"] == stat.st_size and old["mtime"] == stat.st_mtime_ns:
+            new_state[sha256] = old
+        else:
+            new_state[sha256] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": None}
+            to_hash.append(path)
+
+    errors = {}
+    if to_hash:
+        # Big files first so they do not end up alone at the end of the run
+        to_hash.sort(key=lambda path: os.path.getsize(path), reverse=True)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for path, digest, error in executor.map(_hash_entry, to_hash):
+                name = os.path.basename(path)
+                if error is not None:
+                    errors[name] = error
+                    del new_state[name]
+                else:
+                    new_state[name]["sha256"] = digest
+
+    report = {
+        "missing": {sha256: refs for sha256, refs in sorted(expected.items()) if sha256 not in files},
+        "corrupt": sorted(name for name, info in new_state.items() if info["sha256"] != name),
+        "orphaned": sorted(name for name in files if name not in expected),
+        "unreadable": errors,
+        "hashed": len(to_hash),
+        "total": len(files),
+    }
+    return report, {"format": STATE_FORMAT, "files": new_state}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Audit a local backup sources mirror against the checksums in conandata.yml files."
+    )
+    parser.add_argument("--mirror", required=True, help="mirror folder, with files named after their sha256.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--state", default=None, help="state file used to skip files unchanged since the last audit.")
+    parser.add_argument("--full", action="store_true", help="hash every file, ignoring the state file.")
+    parser.add_argument("--output", default=None, help="write the full report as JSON to this file.")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of hashing processes.")
+    args = parser.parse_args()
+
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    state = None
+    if args.state and not args.full and os.path.isfile(args.state):
+        with open(args.state, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("format") != STATE_FORMAT:
+            state = None
+
+    report, new_state = audit(expected_checksums(index), mirror_files(args.mirror), state, jobs=args.jobs)
+
+    if args.state:
+        with open(args.state, "w", encoding="utf-8") as f:
+            json.dump(new_state, f)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    for sha256 in report["corrupt"]:
+        print(f"Corrupt: {sha256}", file=sys.stderr)
+    for sha256, refs in report["missing"].items():
+        print(f"Missing: {sha256} ({', '.join(refs)})", file=sys.stderr)
+    for name, error in report["unreadable"].items():
+        print(f"Unreadable: {name}: {error}", file=sys.stderr)
+    print(f"Files: {report['total']} (hashed {report['hashed']}), missing: {len(report['missing'])}, "
+          f"corrupt: {len(report['corrupt'])}, orphaned: {len(report['orphaned'])}")
+    if report["missing"] or report["corrupt"] or report["unreadable"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
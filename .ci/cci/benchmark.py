@@ -0,0 +1,244 @@
+"""
+
+Benchmark the recipe linters over fixed subsets of the recipes.
+
+The subsets are fixed lists of recipe folders, so results stay comparable when recipes
+are added or modified:
+
+  - small: some of the smallest recipes
+  - median: recipes around the median size
+  - large: boost, qt and opencv
+
+Every tool (pylint, conandata_yaml_linter.py, config_yaml_linter.py and yamllint) is run
+the way CI does, without the pylint results cache, first cold and then warm. Each cold
+run starts from a new PYLINTHOME and bytecode cache (PYTHONPYCACHEPREFIX), and the OS
+page cache is dropped before it when allowed (as root on Linux), which the results record.
+The warm run follows with the state left by the cold run. Pylint is also measured with a
+filled results cache (`cached`), reported apart. Wall time, CPU time and peak memory (RSS
+of the largest process) are stored in a JSON file with the commit they were measured on,
+so two runs can be compared:
+
+    PYTHONPATH=.ci python3 -m cci.benchmark run --output bench-base.json
+    git checkout my-branch
+    PYTHONPATH=.ci python3 -m cci.benchmark run --output bench-new.json
+    PYTHONPATH=.ci python3 -m cci.benchmark compare bench-base.json bench-new.json --max-ratio 1.5
+
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+BENCHMARK_FORMAT = 3
+TOOLS = ("pylint", "conandata", "config", "yamllint")
+
+SUBSETS = {
+    "small": [
+        "clara/all", "clove-unit/all", "decimal_for_cpp/all", "etl/all", "greatest/all",
+        "plog/all", "st_tree/all", "tclap/all", "tinydir/all", "turtle/all",
+    ],
+    "median": [
+        "accellera-uvm-systemc/all", "cppbenchmark/all", "daw_json_link/all", "dragonbox/all", "hana/all",
+        "hdrhistogram-c/all", "kcov/all", "libnabo/all", "libsamplerate/all", "wildmidi/all",
+    ],
+    "large": [
+        "boost/all", "opencv/2.x", "opencv/3.x", "opencv/4.x", "qt/5.x.x", "qt/6.x.x",
+    ],
+}
+
+
+def select_subsets(recipes_folder):
+    """ Return {subset: ["name/folder", ...]} with the folders of SUBSETS still in `recipes_folder` """
+    subsets = {}
+    for subset, folders in SUBSETS.items():
+        missing = [key for key in folders if not os.path.isfile(os.path.join(recipes_folder, key, "conanfile.py"))]
+        if missing:
+            print(f"Warning: recipes of the '{subset}' subset not found: {', '.join(missing)}", file=sys.stderr)
+        subsets[subset] = [key for key in folders if key not in missing]
+    return subsets
+
+
+def subset_files(recipes_folder, folders):
+    """ Files linted by each tool for the given recipe folders """
+    conanfiles, conandatas, configs = [], [], set()
+    for key in folders:
+        name, folder = key.split("/", 1)
+        conanfiles.append(os.path.join(recipes_folder, name, folder, "conanfile.py"))
+        conandata = os.path.join(recipes_folder, name, folder, "conandata.yml")
+        if os.path.isfile(conandata):
+            conandatas.append(conandata)
+        config = os.path.join(recipes_folder, name, "config.yml")
+        if os.path.isfile(config):
+            configs.add(config)
+    return {"conanfile": conanfiles, "conandata": conandatas, "config": sorted(configs)}
+
+
+def commands(tool, files):
+    """ Commands run for `tool`, as in the CI workflows """
+    if tool == "pylint":
+        return [["pylint", "--rcfile=linter/pylintrc_recipe", "--output-format=parseable"] + files["conanfile"]]
+    if tool == "conandata":
+        return [[sys.executable, "linter/conandata_yaml_linter.py"] + files["conandata"]]
+    if tool == "config":
+        return [[sys.executable, "linter/config_yaml_linter.py", path] for path in files["config"]]
+    return [["yamllint", "--config-file", "linter/yamllint_rules.yml", "-f", "standard"]
+            + files["config"] + files["conandata"]]
+
+
+def _run_commands(cmds, env):
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    for cmd in cmds:
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return elapsed, cpu, after.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def measure(cmds, env):
+    """ Run the commands one after the other, ignoring their exit code.
+
+    Returns (seconds, CPU seconds, peak RSS in MB). The commands are run from a new process:
+    the ru_maxrss of RUSAGE_CHILDREN is the largest of all the children ever waited for.
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_commands, cmds, env).result()
+
+
+def drop_page_cache():
+    """ Drop the OS page cache so files are read from disk again, return whether it was allowed """
+    subprocess.run(["sync"], check=False)
+    try:
+        with open("/proc/sys/vm/drop_caches", "w", encoding="utf-8") as f:
+            f.write("3\n")
+    except OSError:
+        return False
+    return True
+
+
+def run_benchmark(recipes_folder, tools=TOOLS, repeat=3):
+    """ Return the results {subset: {tool: {"cold": ..., "warm": ...}}} """
+    results = {}
+    for subset, folders in select_subsets(recipes_folder).items():
+        files = subset_files(recipes_folder, folders)
+        results[subset] = {"recipes": folders, "tools": {}}
+        for tool in tools:
+            cmds = commands(tool, files)
+            if not shutil.which(cmds[0][0]):
+                print(f"Skipping {tool}: {cmds[0][0]} not found", file=sys.stderr)
+                continue
+            runs = {"cold": [], "warm": []}
+            if tool == "pylint":
+                runs["cached"] = []
+            page_cache_dropped = []
+            for _ in range(repeat):
+                with tempfile.TemporaryDirectory() as state_dir:
+                    env = dict(os.environ, PYTHONPATH=os.getcwd(), CCI_LINTER_NO_CACHE="1",
+                               PYLINTHOME=os.path.join(state_dir, "pylint"),
+                               PYTHONPYCACHEPREFIX=os.path.join(state_dir, "pycache"))
+                    env.pop("CCI_LINTER_CACHE", None)
+                    env.pop("CCI_LINTER_PROFILE", None)
+                    page_cache_dropped.append(drop_page_cache())
+                    runs["cold"].append(measure(cmds, env))
+                    runs["warm"].append(measure(cmds, env))
+                    if "cached" in runs:
+                        env = dict(env, CCI_LINTER_CACHE="1", CCI_LINTER_CACHE_DIR=os.path.join(state_dir, "cache"))
+                        env.pop("CCI_LINTER_NO_CACHE")
+                        measure(cmds, env)  # fills the cache
+                        runs["cached"].append(measure(cmds, env))
+            results[subset]["tools"][tool] = {
+                mode: {"seconds": statistics.median(t for t, _, _ in values),
+                       "cpu_seconds": statistics.median(c for _, c, _ in values),
+                       "peak_memory_mb": max(m for _, _, m in values)}
+                for mode, values in runs.items()
+            }
+            results[subset]["tools"][tool]["cold"]["page_cache_dropped"] = all(page_cache_dropped)
+            print(f"{subset:>6} {tool:>10}: " + ", ".join(
+                f"{mode} {timings['seconds']:.2f} s" for mode, timings in results[subset]["tools"][tool].items()),
+                file=sys.stderr)
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True,
+                              text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(base, new, max_ratio):
+    """ Return the (subset, tool, mode, base seconds, new seconds) entries slower than `max_ratio` """
+    regressions = []
+    for subset, data in new["results"].items():
+        for tool, modes in data["tools"].items():
+            for mode, values in modes.items():
+                try:
+                    reference = base["results"][subset]["tools"][tool][mode]["seconds"]
+                except KeyError:
+                    continue
+                if reference and values["seconds"] / reference > max_ratio:
+                    regressions.append((subset, tool, mode, reference, values["seconds"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ConanCenterIndex linters over fixed subsets of the recipes."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run the benchmark.")
+    run_parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    run_parser.add_argument("--tool", action="append", choices=TOOLS, help="tools to run (all by default).")
+    run_parser.add_argument("--repeat", type=int, default=3, help="number of runs, the median time is kept.")
+    run_parser.add_argument("--output", required=True, help="JSON file to store the results.")
+    compare_parser = subparsers.add_parser("compare", help="compare two benchmark results.")
+    compare_parser.add_argument("base", help="results of the reference commit.")
+    compare_parser.add_argument("new", help="results to check.")
+    compare_parser.add_argument("--max-ratio", type=float, default=2.0,
+                                help="fail if any time grows more than this factor.")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_benchmark(args.recipes, tools=args.tool or TOOLS, repeat=args.repeat)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"format": BENCHMARK_FORMAT, "commit": _commit(), "python": platform.python_version(),
+                       "platform": platform.platform(), "cpus": os.cpu_count(), "results": results}, f, indent=2)
+        return
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    if base.get("format") != new.get("format"):
+        print(f"Warning: comparing results of different formats ({base.get('format')} and {new.get('format')})",
+              file=sys.stderr)
+    for subset, data in new["results"].items():
+        if subset in base["results"] and data["recipes"] != base["results"][subset]["recipes"]:
+            print(f"Warning: the '{subset}' subset contains different recipes in both runs", file=sys.stderr)
+    dropped = {results.get("page_cache_dropped") for run in (base, new) for data in run["results"].values()
+               for results in (modes.get("cold", {}) for modes in data["tools"].values())}
+    if len(dropped) > 1:
+        print("Warning: the page cache was dropped before the cold runs of only one of the runs", file=sys.stderr)
+    regressions = compare(base, new, args.max_ratio)
+    for subset, tool, mode, before, after in regressions:
+        print(f"{subset} {tool} ({mode}): {before:.2f} s -> {after:.2f} s")
+    if regressions:
+        sys.exit(1)
+    print(f"No regression above {args.max_ratio}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""
+
+Estimate the peak memory and duration of every build from recorded build results, and
+suggest the `pod_size` and `large_timeout_references` sections of `.c3i/config_v2.yml`.
+
+Records are JSON (a list, or one object per line) with at least a `reference` and any of:
+
+    {"reference": "boost/1.84.0", "configuration": "linux-gcc",
+     "duration_seconds": 5400, "peak_memory_mb": 7100}
+
+Logs produced by `/usr/bin/time -v` are also accepted with `--time-log REF=path`.
+
+The builds of the CI are read with `--summary`. It takes the `json` parameter of the
+"All logs" link that conan-center-bot posts in every pull request (the same summary read by
+the hooks-warnings workflow), or the whole link. The summary is a list of jobs with the
+`reference` built and `build`, the path of its log relative to the c3i misc folder:
+
+    [{"reference": "zlib/1.3.1", "build": "<path of the build log>"}, ...]
+
+Every log is downloaded, or read from `--logs-base` if it points to a local copy of the
+folder. The duration is the `/usr/bin/time -v` output if the log has it, otherwise the time
+between the first and last timestamped lines. Logs without either are ignored.
+
+References with records use the 90th percentile of their measurements (or of the other
+versions of the same recipe). The rest are estimated with a least squares model fitted on
+static features of the recipes: size of the conanfile, number of requirements and build
+system helpers used.
+
+    PYTHONPATH=.ci python3 -m cci.build_cost_model records.json --costs-output costs.json
+
+The costs file can be passed to `build_scheduler.py --costs`.
+
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import sys
+import urllib.parse
+import urllib.request
+from datetime import datetime
+
+import yaml
+
+from .rebuild_impact import DEFAULT_CONFIG
+from .recipe_index import RecipeIndex, build as build_index, load_index
+from .requirements_graph import RequirementsGraph, build as build_graph, load_graph
+
+
+BUILD_HELPERS = ("CMake", "Autotools", "Meson", "MSBuild", "Bazel")
+
+_TIME_MEMORY_RE = re.compile(r"Maximum resident set size \(kbytes\): (\d+)")
+_TIME_ELAPSED_RE = re.compile(r"Elapsed \(wall clock\) time .*: (?:(\d+):)?(\d+):(\d+(?:\.\d+)?)")
+_LOG_TIMESTAMP_RE = re.compile(r"^\[?(\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d)", re.MULTILINE)
+
+C3I_LOGS_URL = "https://c3i.jfrog.io/c3i/misc/"
+C3I_SUMMARY_PREFIX = f"{C3I_LOGS_URL}summary.html?json="
+
+
+def load_records(paths):
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            content = f.read().strip()
+        if not content:
+            continue
+        if content.startswith("["):
+            records.extend(json.loads(content))
+        else:
+            records.extend(json.loads(line) for line in content.splitlines() if line.strip())
+    return [_normalize_record(record) for record in records if record.get("reference")]
+
+
+def _normalize_record(record):
+    duration = record.get("duration_seconds")
+    if duration is None and record.get("duration_minutes") is not None:
+        duration = float(record["duration_minutes"]) * 60
+    memory = record.get("peak_memory_mb")
+    if memory is None and record.get("max_rss_kb") is not None:
+        memory = float(record["max_rss_kb"]) / 1024
+    return {
+        "reference": record["reference"].split("@", 1)[0].split("#", 1)[0],
+        "configuration": record.get("configuration"),
+        "duration_seconds": float(duration) if duration is not None else None,
+        "peak_memory_mb": float(memory) if memory is not None else None,
+    }
+
+
+def _parse_time_output(reference, content):
+    record = {"reference": reference}
+    memory = _TIME_MEMORY_RE.search(content)
+    if memory:
+        record["max_rss_kb"] = int(memory.group(1))
+    elapsed = _TIME_ELAPSED_RE.search(content)
+    if elapsed:
+        hours, minutes, seconds = elapsed.groups()
+        record["duration_seconds"] = int(hours or 0) * 3600 + int(minutes) * 60 + float(seconds)
+    return record
+
+
+def parse_time_log(reference, path):
+    """ Read the peak memory and elapsed time reported by `/usr/bin/time -v` """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        content = f.read()
+    return _normalize_record(_parse_time_output(reference, content))
+
+
+def parse_build_log(reference, content):
+    """ Record of a c3i build log, None if it has no duration """
+    record = _parse_time_output(reference, content)
+    if "duration_seconds" not in record:
+        timestamps = _LOG_TIMESTAMP_RE.findall(content)
+        if len(timestamps) < 2:
+            return None
+        first, last = (datetime.fromisoformat(timestamps[i].replace(" ", "T")) for i in (0, -1))
+        record["duration_seconds"] = (last - first).total_seconds()
+    return _normalize_record(record)
+
+
+def _is_url(location):
+    return urllib.parse.urlparse(location).scheme in ("http", "https", "file")
+
+
+def _read(location, timeout=60):
+    if _is_url(location):
+        with urllib.request.urlopen(location, timeout=timeout) as response:
+            return response.read().decode("utf-8", errors="replace")
+    with open(location, encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def load_summary(summary, logs_base=C3I_LOGS_URL):
+    """ Records of the builds of a c3i job summary (file, URL or "All logs" link), fetching their logs """
+    if summary.startswith(C3I_SUMMARY_PREFIX):
+        summary = summary[len(C3I_SUMMARY_PREFIX):]
+    records = []
+    for job in json.loads(_read(summary)):
+        if not job.get("reference") or job.get("build") is None:
+            continue
+        if _is_url(logs_base):
+            log = urllib.parse.urljoin(logs_base, job["build"])
+        else:
+            log = os.path.join(logs_base, job["build"])
+        try:
+            record = parse_build_log(job["reference"], _read(log))
+        except (OSError, ValueError) as error:
+            print(f"Could not read the log of {job['reference']} ({log}): {error}", file=sys.stderr)
+            continue
+        if record:
+            records.append(record)
+    return records
+
+
+def percentile(values, fraction=0.9):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(math.ceil(fraction * len(values))) - 1)]
+
+
+def recipe_features(recipes_folder, graph: RequirementsGraph):
+    """ Static features of every recipe folder, {"name/folder": [features]} """
+    features = {}
+    for path in sorted(glob.glob(os.path.join(recipes_folder, "*", "*", "conanfile.py"))):
+        name, folder = os.path.normpath(path).split(os.sep)[-3:-1]
+        key = f"{name}/{folder}"
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        header_only = 'package_type = "header-library"' in source or "def build(" not in source
+        features[key] = [
+            1.0,
+            math.log1p(source.count("\n")),
+            float(len(graph.dependencies.get(key, ()))),
+            1.0 if header_only else 0.0,
+        ] + [1.0 if re.search(rf"\b{helper}\(", source) else 0.0 for helper in BUILD_HELPERS]
+    return features
+
+
+def _solve(matrix, vector):
+    """ Solve a small linear system with Gauss-Jordan elimination (with a tiny ridge for stability) """
+    n = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(n)]
+    for i in range(n):
+        rows[i][i] += 1e-6
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        if abs(rows[col][col]) < 1e-12:
+            continue
+        for r in range(n):
+            if r != col:
+                factor = rows[r][col] / rows[col][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [rows[i][n] / rows[i][i] if abs(rows[i][i]) > 1e-12 else 0.0 for i in range(n)]
+
+
+def fit(samples):
+    """ Least squares fit of log(target) on the features. `samples` is a list of (features, target) """
+    # Not enough measurements to fit the model, only measured recipes will be estimated
+    if not samples or len(samples) <= len(samples[0][0]):
+        return None
+    size = len(samples[0][0])
+    xtx = [[sum(x[i] * x[j] for x, _ in samples) for j in range(size)] for i in range(size)]
+    xty = [sum(x[i] * math.log(max(y, 1e-3)) for x, y in samples) for i in range(size)]
+    return _solve(xtx, xty)
+
+
+def predict(coefficients, features):
+    return math.exp(sum(c * x for c, x in zip(coefficients, features)))
+
+
+def estimate(records, references, folder_of, features):
+    """ Return {reference: {"duration_seconds", "peak_memory_mb", "source"}} for every reference """
+    measured = {"duration_seconds": {}, "peak_memory_mb": {}}
+    for record in records:
+        for metric, by_reference in measured.items():
+            if record[metric] is not None:
+                by_reference.setdefault(record["reference"], []).append(record[metric])
+
+    estimates = {reference: {} for reference in references}
+    for metric, by_reference in measured.items():
+        by_name = {}
+        for reference, values in by_reference.items():
+            by_name.setdefault(reference.split("/", 1)[0], []).extend(values)
+        samples = [(features[folder_of[reference]], percentile(values))
+                   for reference, values in by_reference.items()
+                   if reference in folder_of and folder_of[reference] in features]
+        model = fit(samples)
+        for reference in references:
+            name = reference.split("/", 1)[0]
+            if reference in by_reference:
+                value, source = percentile(by_reference[reference]), "measured"
+            elif name in by_name:
+                value, source = percentile(by_name[name]), "recipe"
+            elif model and folder_of.get(reference) in features:
+                value, source = predict(model, features[folder_of[reference]]), "model"
+            else:
+                continue
+            estimates[reference][metric] = round(value, 1)
+            estimates[reference].setdefault("source", {})[metric] = source
+    return estimates
+
+
+def suggest_config(estimates, config, large_memory_mb, xlarge_memory_mb, timeout_margin):
+    """ Build the suggested pod_size and large_timeout_references sections """
+    task = config.get("tasks", {}).get("build_single_reference", {})
+    timeout_seconds = float(task.get("timeout_minutes", 600)) * 60
+    pod_size = {"large": set(), "xlarge": set()}
+    large_timeout = set()
+    for reference, estimate in estimates.items():
+        name = reference.split("/", 1)[0]
+        memory = estimate.get("peak_memory_mb")
+        if memory is not None and memory >= xlarge_memory_mb:
+            pod_size["xlarge"].add(name)
+        elif memory is not None and memory >= large_memory_mb:
+            pod_size["large"].add(name)
+        duration = estimate.get("duration_seconds")
+        if duration is not None and duration >= timeout_seconds * timeout_margin:
+            large_timeout.add(name)
+    pod_size["large"] -= pod_size["xlarge"]
+    return {
+        "pod_size": {size: sorted(names) for size, names in pod_size.items() if names},
+        "tasks": {"build_single_reference": {"large_timeout_references": sorted(large_timeout)}},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate build memory and duration per reference and suggest c3i pod sizes and timeouts."
+    )
+    parser.add_argument("records", nargs="*", help="JSON or JSON lines files with build records.")
+    parser.add_argument("--time-log", action="append", default=[], metavar="REF=PATH",
+                        help="output of `/usr/bin/time -v` for the build of a reference.")
+    parser.add_argument("--summary", action="append", default=[],
+                        help="c3i job summary (file, URL or \"All logs\" link of conan-center-bot).")
+    parser.add_argument("--logs-base", default=C3I_LOGS_URL,
+                        help="URL or local folder the build logs of the summaries are relative to.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--graph", default=None, help="requirements graph file (extracted on the fly if not given).")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="c3i configuration file.")
+    parser.add_argument("--large-memory-mb", type=float, default=8192, help="peak memory for the `large` pod size.")
+    parser.add_argument("--xlarge-memory-mb", type=float, default=16384, help="peak memory for the `xlarge` pod size.")
+    parser.add_argument("--timeout-margin", type=float, default=0.8,
+                        help="fraction of timeout_minutes above which a reference needs the large timeout.")
+    parser.add_argument("--output", default=None, help="write the estimates of every reference as JSON.")
+    parser.add_argument("--costs-output", default=None,
+                        help="write the estimated minutes per reference, as expected by build_scheduler.py --costs.")
+    args = parser.parse_args()
+
+    records = load_records(args.records)
+    for item in args.time_log:
+        reference, _, path = item.partition("=")
+        records.append(parse_time_log(reference, path))
+    for summary in args.summary:
+        records.extend(load_summary(summary, args.logs_base))
+    if not records:
+        parser.error("no build records given")
+
+    graph = RequirementsGraph(load_graph(args.graph) if args.graph else build_graph(args.recipes))
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    folder_of = {reference: f"{reference.split('/', 1)[0]}/{index.folder(*reference.split('/', 1))}"
+                 for reference in index.references()}
+    estimates = estimate(records, index.references(), folder_of, recipe_features(args.recipes, graph))
+
+    with open(args.config, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    suggestion = suggest_config(estimates, config, args.large_memory_mb, args.xlarge_memory_mb, args.timeout_margin)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(estimates, f, indent=2, sort_keys=True)
+    if args.costs_output:
+        costs = {reference: round(estimate["duration_seconds"] / 60, 1)
+                 for reference, estimate in estimates.items() if "duration_seconds" in estimate}
+        with open(args.costs_output, "w", encoding="utf-8") as f:
+            json.dump(costs, f, indent=2, sort_keys=True)
+    yaml.safe_dump(suggestion, sys.stdout, default_flow_style=False, sort_keys=False)
+
+
+if __name__ == "__main__":
+    main()
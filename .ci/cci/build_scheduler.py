@@ -0,0 +1,222 @@
+"""
+
+Plan the builds of a set of references over the configurations of `.c3i/config_v2.yml`.
+
+Every (reference, configuration, settings combination) is a build job. A job depends on
+the jobs of its requirements (from the static requirement graph) in the same settings
+combination. Jobs are assigned to a fixed number of executors per OS with a list
+scheduler: among the ready jobs, the one with the longest remaining critical path
+(its cost plus the most expensive chain of jobs waiting for it) runs first, and jobs are
+unblocked as soon as all their inputs are built.
+
+Job costs default to the `timeout_minutes` of `build_single_reference` (or
+`large_timeout_minutes` for `large_timeout_references`) and can be given per recipe name
+or reference with `--costs costs.json` ({"boost": 240, "zlib/1.3.1": 5}).
+
+    PYTHONPATH=.ci python3 -m cci.build_scheduler --executors 16 --dependents-of zlib --output plan.json
+
+"""
+
+import argparse
+import heapq
+import json
+import sys
+
+import yaml
+
+from .rebuild_impact import DEFAULT_CONFIG, configurations
+from .recipe_index import RecipeIndex, UnknownReference, build as build_index, load_index
+from .requirements_graph import RequirementsGraph, build as build_graph, load_graph
+
+
+class Job:
+    """
+       Build of a reference for one settings combination of a configuration
+    """
+
+    def __init__(self, reference, folder_key, config_id, profile_index, profile, cost):
+        self.reference = reference
+        self.name = reference.split("/", 1)[0]
+        self.folder_key = folder_key
+        self.config_id = config_id
+        self.profile_index = profile_index
+        self.profile = profile
+        self.cost = cost
+        self.depends_on = set()
+        self.dependents = set()
+        self.priority = 0.0
+
+    @property
+    def key(self):
+        return f"{self.reference}#{self.config_id}#{self.profile_index}"
+
+    @property
+    def pool(self):
+        return self.profile.get("os", "any")
+
+
+def default_costs(config_path=DEFAULT_CONFIG):
+    """ Return (default cost, {name: cost}) from the timeouts of the build_single_reference task """
+    with open(config_path, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    task = config.get("tasks", {}).get("build_single_reference", {})
+    default = float(task.get("timeout_minutes", 1))
+    large = float(task.get("large_timeout_minutes", default))
+    return default, {name: large for name in task.get("large_timeout_references", [])}
+
+
+def job_cost(reference, costs, default):
+    if reference in costs:
+        return float(costs[reference])
+    return float(costs.get(reference.split("/", 1)[0], default))
+
+
+def build_jobs(references, graph: RequirementsGraph, index: RecipeIndex, configs, costs, default_cost):
+    """ Create the jobs of every reference and link them with the jobs of their requirements """
+    jobs = {}
+    by_name_and_profile = {}
+    for reference in references:
+        name, version = reference.split("/", 1)
+        folder_key = f"{name}/{index.folder(name, version)}"
+        cost = job_cost(reference, costs, default_cost)
+        for config_id, profiles in configs.items():
+            for profile_index, profile in enumerate(profiles):
+                job = Job(reference, folder_key, config_id, profile_index, profile, cost)
+                jobs[job.key] = job
+                by_name_and_profile.setdefault((name, config_id, profile_index), []).append(job)
+
+    for job in jobs.values():
+        for dependency in graph.dependencies.get(job.folder_key, ()):
+            for required in by_name_and_profile.get((dependency, job.config_id, job.profile_index), ()):
+                job.depends_on.add(required.key)
+                required.dependents.add(job.key)
+    return jobs
+
+
+def assign_priorities(jobs):
+    """ Priority of a job is the length of the longest chain of costs starting at it """
+    pending = {key: len(job.dependents) for key, job in jobs.items()}
+    ready = [key for key, count in pending.items() if count == 0]
+    visited = 0
+    while ready:
+        job = jobs[ready.pop()]
+        visited += 1
+        job.priority = job.cost + max((jobs[key].priority for key in job.dependents), default=0.0)
+        for key in job.depends_on:
+            pending[key] -= 1
+            if pending[key] == 0:
+                ready.append(key)
+    if visited != len(jobs):
+        raise ValueError("The requirements of the selected references contain a cycle")
+
+
+def schedule(jobs, executors, default_executors=1):
+    """ Simulate the execution of the jobs. Returns the list of assignments and the makespan """
+    assign_priorities(jobs)
+    waiting = {key: len(job.depends_on) for key, job in jobs.items()}
+    ready = {}
+    free = {}
+    for job in jobs.values():
+        if job.pool not in free:
+            count = executors.get(job.pool, default_executors)
+            free[job.pool] = [f"{job.pool}-{i}" for i in range(count)][::-1]
+            ready[job.pool] = []
+        if not waiting[job.key]:
+            heapq.heappush(ready[job.pool], (-job.priority, job.key))
+
+    running = []
+    assignments = []
+    now = 0.0
+    while True:
+        for pool, queue in ready.items():
+            while queue and free[pool]:
+                _, key = heapq.heappop(queue)
+                executor = free[pool].pop()
+                job = jobs[key]
+                heapq.heappush(running, (now + job.cost, key, executor))
+                assignments.append({"job": key, "reference": job.reference, "configuration": job.config_id,
+                                    "profile": job.profile, "executor": executor, "start": now,
+                                    "end": now + job.cost, "depends_on": sorted(job.depends_on)})
+        if not running:
+            break
+        now, key, executor = heapq.heappop(running)
+        job = jobs[key]
+        free[job.pool].append(executor)
+        for dependent in sorted(job.dependents):
+            waiting[dependent] -= 1
+            if not waiting[dependent]:
+                heapq.heappush(ready[jobs[dependent].pool], (-jobs[dependent].priority, dependent))
+    return assignments, now
+
+
+def expand_references(items, index: RecipeIndex):
+    references = []
+    for item in items:
+        name, _, version = item.partition("/")
+        if version:
+            index.version(name, version)  # raises UnknownReference
+        references.extend([f"{name}/{version}"] if version else [f"{name}/{v}" for v in index.versions(name)])
+    return references
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Plan the builds of several references by dependency order and critical path."
+    )
+    parser.add_argument("references", nargs="*", help="recipe names or name/version references to build.")
+    parser.add_argument("--dependents-of", action="append", default=[],
+                        help="also build every recipe depending (transitively) on this recipe.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--graph", default=None, help="requirements graph file (extracted on the fly if not given).")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="c3i configuration file.")
+    parser.add_argument("--costs", default=None, help="JSON file with the cost (minutes) per recipe name or reference.")
+    parser.add_argument("--executors", type=int, default=4, help="number of executors per OS.")
+    parser.add_argument("--pool", action="append", default=[], metavar="OS=N",
+                        help="number of executors for a given OS, e.g. Macos=2.")
+    parser.add_argument("--output", default=None, help="write the plan as JSON to this file.")
+    args = parser.parse_args()
+
+    graph = RequirementsGraph(load_graph(args.graph) if args.graph else build_graph(args.recipes))
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+
+    items = list(args.references)
+    for name in args.dependents_of:
+        items.append(name)
+        items.extend(graph.nodes[key]["name"] for key in graph.transitive_dependents([name]))
+    unknown = sorted({item.partition("/")[0] for item in items if item.partition("/")[0] not in index})
+    if unknown:
+        print(f"Ignoring recipes without config.yml: {', '.join(unknown)}", file=sys.stderr)
+        items = [item for item in items if item.partition("/")[0] in index]
+    try:
+        references = sorted(set(expand_references(items, index)))
+    except UnknownReference as error:
+        parser.error(str(error))
+    if not references:
+        parser.error("no references to build")
+
+    default_cost, costs = default_costs(args.config)
+    if args.costs:
+        with open(args.costs, encoding="utf-8") as f:
+            costs.update(json.load(f))
+    executors = {}
+    for pool in args.pool:
+        os_name, _, count = pool.partition("=")
+        executors[os_name] = int(count)
+
+    jobs = build_jobs(references, graph, index, configurations(args.config), costs, default_cost)
+    try:
+        assignments, makespan = schedule(jobs, executors, default_executors=args.executors)
+    except ValueError as error:
+        parser.error(str(error))
+    critical_path = max((job.priority for job in jobs.values()), default=0.0)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"makespan": makespan, "critical_path": critical_path, "jobs": assignments}, f, indent=2)
+    print(f"References: {len(references)}, jobs: {len(jobs)}")
+    print(f"Critical path: {critical_path:.0f} min, planned makespan: {makespan:.0f} min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+
+Export many references in a few Conan 2 processes, the equivalent of running
+`conan export recipes/<name>/<folder> --name <name> --version <version>` for each of them,
+like the `scheduled_export_check` task of the Conan v2 pipeline (.c3i/config_v2.yml).
+
+The versions and folders come from the `config.yml` of every recipe. One Conan API is
+created per worker process and reused for all its exports, so Conan is only imported and
+initialized once per worker. References of the same recipe folder are exported by the same
+worker. Conan 1.x is not supported.
+
+The outcome of every reference is written to a single JSON file:
+
+    {"zlib/1.3.1": {"folder": "zlib/all", "status": "ok", "revision": "...", "seconds": 0.01},
+     "foo/1.0": {"folder": "foo/all", "status": "error", "error": "..."}}
+
+    PYTHONPATH=.ci python3 -m cci.bulk_export_check -j 8 --output export_check.json
+    PYTHONPATH=.ci python3 -m cci.bulk_export_check zlib openssl/3.2.1
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .recipe_index import RecipeIndex, UnknownReference, build as build_index, load_index
+
+
+_api = None
+
+
+def conan_version():
+    """ Version of the installed Conan, None if it is not installed """
+    try:
+        from conans import __version__
+    except ImportError:
+        return None
+    return __version__
+
+
+def _init_worker(cache_folder):
+    # Imported here, the parent process only schedules the exports
+    from conan.api.conan_api import ConanAPI
+    from conan.api.output import ConanOutput
+
+    global _api
+    ConanOutput.define_log_level("quiet")
+    _api = ConanAPI(cache_folder=os.path.join(cache_folder, str(os.getpid())))
+
+
+def export_group(conanfile_path, references):
+    """ Export all the references using the same conanfile.py. Returns {reference: result} """
+    results = {}
+    remotes = _api.remotes.list()  # to resolve python_requires
+    for reference in references:
+        name, version = reference.split("/", 1)
+        start = time.perf_counter()
+        try:
+            ref, _ = _api.export.export(conanfile_path, name, version, None, None, remotes=remotes)
+            results[reference] = {"status": "ok", "revision": ref.revision}
+        except Exception as exc:  # pylint: disable=broad-except
+            results[reference] = {"status": "error", "error": str(exc)}
+        results[reference]["seconds"] = round(time.perf_counter() - start, 3)
+    return results
+
+
+def group_references(index: RecipeIndex, recipes_folder, selection=None):
+    """ Return {conanfile_path: [references]} for the selected recipes or references """
+    groups = {}
+    for item in selection or index.names():
+        name, _, version = item.partition("/")
+        for v in [version] if version else index.versions(name):
+            path = os.path.abspath(os.path.join(recipes_folder, index.recipe_folder(name, v), "conanfile.py"))
+            groups.setdefault(path, []).append(f"{name}/{v}")
+    return groups
+
+
+def bulk_export(groups, jobs=None, cache_folder=None):
+    """ Export every group, returns {reference: result} """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(cache_folder or tmp,)) as executor:
+            # Recipes with many versions first so they do not end up alone at the end of the run
+            paths = sorted(groups, key=lambda path: len(groups[path]), reverse=True)
+            for result in executor.map(export_group, paths, [groups[path] for path in paths]):
+                results.update(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export the references of many recipes in a few Conan processes and report the results."
+    )
+    parser.add_argument("references", nargs="*", help="recipe names or name/version references (all if empty).")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--cache", default=None,
+                        help="folder for the Conan caches of the workers (a temporary folder if not given).")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes.")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    version = conan_version()
+    if not version or int(version.split(".", 1)[0]) < 2:
+        parser.error(f"Conan 2 is required, found {version or 'none'}")
+
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    try:
+        groups = group_references(index, args.recipes, args.references)
+    except UnknownReference as error:
+        parser.error(str(error))
+    start = time.perf_counter()
+    results = bulk_export(groups, jobs=args.jobs, cache_folder=args.cache)
+    for reference, result in results.items():
+        name, version = reference.split("/", 1)
+        result["folder"] = index.recipe_folder(name, version)
+    results = dict(sorted(results.items()))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    failed = {reference: result for reference, result in results.items() if result["status"] != "ok"}
+    for reference, result in failed.items():
+        print(f"Failed {reference} ({result['folder']}): {result['error']}", file=sys.stderr)
+    print(f"Exported {len(results) - len(failed)} of {len(results)} references "
+          f"from {len(groups)} recipe folders in {time.perf_counter() - start:.0f} s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
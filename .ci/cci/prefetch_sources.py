@@ -0,0 +1,201 @@
+"""
+
+Download the sources listed in `conandata.yml` files into a content-addressed store.
+
+Every source with a `sha256` is stored as `<store>/s/<sha256>` (the layout of Conan's
+`core.sources:download_cache`), next to a `<sha256>.json` file listing the references
+and URLs it was fetched for. Downloads run concurrently, with a bounded number of
+connections per host. The checksum is computed while the file is being written, and
+files already present in the store are skipped.
+
+Mirrors using the backup sources layout (`<mirror>/<sha256>`), either `http(s)://` or
+`file://`, are tried before the upstream URLs.
+
+    PYTHONPATH=.ci python3 -m cci.prefetch_sources --store /data/sources zlib openssl/3.2.1
+    PYTHONPATH=.ci python3 -m cci.prefetch_sources --store /data/sources --mirror file:///mnt/backup --no-origin
+
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from .recipe_index import RecipeIndex, build as build_index, load_index
+
+
+CHUNK_SIZE = 1 << 20
+
+
+class ChecksumError(Exception):
+    pass
+
+
+class SourceStore:
+    """
+       Content-addressed store of source archives
+    """
+
+    def __init__(self, folder):
+        self.folder = os.path.join(folder, "s")
+        os.makedirs(self.folder, exist_ok=True)
+
+    def path(self, sha256):
+        return os.path.join(self.folder, sha256)
+
+    def __contains__(self, sha256):
+        return os.path.isfile(self.path(sha256))
+
+    def record(self, sha256, references, urls):
+        """ Update the `<sha256>.json` summary with the references using this file """
+        summary_path = f"{self.path(sha256)}.json"
+        summary = {"references": {}}
+        if os.path.isfile(summary_path):
+            with open(summary_path, encoding="utf-8") as f:
+                summary = json.load(f)
+        for reference in references:
+            known = summary["references"].setdefault(reference, [])
+            known.extend(url for url in urls if url not in known)
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+class Downloader:
+    """
+       Stream URLs to the store, with at most `max_per_host` connections to the same host
+    """
+
+    def __init__(self, store, max_per_host=4, timeout=60):
+        self.store = store
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _host_slot(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._hosts[host]
+
+    def fetch(self, url, sha256):
+        """ Download `url` into the store, checking `sha256` while writing """
+        tmp = f"{self.store.path(sha256)}.{threading.get_ident()}.part"
+        sha = hashlib.sha256()
+        try:
+            with self._host_slot(url):
+                with urllib.request.urlopen(url, timeout=self.timeout) as response, open(tmp, "wb") as f:
+                    for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                        sha.update(chunk)
+                        f.write(chunk)
+            if sha.hexdigest() != sha256:
+                raise ChecksumError(f"sha256 mismatch for {url}: expected {sha256}, got {sha.hexdigest()}")
+            os.replace(tmp, self.store.path(sha256))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
+def _is_known(item, index: RecipeIndex):
+    name, _, version = item.partition("/")
+    return name in index and (not version or version in index.versions(name))
+
+
+def collect_sources(index: RecipeIndex, selection=None):
+    """ Return {sha256: {"urls": [...], "references": [...]}} for the selected recipes or references """
+    targets = []
+    for item in selection or index.names():
+        name, _, version = item.partition("/")
+        versions = [version] if version else index.versions(name)
+        targets.extend((name, v) for v in versions)
+
+    sources = {}
+    missing_checksum = []
+    for name, version in targets:
+        for source in index.sources(name, version):
+            if not source["sha256"]:
+                missing_checksum.append(f"{name}/{version}")
+                continue
+            entry = sources.setdefault(source["sha256"].lower(), {"urls": [], "references": []})
+            entry["urls"].extend(url for url in source["url"] if url not in entry["urls"])
+            if f"{name}/{version}" not in entry["references"]:
+                entry["references"].append(f"{name}/{version}")
+    return sources, missing_checksum
+
+
+def prefetch(sources, store, mirrors=(), use_origin=True, jobs=8, max_per_host=4):
+    """ Download every missing source. Returns {"downloaded": [...], "skipped": [...], "failed": {sha256: error}} """
+    downloader = Downloader(store, max_per_host=max_per_host)
+    result = {"downloaded": [], "skipped": [], "failed": {}}
+    lock = threading.Lock()
+
+    def _fetch(sha256, entry):
+        if sha256 in store:
+            outcome, error = "skipped", None
+        else:
+            urls = [f"{mirror.rstrip('/')}/{sha256}" for mirror in mirrors]
+            if use_origin:
+                urls += entry["urls"]
+            outcome, error = "failed", "no URL to download from"
+            for url in urls:
+                try:
+                    downloader.fetch(url, sha256)
+                    outcome, error = "downloaded", None
+                    break
+                except (OSError, ValueError, ChecksumError) as exc:
+                    error = str(exc)
+        with lock:
+            if outcome == "failed":
+                result["failed"][sha256] = error
+            else:
+                result[outcome].append(sha256)
+                store.record(sha256, entry["references"], entry["urls"])
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for future in [executor.submit(_fetch, sha256, entry) for sha256, entry in sources.items()]:
+            future.result()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prefetch and verify the sources of ConanCenterIndex recipes into a local store."
+    )
+    parser.add_argument("references", nargs="*", help="recipe names or name/version references (all if empty).")
+    parser.add_argument("--store", required=True, help="folder of the content-addressed store.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--mirror", action="append", default=[],
+                        help="backup sources mirror (<mirror>/<sha256>) tried before the upstream URLs.")
+    parser.add_argument("--no-origin", action="store_true", help="only download from the mirrors.")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="number of concurrent downloads.")
+    parser.add_argument("--max-per-host", type=int, default=4, help="maximum concurrent connections per host.")
+    args = parser.parse_args()
+
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    unknown = [item for item in args.references if not _is_known(item, index)]
+    if unknown:
+        parser.error(f"unknown recipes or versions: {', '.join(unknown)}")
+
+    sources, missing_checksum = collect_sources(index, args.references)
+    for reference in missing_checksum:
+        print(f"Skipping source without sha256 in {reference}", file=sys.stderr)
+
+    result = prefetch(sources, SourceStore(args.store), mirrors=args.mirror, use_origin=not args.no_origin,
+                      jobs=args.jobs, max_per_host=args.max_per_host)
+    for sha256, error in sorted(result["failed"].items()):
+        print(f"Failed {sha256} ({', '.join(sources[sha256]['references'])}): {error}", file=sys.stderr)
+    print(f"Downloaded: {len(result['downloaded'])}, already present: {len(result['skipped'])}, "
+          f"failed: {len(result['failed'])}")
+    if result["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
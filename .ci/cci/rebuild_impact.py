@@ -0,0 +1,122 @@
+"""
+
+Estimate how many references would need to be rebuilt after changing some recipes.
+
+The changed files (e.g. the `all_changed_files` output of `.github/actions/pr_changed_files`)
+are mapped to recipes, and the static requirement graph gives every recipe depending on
+them, directly or transitively. Each affected recipe folder is expanded to its versions
+with the recipe index, and to build jobs with the configurations of `.c3i/config_v2.yml`.
+
+    PYTHONPATH=.ci python3 -m cci.rebuild_impact recipes/zlib/all/conanfile.py
+    git diff --name-only origin/master | PYTHONPATH=.ci python3 -m cci.rebuild_impact -
+
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+
+import yaml
+
+from .recipe_index import RecipeIndex, build as build_index, load_index
+from .requirements_graph import RequirementsGraph, build as build_graph, load_graph
+
+
+DEFAULT_CONFIG = os.path.join(".c3i", "config_v2.yml")
+
+
+def _expand(content):
+    """ Expand a `content` matrix of config_v2.yml into the list of settings combinations """
+    if isinstance(content, list):
+        return [combination for item in content for combination in _expand(item)]
+    if not isinstance(content, dict):
+        return [{}]
+    axes = []
+    for key, values in content.items():
+        options = []
+        for value in values if isinstance(values, list) else [values]:
+            if isinstance(value, dict):
+                # {"gcc": {compiler.version: [...], ...}} nests more settings under the value
+                for sub_value, sub_content in value.items():
+                    options.extend({key: sub_value, **sub} for sub in _expand(sub_content))
+            else:
+                options.append({key: value})
+        axes.append(options)
+    return [{k: v for part in product for k, v in part.items()} for product in itertools.product(*axes)]
+
+
+def configurations(config_path=DEFAULT_CONFIG):
+    """ Return {configuration id: [settings combinations]} from config_v2.yml """
+    with open(config_path, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    return {configuration["id"]: _expand(configuration.get("content", [])) for configuration in config["configurations"]}
+
+
+def changed_recipes(files):
+    """ Map changed files to the recipe names they belong to """
+    names = set()
+    for path in files:
+        parts = os.path.normpath(path).split(os.sep)
+        if len(parts) >= 3 and parts[0] == "recipes":
+            names.add(parts[1])
+    return names
+
+
+def impact(changed_files, graph: RequirementsGraph, index: RecipeIndex, configs):
+    changed = changed_recipes(changed_files)
+    changed_folders = {key for name in changed for key in graph.folders.get(name, ())}
+    dependents = graph.transitive_dependents(changed) - changed_folders
+
+    references = {}
+    for key in sorted(changed_folders | dependents):
+        name, folder = key.split("/", 1)
+        if name in index:
+            references[key] = [f"{name}/{v}" for v in index.versions(name) if index.folder(name, v) == folder]
+        else:
+            references[key] = []
+    total_references = sum(len(refs) for refs in references.values())
+    return {
+        "changed_recipes": sorted(changed),
+        "changed_folders": sorted(changed_folders),
+        "dependent_folders": sorted(dependents),
+        "references": total_references,
+        "configurations": {config_id: len(combinations) * total_references
+                           for config_id, combinations in configs.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report the recipes and references to rebuild when some recipe files change."
+    )
+    parser.add_argument("files", nargs="*", help="changed files, or '-' to read them from stdin.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--graph", default=None, help="requirements graph file (extracted on the fly if not given).")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--config", default=DEFAULT_CONFIG, help="c3i configuration file.")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON.")
+    args = parser.parse_args()
+
+    files = []
+    for item in args.files:
+        files.extend(sys.stdin.read().split() if item == "-" else [item])
+
+    graph = RequirementsGraph(load_graph(args.graph) if args.graph else build_graph(args.recipes))
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    report = impact(files, graph, index, configurations(args.config))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Changed recipes: {', '.join(report['changed_recipes']) or '-'}")
+    print(f"Dependent recipe folders: {len(report['dependent_folders'])}")
+    print(f"References to rebuild: {report['references']}")
+    for config_id, jobs in report["configurations"].items():
+        print(f" * {config_id}: {jobs} builds")
+
+
+if __name__ == "__main__":
+    main()
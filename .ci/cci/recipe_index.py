@@ -0,0 +1,270 @@
+"""
+
+Index of the recipes metadata built from every `config.yml` and `conandata.yml`.
+
+For each recipe it stores the versions, the folder holding each version, the
+sources (URLs and sha256) and the patches. The index is written as a single JSON
+file and is rebuilt incrementally: YAML files whose size and mtime (or content
+hash) did not change are not parsed again.
+
+    PYTHONPATH=.ci python3 -m cci.recipe_index build --output recipe_index.json
+    PYTHONPATH=.ci python3 -m cci.recipe_index query --index recipe_index.json zlib 1.3.1
+
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import yaml
+
+
+INDEX_FORMAT = 1
+DEFAULT_INDEX = "recipe_index.json"
+
+# All scalars are loaded as strings, like strictyaml, so versions such as 1.10 are kept
+_Loader = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+
+
+def _load_yaml(path):
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_Loader) or {}
+
+
+def _sha256(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def normalize_sources(data, key=""):
+    """ Flatten the different layouts of a `sources` entry into a list of {key, url, sha256}.
+
+    `key` identifies nested entries, e.g. "Linux/x86_64" for per-platform sources
+    or "0" for lists of sources
+    """
+    if isinstance(data, list):
+        result = []
+        for i, item in enumerate(data):
+            result.extend(normalize_sources(item, f"{key}/{i}" if key else str(i)))
+        return result
+    if not isinstance(data, dict):
+        return []
+    if "url" in data:
+        return [{"key": key, "url": _as_list(data["url"]), "sha256": data.get("sha256")}]
+    result = []
+    for name, item in data.items():
+        result.extend(normalize_sources(item, f"{key}/{name}" if key else name))
+    return result
+
+
+def _mapping(data, key, path):
+    """ Return `data[key]`, an empty mapping if missing, raise ValueError if it is not a mapping """
+    value = data.get(key) or {}
+    if not isinstance(value, dict):
+        raise ValueError(f"`{key}` of {path} is not a mapping")
+    return value
+
+
+def _parse_recipe(config, conandatas):
+    """ Build the index entry of a recipe from its parsed config.yml and conandata.yml files """
+    versions = {}
+    for version, info in _mapping(config, "versions", "config.yml").items():
+        folder = info.get("folder") if isinstance(info, dict) else None
+        conandata = conandatas.get(folder) or {}
+        path = f"{folder}/conandata.yml"
+        if not isinstance(conandata, dict):
+            raise ValueError(f"{path} is not a mapping")
+        sources = _mapping(conandata, "sources", path).get(version)
+        patches = _mapping(conandata, "patches", path).get(version)
+        versions[version] = {
+            "folder": folder,
+            "sources": normalize_sources(sources),
+            "patches": [patch for patch in _as_list(patches) if isinstance(patch, dict)],
+        }
+    return {"versions": versions}
+
+
+class _FileStamp:
+    """ Detect changes of a file by size/mtime first, and content hash second """
+
+    def __init__(self, previous):
+        self.previous = previous or {}
+
+    def stamp(self, path):
+        stat = os.stat(path)
+        old = self.previous.get(path)
+        if old and old["size"] == stat.st_size and old["mtime"] == stat.st_mtime_ns:
+            return old
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": _sha256(path)}
+
+    def changed(self, path, stamp):
+        old = self.previous.get(path)
+        return old is None or old["sha256"] != stamp["sha256"]
+
+
+def build(recipes_folder, previous=None):
+    """ Build the index of all the recipes, reusing the entries of `previous` for unchanged recipes """
+    previous = previous if previous and previous.get("format") == INDEX_FORMAT else {}
+    stamps = _FileStamp(previous.get("files"))
+    old_recipes = previous.get("recipes", {})
+    files = {}
+    recipes = {}
+    errors = {}
+
+    for name in sorted(os.listdir(recipes_folder)):
+        recipe_folder = os.path.join(recipes_folder, name)
+        config_path = os.path.join(recipe_folder, "config.yml")
+        if not os.path.isfile(config_path):
+            continue
+        conandata_paths = {}
+        for folder in sorted(os.listdir(recipe_folder)):
+            conandata_path = os.path.join(recipe_folder, folder, "conandata.yml")
+            if os.path.isfile(conandata_path):
+                conandata_paths[folder] = conandata_path
+
+        recipe_files = {path: stamps.stamp(path) for path in [config_path] + list(conandata_paths.values())}
+        files.update(recipe_files)
+        unchanged = name in old_recipes and \
+            set(old_recipes[name]["files"]) == set(recipe_files) and \
+            not any(stamps.changed(path, stamp) for path, stamp in recipe_files.items())
+        if unchanged:
+            recipes[name] = old_recipes[name]
+            continue
+
+        try:
+            config = _load_yaml(config_path)
+            conandatas = {folder: _load_yaml(path) for folder, path in conandata_paths.items()}
+            if not isinstance(config, dict):
+                raise ValueError("config.yml is not a mapping")
+            recipe = _parse_recipe(config, conandatas)
+        except (OSError, ValueError, yaml.YAMLError) as error:
+            errors[name] = str(error)
+            continue
+        recipe["files"] = sorted(recipe_files)
+        recipes[name] = recipe
+
+    return {"format": INDEX_FORMAT, "files": files, "recipes": recipes, "errors": errors}
+
+
+def load_index(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_index(index, path):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp, path)
+
+
+class UnknownReference(LookupError):
+    """ The recipe or the version is not in the index """
+
+
+class RecipeIndex:
+    """
+       Query API over a built index, all lookups are dictionary accesses
+    """
+
+    def __init__(self, index):
+        if index.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Unsupported recipe index format: {index.get('format')}")
+        self._recipes = index["recipes"]
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX):
+        return cls(load_index(path))
+
+    def names(self):
+        return list(self._recipes)
+
+    def references(self):
+        return [f"{name}/{version}" for name, recipe in self._recipes.items() for version in recipe["versions"]]
+
+    def __contains__(self, name):
+        return name in self._recipes
+
+    def _recipe(self, name):
+        if name not in self._recipes:
+            raise UnknownReference(f"Recipe `{name}` not found in the index")
+        return self._recipes[name]
+
+    def versions(self, name):
+        return list(self._recipe(name)["versions"])
+
+    def version(self, name, version):
+        versions = self._recipe(name)["versions"]
+        if version not in versions:
+            raise UnknownReference(f"Version `{version}` of recipe `{name}` not found in the index")
+        return versions[version]
+
+    def folder(self, name, version):
+        return self.version(name, version)["folder"]
+
+    def sources(self, name, version):
+        return self.version(name, version)["sources"]
+
+    def patches(self, name, version):
+        return self.version(name, version)["patches"]
+
+    def recipe_folder(self, name, version):
+        """ Path of the folder holding the recipe of this version, relative to the recipes folder """
+        return f"{name}/{self.folder(name, version)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query the index of ConanCenterIndex recipes metadata."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="(re)build the index incrementally.")
+    build_parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    build_parser.add_argument("--output", default=DEFAULT_INDEX, help="index file to write.")
+    build_parser.add_argument("--full", action="store_true", help="ignore the existing index and parse every file.")
+
+    query_parser = subparsers.add_parser("query", help="print the metadata of a recipe.")
+    query_parser.add_argument("--index", default=DEFAULT_INDEX, help="index file to read.")
+    query_parser.add_argument("name", help="recipe name.")
+    query_parser.add_argument("version", nargs="?", help="recipe version.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        previous = None
+        if not args.full and os.path.isfile(args.output):
+            try:
+                previous = load_index(args.output)
+            except ValueError:
+                previous = None
+        index = build(args.recipes, previous)
+        save_index(index, args.output)
+        for name, error in index["errors"].items():
+            print(f"::warning title=recipe index::Could not index recipe `{name}`: {error}", file=sys.stderr)
+        return
+
+    index = RecipeIndex.load(args.index)
+    try:
+        if args.version:
+            print(json.dumps(index.version(args.name, args.version), indent=2))
+        else:
+            for version in index.versions(args.name):
+                print(f"{args.name}/{version}: {index.folder(args.name, version)}")
+    except UnknownReference as error:
+        print(f"{error} ({args.index})", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
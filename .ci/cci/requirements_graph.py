@@ -0,0 +1,289 @@
+"""
+
+Static extraction of the requirement graph of all the recipes.
+
+Each `recipes/<name>/<folder>/conanfile.py` is parsed with Python's `ast` module
+(recipes are never executed). The `requires`, `tool_requires`, `build_requires`
+and `test_requires` declared as class attributes or called in `requirements()` and
+`build_requirements()` are recorded, together with the `if` conditions guarding them.
+
+The graph is written as JSON, with one node per recipe folder:
+
+    {"format": 1, "nodes": {"openssl/3.x.x": {"name": "openssl", "requires": [
+        {"name": "zlib", "ref": "zlib/[>=1.2.11 <2]", "context": "host", "guards": ["not self.options.no_zlib"]}
+    ]}}}
+
+    PYTHONPATH=.ci python3 -m cci.requirements_graph build --output requirements_graph.json
+    PYTHONPATH=.ci python3 -m cci.requirements_graph dependents --graph requirements_graph.json openssl
+
+"""
+
+import argparse
+import ast
+import glob
+import heapq
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+GRAPH_FORMAT = 1
+DEFAULT_GRAPH = "requirements_graph.json"
+
+REQUIRE_METHODS = {
+    "requires": "host",
+    "tool_requires": "build",
+    "build_requires": "build",
+    "test_requires": "test",
+}
+REQUIREMENTS_FUNCTIONS = ("requirements", "build_requirements")
+
+
+def _reference_name(node, source):
+    """ Return (name, ref) for the first argument of a requirement: a literal or an f-string """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value.split("/", 1)[0], node.value
+    if isinstance(node, ast.JoinedStr) and node.values and isinstance(node.values[0], ast.Constant):
+        prefix = str(node.values[0].value)
+        name = prefix.split("/", 1)[0] if "/" in prefix else None
+        return name, ast.get_source_segment(source, node)
+    return None, ast.get_source_segment(source, node)
+
+
+class _RequirementsVisitor:
+    """ Collect the requirement calls of a method, tracking the `if` conditions around them """
+
+    def __init__(self, source):
+        self.source = source
+        self.requires = []
+
+    def _segment(self, node):
+        return ast.get_source_segment(self.source, node)
+
+    def visit_body(self, statements, guards):
+        for statement in statements:
+            self.visit(statement, guards)
+
+    def visit(self, node, guards):
+        if isinstance(node, ast.If):
+            test = self._segment(node.test)
+            self.visit_body(node.body, guards + [test])
+            self.visit_body(node.orelse, guards + [f"not ({test})"])
+        elif isinstance(node, (ast.For, ast.While)):
+            self.visit_body(node.body, guards)
+            self.visit_body(node.orelse, guards)
+        elif isinstance(node, (ast.With, ast.Try)):
+            for field in ("body", "orelse", "finalbody"):
+                self.visit_body(getattr(node, field, []), guards)
+            for handler in getattr(node, "handlers", []):
+                self.visit_body(handler.body, guards)
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            self.visit_call(node.value, guards)
+
+    def visit_call(self, call, guards):
+        func = call.func
+        if not (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "self"):
+            return
+        context = REQUIRE_METHODS.get(func.attr)
+        if context is None or not call.args:
+            return
+        name, ref = _reference_name(call.args[0], self.source)
+        for keyword in call.keywords:
+            if keyword.arg == "build" and isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
+                context = "build"
+        self.requires.append({"name": name, "ref": ref, "context": context, "guards": guards})
+
+
+def _class_attribute_requires(classdef, source):
+    requires = []
+    for statement in classdef.body:
+        if not (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)):
+            continue
+        context = REQUIRE_METHODS.get(statement.targets[0].id)
+        if context is None:
+            continue
+        values = statement.value.elts if isinstance(statement.value, (ast.Tuple, ast.List)) else [statement.value]
+        for value in values:
+            name, ref = _reference_name(value, source)
+            requires.append({"name": name, "ref": ref, "context": context, "guards": []})
+    return requires
+
+
+def _is_conanfile(classdef):
+    return any((isinstance(base, ast.Name) and base.id == "ConanFile") or
+               (isinstance(base, ast.Attribute) and base.attr == "ConanFile") for base in classdef.bases)
+
+
+def extract(path):
+    """ Return the node of the graph for a single conanfile.py """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, filename=path)
+
+    name = None
+    requires = []
+    for classdef in tree.body:
+        if not (isinstance(classdef, ast.ClassDef) and _is_conanfile(classdef)):
+            continue
+        requires.extend(_class_attribute_requires(classdef, source))
+        for statement in classdef.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and \
+               isinstance(statement.targets[0], ast.Name) and statement.targets[0].id == "name" and \
+               isinstance(statement.value, ast.Constant):
+                name = statement.value.value
+            elif isinstance(statement, ast.FunctionDef) and statement.name in REQUIREMENTS_FUNCTIONS:
+                visitor = _RequirementsVisitor(source)
+                visitor.visit_body(statement.body, [])
+                requires.extend(visitor.requires)
+    return {"name": name, "requires": requires}
+
+
+def _extract_safe(path):
+    try:
+        return path, extract(path), None
+    except (OSError, SyntaxError, ValueError) as error:
+        return path, None, str(error)
+
+
+def build(recipes_folder, jobs=None):
+    """ Extract the graph of every recipe folder under `recipes_folder` """
+    paths = sorted(glob.glob(os.path.join(recipes_folder, "*", "*", "conanfile.py")))
+    nodes = {}
+    errors = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for path, node, error in executor.map(_extract_safe, paths, chunksize=32):
+            recipe_name, folder = os.path.normpath(path).split(os.sep)[-3:-1]
+            key = f"{recipe_name}/{folder}"
+            if error is not None:
+                errors[key] = error
+                continue
+            node["name"] = node["name"] or recipe_name
+            nodes[key] = node
+    return {"format": GRAPH_FORMAT, "nodes": nodes, "errors": errors}
+
+
+def load_graph(path):
+    with open(path, encoding="utf-8") as f:
+        graph = json.load(f)
+    if graph.get("format") != GRAPH_FORMAT:
+        raise ValueError(f"Unsupported requirements graph format: {graph.get('format')}")
+    return graph
+
+
+def save_graph(graph, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(graph, f, separators=(",", ":"), sort_keys=True)
+
+
+class RequirementsGraph:
+    """
+       Queries over the extracted graph. Edges point from a recipe folder to required recipe names
+    """
+
+    def __init__(self, graph, contexts=("host", "build")):
+        self.nodes = graph["nodes"]
+        self.folders = {}      # recipe name -> [recipe folder keys]
+        self.dependencies = {}  # recipe folder key -> {required recipe names}
+        self.dependents = {}    # recipe name -> {recipe folder keys requiring it}
+        for key, node in self.nodes.items():
+            self.folders.setdefault(node["name"], []).append(key)
+            deps = {req["name"] for req in node["requires"] if req["name"] and req["context"] in contexts}
+            deps.discard(node["name"])
+            self.dependencies[key] = deps
+            for dep in deps:
+                self.dependents.setdefault(dep, set()).add(key)
+
+    @classmethod
+    def load(cls, path=DEFAULT_GRAPH, **kwargs):
+        return cls(load_graph(path), **kwargs)
+
+    def direct_dependents(self, name):
+        return set(self.dependents.get(name, ()))
+
+    def transitive_dependents(self, names):
+        """ Recipe folders depending, directly or not, on any of the recipe `names` """
+        result = set()
+        pending = list(names)
+        visited = set(pending)
+        while pending:
+            for key in self.dependents.get(pending.pop(), ()):
+                if key in result:
+                    continue
+                result.add(key)
+                name = self.nodes[key]["name"]
+                if name not in visited:
+                    visited.add(name)
+                    pending.append(name)
+        return result
+
+    def topological_order(self, keys=None):
+        """ Order recipe folders so dependencies come first. Cycles are appended at the end """
+        keys = set(self.nodes if keys is None else keys)
+        names = {self.nodes[key]["name"] for key in keys}
+        pending = {key: {dep for dep in self.dependencies[key] if dep in names} for key in keys}
+        remaining_by_name = {}
+        for key in keys:
+            name = self.nodes[key]["name"]
+            remaining_by_name[name] = remaining_by_name.get(name, 0) + 1
+
+        order = []
+        ready = [key for key, deps in pending.items() if not deps]
+        heapq.heapify(ready)
+        while ready:
+            key = heapq.heappop(ready)
+            order.append(key)
+            del pending[key]
+            name = self.nodes[key]["name"]
+            remaining_by_name[name] -= 1
+            if remaining_by_name[name]:
+                continue
+            # All the folders of this recipe are done, unblock its dependents
+            for other in self.dependents.get(name, ()):
+                if other in pending and name in pending[other]:
+                    pending[other].discard(name)
+                    if not pending[other]:
+                        heapq.heappush(ready, other)
+        return order + sorted(pending)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract and query the static requirement graph of ConanCenterIndex recipes."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="extract the graph from all the recipes.")
+    build_parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    build_parser.add_argument("--output", default=DEFAULT_GRAPH, help="graph file to write.")
+    build_parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes.")
+
+    dependents_parser = subparsers.add_parser("dependents", help="list the recipes depending on a recipe.")
+    dependents_parser.add_argument("--graph", default=DEFAULT_GRAPH, help="graph file to read.")
+    dependents_parser.add_argument("--direct", action="store_true", help="only list direct dependents.")
+    dependents_parser.add_argument("name", help="recipe name.")
+
+    order_parser = subparsers.add_parser("order", help="print the recipe folders in build order.")
+    order_parser.add_argument("--graph", default=DEFAULT_GRAPH, help="graph file to read.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        graph = build(args.recipes, jobs=args.jobs)
+        save_graph(graph, args.output)
+        for key, error in graph["errors"].items():
+            print(f"::warning title=requirements graph::Could not parse recipe `{key}`: {error}", file=sys.stderr)
+        return
+
+    graph = RequirementsGraph.load(args.graph)
+    if args.command == "dependents":
+        keys = graph.direct_dependents(args.name) if args.direct else graph.transitive_dependents([args.name])
+        for key in sorted(keys):
+            print(key)
+    elif args.command == "order":
+        for key in graph.topological_order():
+            print(key)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+
+Update `.c3i/conan_v2_ready_references.yml` from recorded Conan v2 build results, without
+listing the packages of the remote.
+
+Build results are JSON (a list, or one object per line) with a `reference` and a `status`:
+
+    {"reference": "zlib/1.3.1", "status": "success", "conan_version": "2.0.17",
+     "timestamp": "2024-01-20T10:00:00Z"}
+
+The latest result of every reference wins (by `timestamp` if present, otherwise the order
+of the files). A recipe is ready as soon as one of its versions in `config.yml` builds
+with Conan v2, the same as having one of its packages in the v2 remote. Recipes already
+listed are kept, a later failure is a regression that the pipeline must report, and only
+recipes removed from the repository are dropped. The list is sorted so the diff of every
+update only shows the added and removed recipes.
+
+    PYTHONPATH=.ci python3 -m cci.v2_ready_references v2-results.jsonl
+    PYTHONPATH=.ci python3 -m cci.v2_ready_references v2-results.jsonl --check
+
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import yaml
+
+from .recipe_index import RecipeIndex, build as build_index, load_index
+
+
+DEFAULT_LIST = os.path.join(".c3i", "conan_v2_ready_references.yml")
+LIST_KEY = "required_for_references"
+SUCCESS = ("success", "ok", "passed")
+
+
+def load_results(paths):
+    """ Return {reference: status} with the latest Conan v2 result of every reference """
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            content = f.read().strip()
+        if not content:
+            continue
+        if content.startswith("["):
+            records.extend(json.loads(content))
+        else:
+            records.extend(json.loads(line) for line in content.splitlines() if line.strip())
+
+    records = [record for record in records if record.get("reference") and record.get("status")
+               and str(record.get("conan_version", "2")).startswith("2")]
+    # sorted() is stable, results without timestamp keep the order of the files
+    records.sort(key=lambda record: str(record.get("timestamp", "")))
+    return {record["reference"].split("@", 1)[0].split("#", 1)[0]: str(record["status"]).lower()
+            for record in records}
+
+
+def ready_recipes(results, index: RecipeIndex):
+    """ Names of the recipes with at least one version of config.yml building with Conan v2 """
+    ready = set()
+    for reference, status in results.items():
+        name, _, version = reference.partition("/")
+        if status in SUCCESS and name in index and version in index.versions(name):
+            ready.add(name)
+    return ready
+
+
+def update(current, ready, index: RecipeIndex):
+    """ Return (new list, added, removed) """
+    removed = sorted(name for name in current if name not in index)
+    added = sorted(ready - set(current))
+    return sorted((set(current) | ready) - set(removed)), added, removed
+
+
+def load_list(path):
+    if not os.path.isfile(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return data.get(LIST_KEY) or []
+
+
+def save_list(names, path):
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump({LIST_KEY: names}, f, default_flow_style=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Update the list of recipes required to build with Conan v2 from recorded build results."
+    )
+    parser.add_argument("results", nargs="+", help="JSON files with the Conan v2 build results.")
+    parser.add_argument("--recipes", default="recipes", help="recipes folder.")
+    parser.add_argument("--index", default=None, help="recipe index file (built on the fly if not given).")
+    parser.add_argument("--list", default=DEFAULT_LIST, help="YAML file with the list of ready recipes.")
+    parser.add_argument("--check", action="store_true", help="do not write the list, fail if it is not up to date.")
+    args = parser.parse_args()
+
+    index = RecipeIndex(load_index(args.index) if args.index else build_index(args.recipes))
+    current = load_list(args.list)
+    names, added, removed = update(current, ready_recipes(load_results(args.results), index), index)
+
+    for name in added:
+        print(f"+ {name}")
+    for name in removed:
+        print(f"- {name}")
+    if names == current:
+        print(f"{args.list} is up to date ({len(names)} recipes)")
+        return
+    if args.check:
+        print(f"{args.list} is not up to date: {len(added)} recipes to add, {len(removed)} to remove",
+              file=sys.stderr)
+        sys.exit(1)
+    save_list(names, args.list)
+    print(f"Updated {args.list}: {len(names)} recipes ({len(added)} added, {len(removed)} removed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+
+Filter the files changed in a pull request (or in a local branch) with glob patterns.
+
+Patterns are matched segment by segment, like `fnmatch` over the path parts: `*` never
+crosses a `/` and a pattern only matches paths with the same number of parts, so
+`recipes/*/*/conanfile.py` matches `recipes/zlib/all/conanfile.py` only. All the patterns
+are compiled once into a single regular expression per number of parts.
+
+    # In GitHub Actions, from the pull request files
+    python3 pr_changed_files.py --github-pr 1234 --repository conan-io/conan-center-index --patterns "recipes/*/*/conanfile.py"
+
+    # Locally, from git
+    python3 pr_changed_files.py --git-diff origin/master --patterns "recipes/*/*/conanfile.py"
+
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import PurePosixPath
+
+
+def _translate_segment(segment):
+    """ Translate a fnmatch pattern of a single path part into a regex that never matches '/' """
+    i, n = 0, len(segment)
+    result = []
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                result.append("\\[")
+            else:
+                chars = segment[i:j].replace("\\", "\\\\")
+                i = j + 1
+                if chars.startswith("!"):
+                    chars = "^" + chars[1:]
+                elif chars.startswith("^"):
+                    chars = "\\" + chars
+                result.append(f"(?!/)[{chars}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+class PatternMatcher:
+    """
+       Match paths against many glob patterns at once
+    """
+
+    def __init__(self, patterns):
+        by_length = {}
+        for pattern in patterns:
+            parts = PurePosixPath(pattern.strip()).parts
+            if parts:
+                by_length.setdefault(len(parts), []).append("/".join(_translate_segment(p) for p in parts))
+        self.match_all = not by_length
+        self._regexes = {length: re.compile("|".join(f"(?:{regex})" for regex in regexes))
+                         for length, regexes in by_length.items()}
+
+    def matches(self, filename):
+        if self.match_all:
+            return True
+        parts = [part for part in filename.split("/") if part not in ("", ".")]
+        regex = self._regexes.get(len(parts))
+        return regex is not None and regex.fullmatch("/".join(parts)) is not None
+
+    def filter(self, filenames):
+        return [filename for filename in filenames if self.matches(filename)]
+
+
+def github_pr_files(repository, pr_number):
+    """ Files added, modified, copied or renamed in a pull request, using the GitHub CLI """
+    res = subprocess.run(["gh", "api", f"/repos/{repository}/pulls/{pr_number}/files", "--paginate"],
+                         capture_output=True, check=True)
+    return [f["filename"] for f in json.loads(res.stdout) if f["status"] != "removed"]
+
+
+def git_diff_files(base, head="HEAD"):
+    """ Files changed (and not deleted) between the merge base of `base` and `head` """
+    res = subprocess.run(["git", "diff", "--name-only", "--diff-filter=d", f"{base}...{head}"],
+                         capture_output=True, check=True, text=True)
+    return res.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Get the changed files matching some glob patterns."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--github-pr", help="pull request number, files are listed with the GitHub API.")
+    source.add_argument("--git-diff", metavar="BASE", help="list the files changed since BASE with git.")
+    source.add_argument("--stdin", action="store_true", help="read the changed files from stdin.")
+    parser.add_argument("--repository", default=os.getenv("GITHUB_REPOSITORY"),
+                        help="GitHub repository (owner/name) of the pull request.")
+    parser.add_argument("--patterns", default="",
+                        help="newline separated glob patterns (all files match if empty).")
+    parser.add_argument("--github-output", action="store_true",
+                        help="write `any_changed` and `all_changed_files` to $GITHUB_OUTPUT.")
+    args = parser.parse_args()
+
+    if args.github_pr:
+        files = github_pr_files(args.repository, args.github_pr)
+    elif args.git_diff:
+        files = git_diff_files(args.git_diff)
+    else:
+        files = sys.stdin.read().split()
+
+    files = PatternMatcher(args.patterns.splitlines()).filter(files)
+
+    if args.github_output:
+        with open(os.getenv("GITHUB_OUTPUT"), "a") as output_file:
+            output_file.write(f"any_changed={'true' if files else 'false'}\n")
+            output_file.write(f"all_changed_files={' '.join(files)}\n")
+    else:
+        for filename in files:
+            print(filename)
+
+
+if __name__ == "__main__":
+    main()
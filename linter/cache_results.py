@@ -0,0 +1,174 @@
+"""
+
+Pylint plugin that caches the messages produced for every recipe on disk.
+
+The cache is opt-in, enabled with `CCI_LINTER_CACHE=1` (it is not used in CI).
+
+The cache key is built from the file content, the sources of the CCI plugins, the
+versions of pylint, astroid and Conan and the effective pylint configuration
+(pylintrc plus command line). Unchanged files replay their stored messages without
+being parsed by astroid.
+
+Messages computed across several modules (duplicate-code, cyclic-import) can't be
+replayed from a single file, so the cache is not used while any of them is enabled.
+Both are disabled in the pylintrc files of the repository.
+
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import astroid
+import pylint
+from pylint.constants import MSG_TYPES, MSG_TYPES_STATUS
+from pylint.interfaces import CONFIDENCE_LEVELS, UNDEFINED
+from pylint.lint import PyLinter
+from pylint.message import Message
+from pylint.typing import MessageLocationTuple
+
+
+CACHE_FORMAT = "1"
+CROSS_MODULE_MESSAGES = ("duplicate-code", "cyclic-import")
+CACHE_DIR = os.getenv("CCI_LINTER_CACHE_DIR", os.path.join(Path.home(), ".cache", "conan-center-index", "linter"))
+
+
+def _conan_version():
+    # The Conan modules are inferred through the stubs and transforms
+    try:
+        import conans
+    except ImportError:
+        return "none"
+    return conans.__version__
+
+
+def _plugins_version():
+    sha = hashlib.sha256()
+    for plugin in sorted(Path(__file__).parent.glob("*.py")):
+        sha.update(plugin.name.encode())
+        sha.update(plugin.read_bytes())
+    return sha.hexdigest()
+
+
+class ResultCache:
+    """ Messages stored on disk, keyed by a hash of the file content """
+
+    def __init__(self, folder, salt):
+        self.folder = folder
+        self.salt = salt
+
+    def key(self, filepath):
+        sha = hashlib.sha256(self.salt.encode())
+        with open(filepath, "rb") as f:
+            sha.update(f.read())
+        return sha.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.folder, key[:2], f"{key}.json")
+
+    def load(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, key, messages):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(messages, f)
+        os.replace(tmp, path)
+
+
+def _serialize(message: Message):
+    return {
+        "msg_id": message.msg_id,
+        "symbol": message.symbol,
+        "msg": message.msg,
+        "confidence": message.confidence.name,
+        "module": message.module,
+        "obj": message.obj,
+        "line": message.line,
+        "column": message.column,
+        "end_line": message.end_line,
+        "end_column": message.end_column,
+    }
+
+
+def _replay(linter: PyLinter, filepath, messages):
+    """ Report the stored messages as if they were emitted by the checkers """
+    abspath = os.path.abspath(filepath)
+    path = abspath.replace(linter.reporter.path_strip_prefix, "", 1)
+    confidences = {level.name: level for level in CONFIDENCE_LEVELS}
+    for item in messages:
+        msg_cat = MSG_TYPES[item["msg_id"][0]]
+        linter.msg_status |= MSG_TYPES_STATUS[item["msg_id"][0]]
+        linter.stats.increase_single_message_count(msg_cat, 1)
+        linter.stats.increase_single_module_message_count(linter.current_name, msg_cat, 1)
+        linter.stats.by_msg[item["symbol"]] = linter.stats.by_msg.get(item["symbol"], 0) + 1
+        location = MessageLocationTuple(abspath, path, item["module"], item["obj"], item["line"],
+                                        item["column"], item["end_line"], item["end_column"])
+        linter.reporter.handle_message(
+            Message(item["msg_id"], item["symbol"], location, item["msg"],
+                    confidences.get(item["confidence"], UNDEFINED))
+        )
+
+
+def register(linter: PyLinter) -> None:
+    if not os.getenv("CCI_LINTER_CACHE") or os.getenv("CCI_LINTER_NO_CACHE"):
+        return
+
+    check_file = linter._check_file
+    state = {}
+
+    def _cache():
+        # The configuration is only complete once pylint starts checking files
+        if "cache" not in state:
+            if any(linter.is_message_enabled(symbol) for symbol in CROSS_MODULE_MESSAGES):
+                state["cache"] = None
+            else:
+                config = repr(sorted((k, repr(v)) for k, v in vars(linter.config).items()))
+                salt = "|".join([CACHE_FORMAT, pylint.__version__, astroid.__version__, _conan_version(),
+                                 _plugins_version(), config])
+                state["cache"] = ResultCache(CACHE_DIR, salt)
+        return state["cache"]
+
+    def _check_file_cached(get_ast, check_astroid_module, file):
+        cache = _cache()
+        if cache is None:
+            return check_file(get_ast, check_astroid_module, file)
+        try:
+            key = cache.key(file.filepath)
+        except OSError:
+            return check_file(get_ast, check_astroid_module, file)
+
+        messages = cache.load(key)
+        if messages is not None:
+            linter.set_current_module(file.name, file.filepath)
+            _replay(linter, file.filepath, messages)
+            return None
+
+        collected = []
+        reporter = linter.reporter
+        handle_message = reporter.handle_message
+
+        def _collect(message):
+            collected.append(message)
+            handle_message(message)
+
+        reporter.handle_message = _collect
+        try:
+            check_file(get_ast, check_astroid_module, file)
+        finally:
+            reporter.handle_message = handle_message
+
+        # Only cache the file if every message belongs to it
+        abspath = os.path.abspath(file.filepath)
+        if all(os.path.abspath(message.abspath) == abspath for message in collected):
+            cache.save(key, [_serialize(message) for message in collected])
+        return None
+
+    linter._check_file = _check_file_cached
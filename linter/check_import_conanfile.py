@@ -1,16 +1,12 @@
 
-from pylint.checkers import BaseChecker
-from pylint.interfaces import IAstroidChecker
-from astroid import nodes, Const, AssignName
+from linter.checker_core import CCIRule, ImportFromIndex
 
 
-class ImportConanFile(BaseChecker):
+class ImportConanFile(CCIRule):
     """
        Import ConanFile from new 'conan' module
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-import-conanfile"
     msgs = {
         "E9006": (
@@ -19,10 +15,8 @@ class ImportConanFile(BaseChecker):
             "Import ConanFile from new module: `from conan import ConanFile`. Old import is deprecated in Conan v2.",
         ),
     }
+    modnames = ('conans',)
 
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        basename = node.modname
-        if basename == 'conans':
-            names = [name for name, _ in node.names]
-            if 'ConanFile' in names:
-                self.add_message("conan-import-conanfile", node=node)
+    def visit_importfrom(self, index: ImportFromIndex) -> None:
+        if 'ConanFile' in index.names:
+            self.add_message("conan-import-conanfile", node=index.node)
@@ -1,16 +1,12 @@
 
-from pylint.checkers import BaseChecker
-from pylint.interfaces import IAstroidChecker
-from astroid import nodes, Const, AssignName
+from linter.checker_core import CCIRule, ImportFromIndex
 
 
-class ImportErrors(BaseChecker):
+class ImportErrors(CCIRule):
     """
        Import errors from new 'conan' module
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-import-errors"
     msgs = {
         "E9008": (
@@ -19,22 +15,18 @@ class ImportErrors(BaseChecker):
             "Import errors from new module: `from conan import errors`. Old import is deprecated in Conan v2.",
         ),
     }
+    modnames = ('conans',)
 
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        basename = node.modname
-        if basename == 'conans':
-            names = [name for name, _ in node.names]
-            if 'errors' in names:
-                self.add_message("conan-import-errors", node=node)
+    def visit_importfrom(self, index: ImportFromIndex) -> None:
+        if 'errors' in index.names:
+            self.add_message("conan-import-errors", node=index.node)
 
 
-class ImportErrorsConanException(BaseChecker):
+class ImportErrorsConanException(CCIRule):
     """
        Import errors from new 'conan' module
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-import-error-conanexception"
     msgs = {
         "E9009": (
@@ -43,22 +35,18 @@ class ImportErrorsConanException(BaseChecker):
             "Import ConanException from new module: `from conan.errors import ConanException`. Old import is deprecated in Conan v2.",
         ),
     }
+    modnames = ('conans.errors',)
 
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        basename = node.modname
-        if basename == 'conans.errors':
-            names = [name for name, _ in node.names]
-            if 'ConanException' in names:
-                self.add_message("conan-import-error-conanexception", node=node)
+    def visit_importfrom(self, index: ImportFromIndex) -> None:
+        if 'ConanException' in index.names:
+            self.add_message("conan-import-error-conanexception", node=index.node)
 
 
-class ImportErrorsConanInvalidConfiguration(BaseChecker):
+class ImportErrorsConanInvalidConfiguration(CCIRule):
     """
        Import errors from new 'conan' module
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-import-error-conaninvalidconfiguration"
     msgs = {
         "E9010": (
@@ -67,11 +55,9 @@ class ImportErrorsConanInvalidConfiguration(BaseChecker):
             "Import ConanInvalidConfiguration from new module: `from conan.errors import ConanInvalidConfiguration`. Old import is deprecated in Conan v2.",
         ),
     }
+    modnames = ('conans.errors',)
 
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        basename = node.modname
-        if basename == 'conans.errors':
-            names = [name for name, _ in node.names]
-            if 'ConanInvalidConfiguration' in names:
-                self.add_message("conan-import-error-conaninvalidconfiguration", node=node)
+    def visit_importfrom(self, index: ImportFromIndex) -> None:
+        if 'ConanInvalidConfiguration' in index.names:
+            self.add_message("conan-import-error-conaninvalidconfiguration", node=index.node)
 
@@ -1,17 +1,12 @@
 import re
-from email.mime import base
-from pylint.checkers import BaseChecker
-from pylint.interfaces import IAstroidChecker
-from astroid import nodes, Const, AssignName
+from linter.checker_core import CCIRule, ImportFromIndex
 
 
-class ImportTools(BaseChecker):
+class ImportTools(CCIRule):
     """
        Import tools following pattern 'from conan.tools.xxxx import yyyyy'
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-import-tools"
     msgs = {
         "E9011": (
@@ -21,10 +16,9 @@ class ImportTools(BaseChecker):
         ),
     }
 
-    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
-        basename = node.modname
-        names = [name for name, _ in node.names]
-        if basename == 'conan' and 'tools' in names:
-            self.add_message("conan-import-tools", node=node)
+    def visit_importfrom(self, index: ImportFromIndex) -> None:
+        basename = index.modname
+        if basename == 'conan' and 'tools' in index.names:
+            self.add_message("conan-import-tools", node=index.node)
         elif re.match(r'conan\.tools\.[^.]+\..+', basename):
-            self.add_message("conan-import-tools", node=node)
+            self.add_message("conan-import-tools", node=index.node)
@@ -1,19 +1,16 @@
-from pylint.checkers import BaseChecker
-from pylint.interfaces import IAstroidChecker
 from astroid import nodes
+from linter.checker_core import CCIRule
 
 WHY_SRC_FOLDER = "Setting the `src_folder` for layouts will help keep an organized and clean workspace when developing recipes locally. " \
                  "The extra folder will help ensure there are no collisions between the upstream sources and recipe's exports - which " \
                  "also extends to what happens in the cache when creating packages"
 
 
-class LayoutSrcFolder(BaseChecker):
+class LayoutSrcFolder(CCIRule):
     """
     Ensure `src_folder=src` when using built-in layouts
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-layout-src-folder"
     msgs = {
         "E9012": (
@@ -0,0 +1,91 @@
+from astroid import nodes
+from linter.checker_core import CCIRule, ConanFileIndex
+
+WHY_PACKAGE_BLOAT = "Packages are downloaded and uploaded for every build that uses them. Files that consumers don't use " \
+                    "(CMake and pkg-config files generated by upstream, documentation, debug databases, libtool archives) " \
+                    "make every transfer slower and the caches bigger, and may conflict with the files generated by Conan."
+
+# Install helper -> leftovers that should be removed after calling `install()`
+INSTALL_LEFTOVERS = {
+    "CMake": ("lib/cmake", "lib/pkgconfig", "share", "*.pdb"),
+    "Meson": ("lib/pkgconfig", "share", "*.pdb"),
+    "Autotools": ("lib/pkgconfig", "share", "*.la"),
+}
+
+
+def _strings(node):
+    for child in node.nodes_of_class(nodes.Const):
+        if isinstance(child.value, str):
+            yield child.value
+
+
+def _is_removed(leftover, strings, joined):
+    if leftover.startswith("*"):
+        return any(string.endswith(leftover[1:]) for string in strings)
+    # Paths are usually built with os.path.join(self.package_folder, "lib", "cmake")
+    return leftover in joined or leftover.split("/")[-1] in strings
+
+
+class PackageBloat(CCIRule):
+    """
+    Ensure package() removes the files installed by the build helpers that are not needed by consumers
+    """
+
+    name = "conan-package-bloat"
+    msgs = {
+        "E9017": (
+            "package() runs the %s install but does not remove %s",
+            "conan-package-bloat",
+            WHY_PACKAGE_BLOAT,
+        ),
+    }
+
+    def visit_conanfile(self, index: ConanFileIndex) -> None:
+        if index.is_test:
+            return
+        package = next((node for node in index.node.mymethods() if node.name == "package"), None)
+        if package is None:
+            return
+
+        helpers = {}
+        for call in package.nodes_of_class(nodes.Call):
+            func = call.func
+            if isinstance(func, nodes.Attribute) and func.attrname == "install" and isinstance(func.expr, nodes.Name):
+                helper = self._helper_class(func.expr)
+                if helper:
+                    helpers.setdefault(helper, call)
+        if not helpers:
+            return
+
+        # Removals are often done in helper methods of the recipe called from package()
+        scopes = [package] + [method for method in index.node.mymethods()
+                              if method.name.startswith("_") and method.name in self._called_methods(package)]
+        strings = {string for scope in scopes for string in _strings(scope)}
+        joined = "\n".join("/".join(s.strip("/") for s in _strings(call)) for scope in scopes
+                           for call in scope.nodes_of_class(nodes.Call))
+
+        for helper, call in helpers.items():
+            missing = [leftover for leftover in INSTALL_LEFTOVERS[helper] if not _is_removed(leftover, strings, joined)]
+            if missing:
+                self.add_message("conan-package-bloat", node=call, args=(helper, ", ".join(missing)))
+
+    @staticmethod
+    def _helper_class(name: nodes.Name):
+        """ Name of the helper class assigned to the variable, e.g. `cmake = CMake(self)` """
+        for assign in name.lookup(name.name)[1]:
+            value = getattr(assign.parent, "value", None)
+            if isinstance(value, nodes.Call) and isinstance(value.func, nodes.Name) and \
+                    value.func.name in INSTALL_LEFTOVERS:
+                return value.func.name
+            if isinstance(value, nodes.Call) and isinstance(value.func, nodes.Attribute) and \
+                    isinstance(value.func.expr, nodes.Name) and value.func.expr.name == "self":
+                # `cmake = self._configure_cmake()`
+                return next((helper for helper in INSTALL_LEFTOVERS if helper.lower() in value.func.attrname.lower()),
+                            None)
+        return None
+
+    @staticmethod
+    def _called_methods(node):
+        return {call.func.attrname for call in node.nodes_of_class(nodes.Call)
+                if isinstance(call.func, nodes.Attribute) and isinstance(call.func.expr, nodes.Name)
+                and call.func.expr.name == "self"}
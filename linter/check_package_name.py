@@ -1,16 +1,11 @@
-from pylint.checkers import BaseChecker
-from pylint.interfaces import IAstroidChecker
-from astroid import nodes, Const, AssignName
-from pathlib import Path
+from linter.checker_core import CCIRule, ConanFileIndex
 
 
-class PackageName(BaseChecker):
+class PackageName(CCIRule):
     """
        All packages must have a lower-case name
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-package-name"
     msgs = {
         "E9004": (
@@ -30,23 +25,14 @@ class PackageName(BaseChecker):
         ),
     }
 
-    def visit_classdef(self, node: nodes) -> None:
-        filename = Path(node.root().file)
-        is_test = filename.match('test_*/*.py')
-
-        if node.basenames == ['ConanFile']:
-            for attr in node.body:
-                children = list(attr.get_children())
-                if len(children) == 2 and \
-                   isinstance(children[0], AssignName) and \
-                   children[0].name == "name" and \
-                   isinstance(children[1], Const):
-                    if is_test:
-                        self.add_message("conan-test-no-name", node=attr, line=attr.lineno)
-                        return
-                    value = children[1].as_string()
-                    if value.lower() != value:
-                        self.add_message("conan-bad-name", node=attr, line=attr.lineno)
-                    return
-            if not is_test:
-                self.add_message("conan-missing-name", node=node)
+    def visit_conanfile(self, index: ConanFileIndex) -> None:
+        attr, value = index.get("name")
+        if attr is not None:
+            if index.is_test:
+                self.add_message("conan-test-no-name", node=attr, line=attr.lineno)
+                return
+            value = value.as_string()
+            if value.lower() != value:
+                self.add_message("conan-bad-name", node=attr, line=attr.lineno)
+        elif not index.is_test:
+            self.add_message("conan-missing-name", node=index.node)
@@ -0,0 +1,138 @@
+import os
+import re
+
+from astroid import nodes
+from linter.checker_core import CCIRule
+
+WHY_SERIAL_BUILD = "Builds run on executors with many cores, a build using a single core is much slower than needed. " \
+                   "Pass the number of jobs given by `build_jobs(self)` (from conan.tools.build) to the build tool."
+
+SERIAL_TOOLS = ("make", "gmake", "mingw32-make", "b2", "bjam")
+BUILD_ARGS = ("args", "cli_args", "build_tool_args", "make_args", "targets")
+_JOBS_RE = re.compile(r"(^|\s)(-j|--jobs\b)")
+_ONE_JOB_RE = re.compile(r"(^|\s)(-j\s*1|--jobs[= ]1|--parallel[= ]1|[/-]m(axcpucount)?:1)(\s|$)")
+
+
+def _assigned_string(node: nodes.Name, depth):
+    """ Text of the string assigned to a local variable, if it is assigned only once """
+    _, assignments = node.lookup(node.name)
+    if len(assignments) == 1 and isinstance(assignments[0], nodes.AssignName) and \
+            isinstance(assignments[0].parent, nodes.Assign):
+        return _string(assignments[0].parent.value, depth + 1)
+    return None
+
+
+def _string(node, depth=0):
+    """ Text of a string expression, with the placeholders of formatted strings left as they are
+
+    Handles literals, f-strings, `%` and `.format()` formatting, concatenations, lists of
+    arguments and local variables holding any of them.
+    """
+    if depth > 5:
+        return None
+    if isinstance(node, nodes.Const) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, nodes.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, nodes.Const):
+                parts.append(value.value)
+            else:
+                text = _string(value.value, depth + 1) if isinstance(value.value, nodes.Name) else None
+                parts.append(text if text is not None else "{" + value.value.as_string() + "}")
+        return "".join(parts)
+    if isinstance(node, nodes.BinOp) and node.op == "%":
+        return _string(node.left, depth + 1)
+    if isinstance(node, nodes.BinOp) and node.op == "+":
+        left = _string(node.left, depth + 1)
+        return None if left is None else left + (_string(node.right, depth + 1) or "")
+    if isinstance(node, nodes.Call) and isinstance(node.func, nodes.Attribute) and node.func.attrname == "format":
+        return _string(node.func.expr, depth + 1)
+    if isinstance(node, nodes.Name):
+        return _assigned_string(node, depth)
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        items = [_string(item, depth + 1) for item in node.elts]
+        return " ".join(item for item in items if item is not None)
+    return None
+
+
+class SerialBuild(CCIRule):
+    """
+    Detect build tools invoked without a number of parallel jobs
+    """
+
+    name = "conan-serial-build"
+    msgs = {
+        "E9015": (
+            "`%s` is run without a number of parallel jobs, %s",
+            "conan-serial-build",
+            WHY_SERIAL_BUILD,
+        ),
+        "E9016": (
+            "Parallel build is disabled with `%s`",
+            "conan-build-parallel-disabled",
+            WHY_SERIAL_BUILD,
+        ),
+        "E9018": (
+            "`nmake` can't run parallel jobs, use `jom` or build with CMake/MSBuild instead",
+            "conan-nmake-build",
+            "nmake always builds with a single core. Prefer jom, or the CMake or MSBuild build system of the project.",
+        ),
+    }
+
+    def visit_call(self, node: nodes.Call) -> None:
+        func = node.func
+        if not isinstance(func, nodes.Attribute):
+            if isinstance(func, nodes.Name) and func.name == "CMake":
+                self._check_parallel_keyword(node)
+            return
+
+        if func.attrname == "run" and isinstance(func.expr, nodes.Name) and func.expr.name in ("self", "subprocess"):
+            self._check_command(node)
+        elif func.attrname in ("call", "check_call", "check_output", "Popen") and \
+                isinstance(func.expr, nodes.Name) and func.expr.name == "subprocess":
+            self._check_command(node)
+        elif func.attrname in ("build", "make"):
+            self._check_parallel_keyword(node)
+            for arg in list(node.args) + [kw.value for kw in node.keywords or [] if kw.arg in BUILD_ARGS]:
+                self._check_build_args(node, arg)
+        elif func.attrname in ("append", "extend") and isinstance(func.expr, nodes.Attribute) and \
+                func.expr.attrname in BUILD_ARGS:
+            for arg in node.args:
+                self._check_build_args(node, arg)
+        elif func.attrname in ("define", "update") and len(node.args) == 2:
+            name, value = node.args
+            if isinstance(name, nodes.Const) and name.value == "tools.build:jobs" and \
+                    isinstance(value, nodes.Const) and value.value == 1:
+                self.add_message("conan-build-parallel-disabled", node=node, args=("tools.build:jobs=1",))
+
+    def _check_command(self, node: nodes.Call):
+        command = _string(node.args[0]) if node.args else None
+        if not command or not command.split():
+            return
+        words = command.split()
+        tool = os.path.basename(words[0])
+        # Installing is not worth parallelizing (and often not safe)
+        if any(word.startswith("install") for word in words[1:]):
+            return
+        if tool == "nmake":
+            self.add_message("conan-nmake-build", node=node)
+            return
+        if tool not in SERIAL_TOOLS:
+            return
+        match = _ONE_JOB_RE.search(command)
+        if match:
+            self.add_message("conan-build-parallel-disabled", node=node, args=(match.group(2),))
+        elif not _JOBS_RE.search(command):
+            self.add_message("conan-serial-build", node=node, args=(tool, "pass `-j{build_jobs(self)}`"))
+
+    def _check_build_args(self, node: nodes.Call, arg):
+        text = _string(arg)
+        match = _ONE_JOB_RE.search(text) if text else None
+        if match:
+            self.add_message("conan-build-parallel-disabled", node=node, args=(match.group(2),))
+
+    def _check_parallel_keyword(self, node: nodes.Call):
+        for kw in node.keywords or []:
+            if kw.arg == "parallel" and isinstance(kw.value, nodes.Const) and kw.value.value is False:
+                self.add_message("conan-build-parallel-disabled", node=node, args=("parallel=False",))
@@ -1,15 +1,11 @@
-from pylint.checkers import BaseChecker
-from pylint.interfaces import IAstroidChecker
-from astroid import nodes, Const, AssignName
+from linter.checker_core import CCIRule, ConanFileIndex
 
 
-class VersionAttribute(BaseChecker):
+class VersionAttribute(CCIRule):
     """
        All packages should not enforce a specific version in the recipe
     """
 
-    __implements__ = IAstroidChecker
-
     name = "conan-attr-version"
     msgs = {
         "E9014": (
@@ -19,15 +15,9 @@ class VersionAttribute(BaseChecker):
         ),
     }
 
-    def visit_classdef(self, node: nodes) -> None:
-        if node.basenames == ['ConanFile']:
-            for attr in node.body:
-                children = list(attr.get_children())
-                if len(children) == 2 and \
-                   isinstance(children[0], AssignName) and \
-                   children[0].name == "version" and \
-                   isinstance(children[1], Const):
-                    value = children[1].as_string().replace('"', "").replace("'", "")
-                    if value and value != "system":
-                        self.add_message("conan-forced-version", node=attr, line=attr.lineno)
-                    return
+    def visit_conanfile(self, index: ConanFileIndex) -> None:
+        attr, value = index.get("version")
+        if attr is not None:
+            value = value.as_string().replace('"', "").replace("'", "")
+            if value and value != "system":
+                self.add_message("conan-forced-version", node=attr, line=attr.lineno)
@@ -0,0 +1,125 @@
+"""
+
+Single pylint checker that walks each recipe once and dispatches the nodes to the
+CCI rules.
+
+Rules don't visit the tree on their own: they receive a precomputed index of the
+ConanFile class attributes and of the imported names, shared by all of them.
+
+"""
+
+from pathlib import Path
+
+from pylint.checkers import BaseChecker
+from pylint.interfaces import IAstroidChecker
+from astroid import nodes, Const, AssignName
+
+
+class ConanFileIndex:
+    """
+       Attributes of a class deriving from ConanFile, collected once for all the rules
+    """
+
+    def __init__(self, node: nodes.ClassDef):
+        self.node = node
+        self.filename = Path(node.root().file)
+        self.is_test = self.filename.match('test_*/*.py')
+        # name -> (statement, value) for each `name = <constant>` in the class body
+        self.attributes = {}
+        for attr in node.body:
+            children = list(attr.get_children())
+            if len(children) == 2 and \
+               isinstance(children[0], AssignName) and \
+               isinstance(children[1], Const):
+                self.attributes.setdefault(children[0].name, (attr, children[1]))
+
+    def get(self, name):
+        return self.attributes.get(name, (None, None))
+
+
+class ImportFromIndex:
+    """
+       Names imported by a `from module import names` statement
+    """
+
+    def __init__(self, node: nodes.ImportFrom):
+        self.node = node
+        self.modname = node.modname
+        self.names = {name for name, _ in node.names}
+
+
+class CCIRule:
+    """
+       Base class for the rules dispatched by ConanCenterChecker
+
+       Rules declare their `msgs` like a pylint checker and implement any of:
+         - visit_conanfile(index: ConanFileIndex)
+         - visit_importfrom(index: ImportFromIndex), restricted to `modnames` if not None
+         - visit_call(node: nodes.Call)
+    """
+
+    name = ""
+    msgs = {}
+    modnames = None
+
+    def __init__(self, checker: BaseChecker):
+        self.checker = checker
+
+    def add_message(self, *args, **kwargs):
+        self.checker.add_message(*args, **kwargs)
+
+
+class ConanCenterChecker(BaseChecker):
+    """
+       Visit every node once and dispatch it to the CCI rules
+    """
+
+    __implements__ = IAstroidChecker
+
+    name = "conan-center-index"
+    msgs = {}
+
+    def __init__(self, linter, rules):
+        self.rules = [rule(self) for rule in rules]
+        self.msgs = {}
+        for rule in self.rules:
+            self.msgs.update(rule.msgs)
+        super().__init__(linter)
+
+        self._conanfile_handlers = self._handlers("visit_conanfile")
+        self._call_handlers = self._handlers("visit_call")
+        self._importfrom_handlers = []
+        self._importfrom_handlers_by_modname = {}
+        for rule in self.rules:
+            handler = getattr(rule, "visit_importfrom", None)
+            if handler is None:
+                continue
+            if rule.modnames is None:
+                self._importfrom_handlers.append(handler)
+            else:
+                for modname in rule.modnames:
+                    self._importfrom_handlers_by_modname.setdefault(modname, []).append(handler)
+
+    def _handlers(self, method):
+        return [getattr(rule, method) for rule in self.rules if hasattr(rule, method)]
+
+    def visit_classdef(self, node: nodes.ClassDef) -> None:
+        if not self._conanfile_handlers or node.basenames != ['ConanFile']:
+            return
+        index = ConanFileIndex(node)
+        for handler in self._conanfile_handlers:
+            handler(index)
+
+    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
+        handlers = self._importfrom_handlers_by_modname.get(node.modname, [])
+        if not handlers and not self._importfrom_handlers:
+            return
+        index = ImportFromIndex(node)
+        for handler in handlers:
+            handler(index)
+        for handler in self._importfrom_handlers:
+            handler(index)
+
+    def visit_call(self, node: nodes.Call) -> None:
+        for handler in self._call_handlers:
+            handler(node)
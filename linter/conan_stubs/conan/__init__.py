@@ -0,0 +1,12 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conan.tools.scm import Version
+from conans.model.conan_file import ConanFile
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+__version__ = '1.64.1'
+conan_version = _unknown()
@@ -0,0 +1,9 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conans.errors import ConanException
+from conans.errors import ConanInvalidConfiguration
+from conans.errors import ConanInvalidSystemRequirements
+
+
+def _unknown():
+    raise NotImplementedError
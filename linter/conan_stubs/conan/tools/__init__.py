@@ -0,0 +1,8 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+CONAN_TOOLCHAIN_ARGS_FILE = 'conanbuild.conf'
+CONAN_TOOLCHAIN_ARGS_SECTION = 'toolchain'
@@ -0,0 +1,8 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+def android_abi(conanfile, context=None):
+    return _unknown()
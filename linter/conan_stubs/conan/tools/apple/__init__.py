@@ -0,0 +1,203 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+def fix_apple_shared_install_name(conanfile):
+    return _unknown()
+
+
+def is_apple_os(conanfile):
+    return _unknown()
+
+
+def to_apple_arch(conanfile):
+    return _unknown()
+
+
+class XCRun(object):
+
+    def __init__(self, conanfile, sdk=None, use_settings_target=None):
+        self.sdk = _unknown()
+        self.settings = _unknown()
+
+    def _invoke(self, args):
+        return _unknown()
+
+    @property
+    def ar(self):
+        return _unknown()
+
+    @property
+    def cc(self):
+        return _unknown()
+
+    @property
+    def cxx(self):
+        return _unknown()
+
+    def find(self, tool):
+        return _unknown()
+
+    @property
+    def libtool(self):
+        return _unknown()
+
+    @property
+    def ranlib(self):
+        return _unknown()
+
+    @property
+    def sdk_path(self):
+        return _unknown()
+
+    @property
+    def sdk_platform_path(self):
+        return _unknown()
+
+    @property
+    def sdk_platform_version(self):
+        return _unknown()
+
+    @property
+    def sdk_version(self):
+        return _unknown()
+
+    @property
+    def strip(self):
+        return _unknown()
+
+
+class XcodeBuild(object):
+
+    def __init__(self, conanfile):
+        self._arch = _unknown()
+        self._build_type = _unknown()
+        self._conanfile = _unknown()
+        self._sdk = _unknown()
+        self._sdk_version = _unknown()
+
+    @property
+    def _sdkroot(self):
+        return _unknown()
+
+    @property
+    def _verbosity(self):
+        return _unknown()
+
+    def build(self, xcodeproj, target=None):
+        return _unknown()
+
+
+class XcodeDeps(object):
+    _all_xconfig = '// Conan XcodeDeps generated file\n// Includes all direct dependencies\n'
+    _conf_xconfig = 'PACKAGE_ROOT_{{pkg_name}}{{condition}} = {{root}}\n// Compiler options for {{pkg_name}}::{{comp_name}}\nSYSTEM_HEADER_SEARCH_PATHS_{{pkg_name}}_{{comp_name}}{{condition}} = {{include_dirs}}\nGCC_PREPROCESSOR_DEFINITIONS_{{pkg_name}}_{{comp_name}}{{condition}} = {{definitions}}\nOTHER_CFLAGS_{{pkg_name}}_{{comp_name}}{{condition}} = {{c_compiler_flags}}\nOTHER_CPLUSPLUSFLAGS_{{pkg_name}}_{{comp_name}}{{condition}} = {{cxx_compiler_flags}}\nFRAMEWORK_SEARCH_PATHS_{{pkg_name}}_{{comp_name}}{{condition}} = {{frameworkdirs}}\n\n// Link options for {{pkg_name}}::{{comp_name}}\nLIBRARY_SEARCH_PATHS_{{pkg_name}}_{{comp_name}}{{condition}} = {{lib_dirs}}\nOTHER_LDFLAGS_{{pkg_name}}_{{comp_name}}{{condition}} = {{linker_flags}} {{libs}} {{system_libs}} {{frameworks}}\n'
+    _dep_xconfig = '// Conan XcodeDeps generated file for {{pkg_name}}::{{comp_name}}\n// Includes all configurations for each dependency\n{% for include in deps_includes %}\n#include "{{include}}"\n{% endfor %}\n#include "{{dep_xconfig_filename}}"\n\nSYSTEM_HEADER_SEARCH_PATHS = $(inherited) $(SYSTEM_HEADER_SEARCH_PATHS_{{pkg_name}}_{{comp_name}})\nGCC_PREPROCESSOR_DEFINITIONS = $(inherited) $(GCC_PREPROCESSOR_DEFINITIONS_{{pkg_name}}_{{comp_name}})\nOTHER_CFLAGS = $(inherited) $(OTHER_CFLAGS_{{pkg_name}}_{{comp_name}})\nOTHER_CPLUSPLUSFLAGS = $(inherited) $(OTHER_CPLUSPLUSFLAGS_{{pkg_name}}_{{comp_name}})\nFRAMEWORK_SEARCH_PATHS = $(inherited) $(FRAMEWORK_SEARCH_PATHS_{{pkg_name}}_{{comp_name}})\n\n// Link options for {{pkg_name}}_{{comp_name}}\nLIBRARY_SEARCH_PATHS = $(inherited) $(LIBRARY_SEARCH_PATHS_{{pkg_name}}_{{comp_name}})\nOTHER_LDFLAGS = $(inherited) $(OTHER_LDFLAGS_{{pkg_name}}_{{comp_name}})\n'
+    _pkg_xconfig = '// Conan XcodeDeps generated file\n// Includes all components for the package\n'
+    general_name = 'conandeps.xcconfig'
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.architecture = _unknown()
+        self.configuration = _unknown()
+        self.os_version = _unknown()
+        self.sdk = _unknown()
+        self.sdk_version = _unknown()
+
+    def _all_xconfig_file(self, deps):
+        return _unknown()
+
+    def _conf_xconfig_file(self, pkg_name, comp_name, package_folder, transitive_cpp_infos):
+        return _unknown()
+
+    def _content(self):
+        return _unknown()
+
+    def _dep_xconfig_file(self, pkg_name, comp_name, name_general, dep_xconfig_filename, reqs):
+        return _unknown()
+
+    @property
+    def _global_xconfig_content(self):
+        return _unknown()
+
+    def _pkg_xconfig_file(self, components):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
+
+    def get_content_for_component(self, pkg_name, component_name, package_folder, transitive_internal, transitive_external):
+        return _unknown()
+
+
+class XcodeToolchain(object):
+    _agreggated_xconfig = '// Conan XcodeToolchain generated file\n// Includes all installed configurations\n\n'
+    _flags_xconfig = '// Global flags\n{defines}\n{cflags}\n{cppflags}\n{ldflags}\n'
+    _vars_xconfig = '// Definition of toolchain variables\n{macosx_deployment_target}\n{clang_cxx_library}\n{clang_cxx_language_standard}\n'
+    extension = '.xcconfig'
+    filename = 'conantoolchain'
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self._global_cflags = _unknown()
+        self._global_cxxflags = _unknown()
+        self._global_defines = _unknown()
+        self._global_ldflags = _unknown()
+        self.architecture = _unknown()
+        self.configuration = _unknown()
+        self.libcxx = _unknown()
+        self.os_version = _unknown()
+        self.sdk = _unknown()
+        self.sdk_version = _unknown()
+
+    @property
+    def _agreggated_xconfig_content(self):
+        return _unknown()
+
+    @property
+    def _agreggated_xconfig_filename(self):
+        return _unknown()
+
+    @property
+    def _check_if_extra_flags(self):
+        return _unknown()
+
+    @property
+    def _clang_cxx_language_standard(self):
+        return _unknown()
+
+    @property
+    def _clang_cxx_library(self):
+        return _unknown()
+
+    @property
+    def _cppstd(self):
+        return _unknown()
+
+    @property
+    def _flags_xcconfig_content(self):
+        return _unknown()
+
+    @property
+    def _flags_xcconfig_filename(self):
+        return _unknown()
+
+    @property
+    def _global_xconfig_content(self):
+        return _unknown()
+
+    @property
+    def _macosx_deployment_target(self):
+        return _unknown()
+
+    @property
+    def _vars_xconfig_content(self):
+        return _unknown()
+
+    @property
+    def _vars_xconfig_filename(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
@@ -0,0 +1,40 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+def build_jobs(conanfile):
+    return _unknown()
+
+
+def can_run(conanfile):
+    return _unknown()
+
+
+def check_min_cppstd(conanfile, cppstd, gnu_extensions=None):
+    return _unknown()
+
+
+def cppstd_flag(conanfile):
+    return _unknown()
+
+
+def cross_building(conanfile=None, skip_x64_x86=None):
+    return _unknown()
+
+
+def default_cppstd(conanfile, compiler=None, compiler_version=None):
+    return _unknown()
+
+
+def stdcpp_library(conanfile):
+    return _unknown()
+
+
+def supported_cppstd(conanfile, compiler=None, compiler_version=None):
+    return _unknown()
+
+
+def valid_min_cppstd(conanfile, cppstd, gnu_extensions=None):
+    return _unknown()
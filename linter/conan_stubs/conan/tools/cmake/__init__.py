@@ -0,0 +1,130 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+def cmake_layout(conanfile, generator=None, src_folder=None, build_folder=None):
+    return _unknown()
+
+
+class CMake(object):
+
+    def __init__(self, conanfile):
+        self._cache_variables = _unknown()
+        self._cmake_program = _unknown()
+        self._conanfile = _unknown()
+        self._generator = _unknown()
+        self._toolchain_file = _unknown()
+
+    def _build(self, build_type=None, target=None, cli_args=None, build_tool_args=None, env=None):
+        return _unknown()
+
+    def build(self, build_type=None, target=None, cli_args=None, build_tool_args=None):
+        return _unknown()
+
+    def configure(self, variables=None, build_script_folder=None, cli_args=None):
+        return _unknown()
+
+    def install(self, build_type=None, component=None):
+        return _unknown()
+
+    def test(self, build_type=None, target=None, cli_args=None, build_tool_args=None, env=None):
+        return _unknown()
+
+
+class CMakeDeps(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self._properties = _unknown()
+        self.arch = _unknown()
+        self.build_context_activated = _unknown()
+        self.build_context_build_modules = _unknown()
+        self.build_context_suffix = _unknown()
+        self.check_components_exist = _unknown()
+        self.configuration = _unknown()
+
+    def _generate_files(self, require, dep, ret, find_module_mode):
+        return _unknown()
+
+    @property
+    def content(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
+
+    def get_cmake_package_name(self, dep, module_mode=None):
+        return _unknown()
+
+    def get_find_mode(self, dep):
+        return _unknown()
+
+    def get_property(self, prop, dep, comp_name=None):
+        return _unknown()
+
+    def set_property(self, dep, prop, value, build_context=None):
+        return _unknown()
+
+
+class CMakeFileAPI(object):
+    CODEMODELV2 = 'codemodel-v2'
+    CodeModelReplyV2 = _unknown()
+    SKIP_TARGETS = _unknown()
+    SUPPORTED_TARGET_TYPES = _unknown()
+
+    def __init__(self, conanfile):
+        self._codemodel = _unknown()
+        self._components = _unknown()
+        self._conanfile = _unknown()
+        self._configurations = _unknown()
+
+    @property
+    def api_dir(self):
+        return _unknown()
+
+    @property
+    def build_type(self):
+        return _unknown()
+
+    def query(self, query):
+        return _unknown()
+
+    @property
+    def query_dir(self):
+        return _unknown()
+
+    def reply(self, reply):
+        return _unknown()
+
+    @property
+    def reply_dir(self):
+        return _unknown()
+
+
+class CMakeToolchain(object):
+    _template = '\n{% macro iterate_configs(var_config, action) %}\n    {% for it, values in var_config.items() %}\n        {% set genexpr = namespace(str=\'\') %}\n        {% for conf, value in values -%}\n        set(CONAN_DEF_{{ conf }}{{ it }} "{{ value }}")\n        {% endfor %}\n        {% for conf, value in values -%}\n            {% set genexpr.str = genexpr.str +\n                                  \'$<IF:$<CONFIG:\' + conf + \'>,${CONAN_DEF_\' + conf|string + it|string + \'},\' %}\n            {% if loop.last %}{% set genexpr.str = genexpr.str + \'""\' -%}{%- endif -%}\n        {% endfor %}\n        {% for i in range(values|count) %}{% set genexpr.str = genexpr.str + \'>\' %}\n        {% endfor %}\n        {% if action==\'set\' %}\n        set({{ it }} {{ genexpr.str }} CACHE STRING\n            "Variable {{ it }} conan-toolchain defined")\n        {% elif action==\'add_compile_definitions\' -%}\n        add_compile_definitions({{ it }}={{ genexpr.str }})\n        {% endif %}\n    {% endfor %}\n{% endmacro %}\n\n# Conan automatically generated toolchain file\n# DO NOT EDIT MANUALLY, it will be overwritten\n\n# Avoid including toolchain file several times (bad if appending to variables like\n#   CMAKE_CXX_FLAGS. See https://github.com/android/ndk/issues/323\ninclude_guard()\n\nmessage(STATUS "Using Conan toolchain: ${CMAKE_CURRENT_LIST_FILE}")\n\nif(${CMAKE_VERSION} VERSION_LESS "3.15")\n    message(FATAL_ERROR "The \'CMakeToolchain\' generator only works with CMake >= 3.15")\nendif()\n\n{% for conan_block in conan_blocks %}\n{{ conan_block }}\n{% endfor %}\n\n# Variables\n{% for it, value in variables.items() %}\n{% if value is boolean %}\nset({{ it }} {{ value|cmake_value }} CACHE BOOL "Variable {{ it }} conan-toolchain defined")\n{% else %}\nset({{ it }} {{ value|cmake_value }} CACHE STRING "Variable {{ it }} conan-toolchain defined")\n{% endif %}\n{% endfor %}\n# Variables  per configuration\n{{ iterate_configs(variables_config, action=\'set\') }}\n\n# Preprocessor definitions\n{% for it, value in preprocessor_definitions.items() %}\nadd_compile_definitions("{{ it }}={{ value }}")\n{% endfor %}\n# Preprocessor definitions per configuration\n{{ iterate_configs(preprocessor_definitions_config, action=\'add_compile_definitions\') }}\n'
+    filename = 'conan_toolchain.cmake'
+
+    def __init__(self, conanfile, generator=None):
+        self._conanfile = _unknown()
+        self.blocks = _unknown()
+        self.cache_variables = _unknown()
+        self.generator = _unknown()
+        self.preprocessor_definitions = _unknown()
+        self.user_presets_path = _unknown()
+        self.variables = _unknown()
+
+    def _context(self):
+        return _unknown()
+
+    def _get_generator(self, recipe_generator):
+        return _unknown()
+
+    @property
+    def content(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
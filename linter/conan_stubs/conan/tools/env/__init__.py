@@ -0,0 +1,109 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+class Environment(object):
+    __hash__ = None
+
+    def __bool__(self):
+        return _unknown()
+
+    def __eq__(self, other):
+        return _unknown()
+
+    def __init__(self):
+        self._values = _unknown()
+
+    def __ne__(self, other):
+        return _unknown()
+
+    def __nonzero__(self):
+        return _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    def append(self, name, value, separator=None):
+        return _unknown()
+
+    def append_path(self, name, value):
+        return _unknown()
+
+    def compose_env(self, other):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    def define(self, name, value, separator=None):
+        return _unknown()
+
+    def define_path(self, name, value):
+        return _unknown()
+
+    def dumps(self):
+        return _unknown()
+
+    def prepend(self, name, value, separator=None):
+        return _unknown()
+
+    def prepend_path(self, name, value):
+        return _unknown()
+
+    def remove(self, name, value):
+        return _unknown()
+
+    def set_relative_base_folder(self, folder):
+        return _unknown()
+
+    def unset(self, name):
+        return _unknown()
+
+    def vars(self, conanfile, scope=None):
+        return _unknown()
+
+
+class VirtualBuildEnv(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.arch = _unknown()
+        self.basename = _unknown()
+        self.configuration = _unknown()
+
+    @property
+    def _filename(self):
+        return _unknown()
+
+    def environment(self):
+        return _unknown()
+
+    def generate(self, scope=None):
+        return _unknown()
+
+    def vars(self, scope=None):
+        return _unknown()
+
+
+class VirtualRunEnv(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.arch = _unknown()
+        self.basename = _unknown()
+        self.configuration = _unknown()
+
+    @property
+    def _filename(self):
+        return _unknown()
+
+    def environment(self):
+        return _unknown()
+
+    def generate(self, scope=None):
+        return _unknown()
+
+    def vars(self, scope=None):
+        return _unknown()
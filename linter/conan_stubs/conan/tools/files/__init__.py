@@ -0,0 +1,133 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+def apply_conandata_patches(conanfile):
+    return _unknown()
+
+
+def chdir(conanfile, newdir):
+    return _unknown()
+
+
+def check_md5(conanfile, file_path, signature):
+    return _unknown()
+
+
+def check_sha1(conanfile, file_path, signature):
+    return _unknown()
+
+
+def check_sha256(conanfile, file_path, signature):
+    return _unknown()
+
+
+def collect_libs(conanfile, folder=None):
+    return _unknown()
+
+
+def copy(conanfile, pattern, src, dst, keep_path=None, excludes=None, ignore_case=None):
+    return _unknown()
+
+
+def download(conanfile, url, filename, verify=None, retry=None, retry_wait=None, auth=None, headers=None, md5=None, sha1=None, sha256=None):
+    return _unknown()
+
+
+def export_conandata_patches(conanfile):
+    return _unknown()
+
+
+def ftp_download(conanfile, ip, filename, login=None, password=None):
+    return _unknown()
+
+
+def get(conanfile, url, md5=None, sha1=None, sha256=None, destination=None, filename=None, keep_permissions=None, pattern=None, verify=None, retry=None, retry_wait=None, auth=None, headers=None, strip_root=None):
+    return _unknown()
+
+
+def load(conanfile, path, encoding=None):
+    return _unknown()
+
+
+def mkdir(conanfile, path):
+    return _unknown()
+
+
+def move_folder_contents(conanfile, src_folder, dst_folder):
+    return _unknown()
+
+
+def patch(conanfile, base_path=None, patch_file=None, patch_string=None, strip=None, fuzz=None, **kwargs):
+    return _unknown()
+
+
+def rename(conanfile, src, dst):
+    return _unknown()
+
+
+def replace_in_file(conanfile, file_path, search, replace, strict=None, encoding=None):
+    return _unknown()
+
+
+def rm(conanfile, pattern, folder, recursive=None):
+    return _unknown()
+
+
+def rmdir(conanfile, path):
+    return _unknown()
+
+
+def save(conanfile, path, content, append=None, encoding=None):
+    return _unknown()
+
+
+def trim_conandata(conanfile):
+    return _unknown()
+
+
+def unzip(conanfile, filename, destination=None, keep_permissions=None, pattern=None, strip_root=None):
+    return _unknown()
+
+
+def update_conandata(conanfile, data):
+    return _unknown()
+
+
+class AutoPackager(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.patterns = _unknown()
+
+    def _package_cppinfo(self, origin_name, origin_cppinfo, dest_cppinfo):
+        return _unknown()
+
+    def run(self):
+        return _unknown()
+
+
+class CppPackage(object):
+    Component = _unknown()
+    DEFAULT_FILENAME = 'cpp_package.json'
+
+    def __init__(self):
+        self.components = _unknown()
+        self.libs = _unknown()
+        self.names = _unknown()
+        self.requires = _unknown()
+
+    def add_component(self, name):
+        return _unknown()
+
+    @classmethod
+    def load(cls, filename=None):
+        return _unknown()
+
+    def package_info(self, conanfile):
+        return _unknown()
+
+    def save(self, filename=None):
+        return _unknown()
@@ -0,0 +1,220 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+class Autotools(object):
+
+    def __init__(self, conanfile, namespace=None):
+        self._autoreconf_args = _unknown()
+        self._conanfile = _unknown()
+        self._configure_args = _unknown()
+        self._make_args = _unknown()
+
+    def _use_win_mingw(self):
+        return _unknown()
+
+    def autoreconf(self, args=None):
+        return _unknown()
+
+    def configure(self, build_script_folder=None, args=None):
+        return _unknown()
+
+    def install(self, args=None, target=None):
+        return _unknown()
+
+    def make(self, target=None, args=None):
+        return _unknown()
+
+
+class AutotoolsDeps(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self._environment = _unknown()
+        self._ordered_deps = _unknown()
+
+    def _get_cpp_info(self):
+        return _unknown()
+
+    def _rpaths_flags(self):
+        return _unknown()
+
+    @property
+    def environment(self):
+        return _unknown()
+
+    def generate(self, scope=None):
+        return _unknown()
+
+    @property
+    def ordered_deps(self):
+        return _unknown()
+
+    def vars(self, scope=None):
+        return _unknown()
+
+
+class AutotoolsToolchain(object):
+
+    def __init__(self, conanfile, namespace=None, prefix=None):
+        self._build = _unknown()
+        self._conanfile = _unknown()
+        self._host = _unknown()
+        self._namespace = _unknown()
+        self._prefix = _unknown()
+        self._target = _unknown()
+        self.apple_arch_flag = _unknown()
+        self.apple_isysroot_flag = _unknown()
+        self.apple_min_version_flag = _unknown()
+        self.arch_flag = _unknown()
+        self.autoreconf_args = _unknown()
+        self.build_type_flags = _unknown()
+        self.build_type_link_flags = _unknown()
+        self.configure_args = _unknown()
+        self.cppstd = _unknown()
+        self.extra_cflags = _unknown()
+        self.extra_cxxflags = _unknown()
+        self.extra_defines = _unknown()
+        self.extra_ldflags = _unknown()
+        self.fpic = _unknown()
+        self.gcc_cxx11_abi = _unknown()
+        self.libcxx = _unknown()
+        self.make_args = _unknown()
+        self.msvc_runtime_flag = _unknown()
+        self.ndebug = _unknown()
+        self.sysroot_flag = _unknown()
+
+    @staticmethod
+    def _default_autoreconf_flags():
+        return _unknown()
+
+    def _default_configure_install_flags(self):
+        return _unknown()
+
+    def _default_configure_shared_flags(self):
+        return _unknown()
+
+    @staticmethod
+    def _filter_list_empty_fields(v):
+        return _unknown()
+
+    def _get_msvc_runtime_flag(self):
+        return _unknown()
+
+    def _get_triplets(self):
+        return _unknown()
+
+    def _update_flags(self, attr_name, updated_flags):
+        return _unknown()
+
+    @property
+    def cflags(self):
+        return _unknown()
+
+    @property
+    def cxxflags(self):
+        return _unknown()
+
+    @property
+    def defines(self):
+        return _unknown()
+
+    def environment(self):
+        return _unknown()
+
+    def generate(self, env=None, scope=None):
+        return _unknown()
+
+    def generate_args(self):
+        return _unknown()
+
+    @property
+    def ldflags(self):
+        return _unknown()
+
+    def update_autoreconf_args(self, updated_flags):
+        return _unknown()
+
+    def update_configure_args(self, updated_flags):
+        return _unknown()
+
+    def update_make_args(self, updated_flags):
+        return _unknown()
+
+    def vars(self):
+        return _unknown()
+
+
+class PkgConfig(object):
+
+    def __init__(self, conanfile, library, pkg_config_path=None):
+        self._conanfile = _unknown()
+        self._info = _unknown()
+        self._library = _unknown()
+        self._pkg_config_path = _unknown()
+        self._variables = _unknown()
+
+    def _get_option(self, option):
+        return _unknown()
+
+    def _parse_output(self, option):
+        return _unknown()
+
+    @property
+    def cflags(self):
+        return _unknown()
+
+    @property
+    def defines(self):
+        return _unknown()
+
+    def fill_cpp_info(self, cpp_info, is_system=None, system_libs=None):
+        return _unknown()
+
+    @property
+    def includedirs(self):
+        return _unknown()
+
+    @property
+    def libdirs(self):
+        return _unknown()
+
+    @property
+    def libs(self):
+        return _unknown()
+
+    @property
+    def linkflags(self):
+        return _unknown()
+
+    @property
+    def provides(self):
+        return _unknown()
+
+    @property
+    def variables(self):
+        return _unknown()
+
+    @property
+    def version(self):
+        return _unknown()
+
+
+class PkgConfigDeps(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.build_context_activated = _unknown()
+        self.build_context_suffix = _unknown()
+
+    def _validate_build_requires(self, host_req, build_req):
+        return _unknown()
+
+    @property
+    def content(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
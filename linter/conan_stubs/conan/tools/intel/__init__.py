@@ -0,0 +1,31 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+class IntelCC(object):
+    filename = 'conanintelsetvars'
+
+    def __init__(self, conanfile):
+        self._compiler_version = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._out = _unknown()
+        self._settings = _unknown()
+        self.arch = _unknown()
+
+    @property
+    def command(self):
+        return _unknown()
+
+    def generate(self, scope=None):
+        return _unknown()
+
+    @property
+    def installation_path(self):
+        return _unknown()
+
+    @property
+    def ms_toolset(self):
+        return _unknown()
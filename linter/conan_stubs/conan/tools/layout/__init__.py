@@ -0,0 +1,19 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conan.tools.cmake import cmake_layout
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+def basic_layout(conanfile, src_folder=None):
+    return _unknown()
+
+
+def bazel_layout(conanfile, src_folder=None, build_folder=None, target_folder=None):
+    return _unknown()
+
+
+def vs_layout(conanfile):
+    return _unknown()
@@ -0,0 +1,134 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+class Meson(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+
+    def build(self, target=None):
+        return _unknown()
+
+    def configure(self, reconfigure=None):
+        return _unknown()
+
+    def install(self):
+        return _unknown()
+
+    def test(self):
+        return _unknown()
+
+
+class MesonDeps(object):
+    _meson_file_template = '\n[constants]\ndeps_c_args = {{c_args}}\ndeps_c_link_args = {{c_link_args}}\ndeps_cpp_args = {{cpp_args}}\ndeps_cpp_link_args = {{cpp_link_args}}\n'
+    filename = 'conan_meson_deps_flags.ini'
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self._ordered_deps = _unknown()
+        self.c_args = _unknown()
+        self.c_link_args = _unknown()
+        self.cpp_args = _unknown()
+        self.cpp_link_args = _unknown()
+
+    def _content(self):
+        return _unknown()
+
+    def _context(self):
+        return _unknown()
+
+    def _get_cpp_info(self):
+        return _unknown()
+
+    def _rpaths_flags(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
+
+    def get_gnu_flags(self):
+        return _unknown()
+
+    @property
+    def ordered_deps(self):
+        return _unknown()
+
+
+class MesonToolchain(object):
+    _meson_file_template = '\n[properties]\n{% for it, value in properties.items() -%}\n{{it}} = {{value}}\n{% endfor %}\n\n[constants]\npreprocessor_definitions = [{% for it, value in preprocessor_definitions.items() -%}\n\'-D{{ it }}="{{ value}}"\'{%- if not loop.last %}, {% endif %}{% endfor %}]\n# Constants to be overridden by conan_meson_deps_flags.ini (if exists)\ndeps_c_args = []\ndeps_c_link_args = []\ndeps_cpp_args = []\ndeps_cpp_link_args = []\n\n[project options]\n{% for it, value in project_options.items() -%}\n{{it}} = {{value}}\n{% endfor %}\n\n[binaries]\n{% if c %}c = \'{{c}}\'{% endif %}\n{% if cpp %}cpp = \'{{cpp}}\'{% endif %}\n{% if is_apple_system %}\n{% if objc %}objc = \'{{objc}}\'{% endif %}\n{% if objcpp %}objcpp = \'{{objcpp}}\'{% endif %}\n{% endif %}\n{% if c_ld %}c_ld = \'{{c_ld}}\'{% endif %}\n{% if cpp_ld %}cpp_ld = \'{{cpp_ld}}\'{% endif %}\n{% if ar %}ar = \'{{ar}}\'{% endif %}\n{% if strip %}strip = \'{{strip}}\'{% endif %}\n{% if as %}as = \'{{as}}\'{% endif %}\n{% if windres %}windres = \'{{windres}}\'{% endif %}\n{% if pkgconfig %}pkgconfig = \'{{pkgconfig}}\'{% endif %}\n\n[built-in options]\n{% if buildtype %}buildtype = \'{{buildtype}}\'{% endif %}\n{% if debug %}debug = {{debug}}{% endif %}\n{% if default_library %}default_library = \'{{default_library}}\'{% endif %}\n{% if b_vscrt %}b_vscrt = \'{{b_vscrt}}\' {% endif %}\n{% if b_ndebug %}b_ndebug = {{b_ndebug}}{% endif %}\n{% if b_staticpic %}b_staticpic = {{b_staticpic}}{% endif %}\n{% if cpp_std %}cpp_std = \'{{cpp_std}}\' {% endif %}\n{% if backend %}backend = \'{{backend}}\' {% endif %}\n{% if pkg_config_path %}pkg_config_path = \'{{pkg_config_path}}\'{% endif %}\n# C/C++ arguments\nc_args = {{c_args}} + preprocessor_definitions + deps_c_args\nc_link_args = {{c_link_args}} + deps_c_link_args\ncpp_args = {{cpp_args}} + preprocessor_definitions + deps_cpp_args\ncpp_link_args = {{cpp_link_args}} + deps_cpp_link_args\n{% if is_apple_system %}\n# Objective-C/C++ arguments\nobjc_args = {{objc_args}} + preprocessor_definitions + deps_c_args\nobjc_link_args = {{objc_link_args}} + deps_c_link_args\nobjcpp_args = {{objcpp_args}} + preprocessor_definitions + deps_cpp_args\nobjcpp_link_args = {{objcpp_link_args}} + deps_cpp_link_args\n{% endif %}\n\n{% for context, values in cross_build.items() %}\n[{{context}}_machine]\nsystem = \'{{values["system"]}}\'\ncpu_family = \'{{values["cpu_family"]}}\'\ncpu = \'{{values["cpu"]}}\'\nendian = \'{{values["endian"]}}\'\n{% endfor %}\n'
+    cross_filename = 'conan_meson_cross.ini'
+    native_filename = 'conan_meson_native.ini'
+
+    def __init__(self, conanfile, backend=None):
+        self._b_ndebug = _unknown()
+        self._b_staticpic = _unknown()
+        self._b_vscrt = _unknown()
+        self._backend = _unknown()
+        self._buildtype = _unknown()
+        self._conanfile = _unknown()
+        self._cpp_std = _unknown()
+        self._default_library = _unknown()
+        self._is_apple_system = _unknown()
+        self._os = _unknown()
+        self.apple_arch_flag = _unknown()
+        self.apple_isysroot_flag = _unknown()
+        self.apple_min_version_flag = _unknown()
+        self.ar = _unknown()
+        self.as_ = _unknown()
+        self.c = _unknown()
+        self.c_args = _unknown()
+        self.c_ld = _unknown()
+        self.c_link_args = _unknown()
+        self.cpp = _unknown()
+        self.cpp_args = _unknown()
+        self.cpp_ld = _unknown()
+        self.cpp_link_args = _unknown()
+        self.cross_build = _unknown()
+        self.gcc_cxx11_abi = _unknown()
+        self.libcxx = _unknown()
+        self.objc = _unknown()
+        self.objc_args = _unknown()
+        self.objc_link_args = _unknown()
+        self.objcpp = _unknown()
+        self.objcpp_args = _unknown()
+        self.objcpp_link_args = _unknown()
+        self.pkg_config_path = _unknown()
+        self.pkgconfig = _unknown()
+        self.preprocessor_definitions = _unknown()
+        self.project_options = _unknown()
+        self.properties = _unknown()
+        self.strip = _unknown()
+        self.windres = _unknown()
+
+    def _context(self):
+        return _unknown()
+
+    @staticmethod
+    def _filter_list_empty_fields(v):
+        return _unknown()
+
+    def _get_default_dirs(self):
+        return _unknown()
+
+    @staticmethod
+    def _get_env_list(v):
+        return _unknown()
+
+    def _get_extra_flags(self):
+        return _unknown()
+
+    def _resolve_android_cross_compilation(self):
+        return _unknown()
+
+    def _resolve_apple_flags_and_variables(self, build_env, compilers_by_conf):
+        return _unknown()
+
+    @property
+    def content(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
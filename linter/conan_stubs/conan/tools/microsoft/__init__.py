@@ -0,0 +1,203 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conan.tools.layout import vs_layout
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+def check_min_vs(conanfile, version, raise_invalid=None):
+    return _unknown()
+
+
+def is_msvc(conanfile, build_context=None):
+    return _unknown()
+
+
+def is_msvc_static_runtime(conanfile):
+    return _unknown()
+
+
+def msvc_runtime_flag(conanfile):
+    return _unknown()
+
+
+def msvs_toolset(conanfile):
+    return _unknown()
+
+
+def unix_path(conanfile, path, scope=None):
+    return _unknown()
+
+
+def unix_path_package_info_legacy(conanfile, path, path_flavor=None):
+    return _unknown()
+
+
+class MSBuild(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.build_type = _unknown()
+        self.platform = _unknown()
+
+    def build(self, sln, targets=None):
+        return _unknown()
+
+    def command(self, sln, targets=None):
+        return _unknown()
+
+    @staticmethod
+    def get_version(_):
+        return _unknown()
+
+
+class MSBuildDeps(object):
+    _conf_props = '<?xml version="1.0" encoding="utf-8"?>\n<Project ToolsVersion="4.0" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">\n  <ImportGroup Label="PropertySheets">\n    {% for dep in deps %}\n    <Import Condition="\'$(conan_{{dep}}_props_imported)\' != \'True\'" Project="conan_{{dep}}.props"/>\n    {% endfor %}\n  </ImportGroup>\n  <ImportGroup Label="PropertySheets">\n    <Import Project="{{vars_filename}}"/>\n  </ImportGroup>\n  {% if host_context %}\n  <PropertyGroup>\n    <ConanDebugPath>$(Conan{{name}}BinaryDirectories);$(ConanDebugPath)</ConanDebugPath>\n    <LocalDebuggerEnvironment>PATH=$(ConanDebugPath);%PATH%</LocalDebuggerEnvironment>\n    <DebuggerFlavor>WindowsLocalDebugger</DebuggerFlavor>\n    {% if ca_exclude %}\n    <CAExcludePath>$(Conan{{name}}IncludeDirectories);$(CAExcludePath)</CAExcludePath>\n    {% endif %}\n  </PropertyGroup>\n  <ItemDefinitionGroup>\n    <ClCompile>\n      <AdditionalIncludeDirectories>$(Conan{{name}}IncludeDirectories)%(AdditionalIncludeDirectories)</AdditionalIncludeDirectories>\n      <PreprocessorDefinitions>$(Conan{{name}}PreprocessorDefinitions)%(PreprocessorDefinitions)</PreprocessorDefinitions>\n      <AdditionalOptions>$(Conan{{name}}CompilerFlags) %(AdditionalOptions)</AdditionalOptions>\n    </ClCompile>\n    <Link>\n      <AdditionalLibraryDirectories>$(Conan{{name}}LibraryDirectories)%(AdditionalLibraryDirectories)</AdditionalLibraryDirectories>\n      <AdditionalDependencies>$(Conan{{name}}Libraries)%(AdditionalDependencies)</AdditionalDependencies>\n      <AdditionalDependencies>$(Conan{{name}}SystemLibs)%(AdditionalDependencies)</AdditionalDependencies>\n      <AdditionalOptions>$(Conan{{name}}LinkerFlags) %(AdditionalOptions)</AdditionalOptions>\n    </Link>\n    <Midl>\n      <AdditionalIncludeDirectories>$(Conan{{name}}IncludeDirectories)%(AdditionalIncludeDirectories)</AdditionalIncludeDirectories>\n    </Midl>\n    <ResourceCompile>\n      <AdditionalIncludeDirectories>$(Conan{{name}}IncludeDirectories)%(AdditionalIncludeDirectories)</AdditionalIncludeDirectories>\n      <PreprocessorDefinitions>$(Conan{{name}}PreprocessorDefinitions)%(PreprocessorDefinitions)</PreprocessorDefinitions>\n      <AdditionalOptions>$(Conan{{name}}CompilerFlags) %(AdditionalOptions)</AdditionalOptions>\n    </ResourceCompile>\n  </ItemDefinitionGroup>\n  {% else %}\n  <PropertyGroup>\n    <ExecutablePath>$(Conan{{name}}BinaryDirectories)$(ExecutablePath)</ExecutablePath>\n  </PropertyGroup>\n  {% endif %}\n</Project>\n'
+    _vars_props = '<?xml version="1.0" encoding="utf-8"?>\n<Project ToolsVersion="4.0" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">\n  <PropertyGroup Label="ConanVariables">\n    <Conan{{name}}RootFolder>{{root_folder}}</Conan{{name}}RootFolder>\n    <Conan{{name}}BinaryDirectories>{{bin_dirs}}</Conan{{name}}BinaryDirectories>\n    {% if host_context %}\n    <Conan{{name}}CompilerFlags>{{compiler_flags}}</Conan{{name}}CompilerFlags>\n    <Conan{{name}}LinkerFlags>{{linker_flags}}</Conan{{name}}LinkerFlags>\n    <Conan{{name}}PreprocessorDefinitions>{{definitions}}</Conan{{name}}PreprocessorDefinitions>\n    <Conan{{name}}IncludeDirectories>{{include_dirs}}</Conan{{name}}IncludeDirectories>\n    <Conan{{name}}ResourceDirectories>{{res_dirs}}</Conan{{name}}ResourceDirectories>\n    <Conan{{name}}LibraryDirectories>{{lib_dirs}}</Conan{{name}}LibraryDirectories>\n    <Conan{{name}}Libraries>{{libs}}</Conan{{name}}Libraries>\n    <Conan{{name}}SystemLibs>{{system_libs}}</Conan{{name}}SystemLibs>\n    {% endif %}\n  </PropertyGroup>\n</Project>\n'
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.configuration = _unknown()
+        self.exclude_code_analysis = _unknown()
+        self.platform = _unknown()
+
+    def _activate_props_file(self, dep_name, vars_filename, deps, build):
+        return _unknown()
+
+    def _conandeps(self):
+        return _unknown()
+
+    def _condition(self):
+        return _unknown()
+
+    def _config_filename(self):
+        return _unknown()
+
+    def _content(self):
+        return _unknown()
+
+    @staticmethod
+    def _dep_name(dep, build):
+        return _unknown()
+
+    @staticmethod
+    def _dep_props_file(dep_name, filename, aggregated_filename, condition, content=None):
+        return _unknown()
+
+    @staticmethod
+    def _get_valid_xml_format(name):
+        return _unknown()
+
+    def _package_props_files(self, dep, build=None):
+        return _unknown()
+
+    def _vars_props_file(self, dep, name, cpp_info, build):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
+
+
+class MSBuildToolchain(object):
+    _config_toolchain_props = '<?xml version="1.0" encoding="utf-8"?>\n<Project xmlns="http://schemas.microsoft.com/developer/msbuild/2003">\n  <ItemDefinitionGroup>\n    <ClCompile>\n      <PreprocessorDefinitions>{{ defines }}%(PreprocessorDefinitions)</PreprocessorDefinitions>\n      <AdditionalOptions>{{ compiler_flags }} %(AdditionalOptions)</AdditionalOptions>\n      <RuntimeLibrary>{{ runtime_library }}</RuntimeLibrary>\n      <LanguageStandard>{{ cppstd }}</LanguageStandard>{{ parallel }}{{ compile_options }}\n    </ClCompile>\n    <Link>\n      <AdditionalOptions>{{ linker_flags }} %(AdditionalOptions)</AdditionalOptions>\n    </Link>\n    <ResourceCompile>\n      <PreprocessorDefinitions>{{ defines }}%(PreprocessorDefinitions)</PreprocessorDefinitions>\n      <AdditionalOptions>{{ compiler_flags }} %(AdditionalOptions)</AdditionalOptions>\n    </ResourceCompile>\n  </ItemDefinitionGroup>\n  <PropertyGroup Label="Configuration">\n    <PlatformToolset>{{ toolset }}</PlatformToolset>\n    {% for k, v in properties.items() %}\n    <{{k}}>{{ v }}</{{k}}>\n    {% endfor %}\n  </PropertyGroup>\n</Project>\n'
+    filename = 'conantoolchain.props'
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.cflags = _unknown()
+        self.compile_options = _unknown()
+        self.configuration = _unknown()
+        self.cppstd = _unknown()
+        self.cxxflags = _unknown()
+        self.ldflags = _unknown()
+        self.preprocessor_definitions = _unknown()
+        self.properties = _unknown()
+        self.runtime_library = _unknown()
+        self.toolset = _unknown()
+
+    def _get_extra_flags(self):
+        return _unknown()
+
+    def _name_condition(self, settings):
+        return _unknown()
+
+    @staticmethod
+    def _runtime_library(settings):
+        return _unknown()
+
+    def _write_config_toolchain(self, config_filename):
+        return _unknown()
+
+    def _write_main_toolchain(self, config_filename, condition):
+        return _unknown()
+
+    @property
+    def context_config_toolchain(self):
+        return _unknown()
+
+    def generate(self):
+        return _unknown()
+
+
+class NMakeDeps(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self._environment = _unknown()
+
+    def _get_cpp_info(self):
+        return _unknown()
+
+    @property
+    def environment(self):
+        return _unknown()
+
+    def generate(self, scope=None):
+        return _unknown()
+
+    def vars(self, scope=None):
+        return _unknown()
+
+
+class NMakeToolchain(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self.extra_cflags = _unknown()
+        self.extra_cxxflags = _unknown()
+        self.extra_defines = _unknown()
+        self.extra_ldflags = _unknown()
+
+    @property
+    def _cl(self):
+        return _unknown()
+
+    def _format_defines(self, defines):
+        return _unknown()
+
+    def _format_options(self, options):
+        return _unknown()
+
+    @property
+    def _link(self):
+        return _unknown()
+
+    def environment(self):
+        return _unknown()
+
+    def generate(self, env=None, scope=None):
+        return _unknown()
+
+    def vars(self):
+        return _unknown()
+
+
+class VCVars(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+
+    def generate(self, scope=None):
+        return _unknown()
@@ -0,0 +1,115 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conans.errors import ConanException
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+class Git(object):
+
+    def __init__(self, conanfile, folder=None):
+        self._conanfile = _unknown()
+        self.folder = _unknown()
+
+    def checkout(self, commit):
+        return _unknown()
+
+    def clone(self, url, target=None, args=None):
+        return _unknown()
+
+    def commit_in_remote(self, commit, remote=None):
+        return _unknown()
+
+    def fetch_commit(self, url, commit):
+        return _unknown()
+
+    def get_commit(self):
+        return _unknown()
+
+    def get_remote_url(self, remote=None):
+        return _unknown()
+
+    def get_repo_root(self):
+        return _unknown()
+
+    def get_url_and_commit(self, remote=None):
+        return _unknown()
+
+    def included_files(self):
+        return _unknown()
+
+    def is_dirty(self):
+        return _unknown()
+
+    def run(self, cmd):
+        return _unknown()
+
+
+class Version(object):
+
+    def __eq__(self, other):
+        return _unknown()
+
+    def __ge__(self, other):
+        return _unknown()
+
+    def __gt__(self, other):
+        return _unknown()
+
+    def __hash__(self):
+        return _unknown()
+
+    def __init__(self, value):
+        self._build = _unknown()
+        self._items = _unknown()
+        self._nonzero_items = _unknown()
+        self._pre = _unknown()
+        self._value = _unknown()
+
+    def __le__(self, other):
+        return _unknown()
+
+    def __lt__(self, other):
+        return _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    def __str__(self):
+        return _unknown()
+
+    @property
+    def build(self):
+        return _unknown()
+
+    def bump(self, index):
+        return _unknown()
+
+    @property
+    def main(self):
+        return _unknown()
+
+    @property
+    def major(self):
+        return _unknown()
+
+    @property
+    def micro(self):
+        return _unknown()
+
+    @property
+    def minor(self):
+        return _unknown()
+
+    @property
+    def patch(self):
+        return _unknown()
+
+    @property
+    def pre(self):
+        return _unknown()
+
+    def upper_bound(self, index):
+        return _unknown()
@@ -0,0 +1,535 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conan.tools.build import cross_building
+from conans.errors import ConanException
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+CONTEXT_BUILD = 'build'
+
+
+class Apt(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = 'dpkg-query -W -f=\'${{Status}}\' {package} | grep -q "ok installed"'
+    install_command = '{sudo}{tool} install -y {recommends}{packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'apt-get'
+    update_command = '{sudo}{tool} update'
+
+    def __init__(self, conanfile, arch_names=None):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, packages, update=None, check=None, recommends=None):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class Brew(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = 'test -n "$({tool} ls --versions {package})"'
+    install_command = '{sudo}{tool} install {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'brew'
+    update_command = '{sudo}{tool} update'
+
+    def __init__(self, conanfile):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class Chocolatey(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = '{tool} search --local-only --exact {package} | findstr /c:"1 packages installed."'
+    install_command = '{tool} install --yes {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'choco'
+    update_command = '{tool} outdated'
+
+    def __init__(self, conanfile):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class PacMan(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = '{tool} -Qi {package}'
+    install_command = '{sudo}{tool} -S --noconfirm {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'pacman'
+    update_command = '{sudo}{tool} -Syyu --noconfirm'
+
+    def __init__(self, conanfile, arch_names=None):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class Pkg(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = '{tool} info {package}'
+    install_command = '{sudo}{tool} install -y {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'pkg'
+    update_command = '{sudo}{tool} update'
+
+    def __init__(self, conanfile):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class PkgUtil(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = 'test -n "`{tool} --list {package}`"'
+    install_command = '{sudo}{tool} --install --yes {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'pkgutil'
+    update_command = '{sudo}{tool} --catalog'
+
+    def __init__(self, conanfile):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class Yum(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = 'rpm -q {package}'
+    install_command = '{sudo}{tool} install -y {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'yum'
+    update_command = '{sudo}{tool} check-update -y'
+
+    def __init__(self, conanfile, arch_names=None):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class Zypper(object):
+    accepted_check_codes = _unknown()
+    accepted_install_codes = _unknown()
+    accepted_update_codes = _unknown()
+    check_command = 'rpm -q {package}'
+    install_command = '{sudo}{tool} --non-interactive in {packages}'
+    mode_check = 'check'
+    mode_install = 'install'
+    tool_name = 'zypper'
+    update_command = '{sudo}{tool} --non-interactive ref'
+
+    def __init__(self, conanfile):
+        self._active_tool = _unknown()
+        self._arch = _unknown()
+        self._arch_names = _unknown()
+        self._arch_separator = _unknown()
+        self._conanfile = _unknown()
+        self._mode = _unknown()
+        self._sudo = _unknown()
+        self._sudo_askpass = _unknown()
+
+    def _check(self, packages):
+        return _unknown()
+
+    def _conanfile_run(self, command, accepted_returns):
+        return _unknown()
+
+    def _install(self, packages, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _install_substitutes(self, *packages_substitutes, update=None, check=None, **kwargs):
+        return _unknown()
+
+    def _update(self):
+        return _unknown()
+
+    def check(self, *args, **kwargs):
+        return _unknown()
+
+    def check_package(self, package):
+        return _unknown()
+
+    def get_default_tool(self):
+        return _unknown()
+
+    def get_package_name(self, package):
+        return _unknown()
+
+    def install(self, *args, **kwargs):
+        return _unknown()
+
+    def install_substitutes(self, *args, **kwargs):
+        return _unknown()
+
+    def run(self, method, *args, **kwargs):
+        return _unknown()
+
+    @property
+    def sudo_str(self):
+        return _unknown()
+
+    def update(self, *args, **kwargs):
+        return _unknown()
+
+
+class Dnf(Yum):
+    tool_name = 'dnf'
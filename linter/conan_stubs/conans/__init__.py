@@ -0,0 +1,470 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conans.model.conan_file import ConanFile
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+CHECKSUM_DEPLOY = 'checksum_deploy'
+COMPLEX_SEARCH_CAPABILITY = 'complex_search'
+DEFAULT_REVISION_V1 = '0'
+MATRIX_PARAMS = 'matrix_params'
+OAUTH_TOKEN = 'oauth_token'
+ONLY_V2 = 'only_v2'
+REVISIONS = 'revisions'
+SERVER_CAPABILITIES = _unknown()
+__version__ = '1.64.1'
+
+
+def load(path, binary=None, encoding=None):
+    return _unknown()
+
+
+class AutoToolsBuildEnvironment(object):
+
+    def __init__(self, conanfile, win_bash=None, include_rpath_flags=None):
+        self._arch = _unknown()
+        self._arch_target = _unknown()
+        self._build_type = _unknown()
+        self._compiler = _unknown()
+        self._compiler_runtime = _unknown()
+        self._compiler_version = _unknown()
+        self._conanfile = _unknown()
+        self._cppstd = _unknown()
+        self._deps_cpp_info = _unknown()
+        self._include_rpath_flags = _unknown()
+        self._libcxx = _unknown()
+        self._os = _unknown()
+        self._os_sdk = _unknown()
+        self._os_subsystem = _unknown()
+        self._os_target = _unknown()
+        self._os_version = _unknown()
+        self._win_bash = _unknown()
+        self.build = _unknown()
+        self.cppstd_flag = _unknown()
+        self.cxx_flags = _unknown()
+        self.defines = _unknown()
+        self.flags = _unknown()
+        self.fpic = _unknown()
+        self.host = _unknown()
+        self.include_paths = _unknown()
+        self.library_paths = _unknown()
+        self.libs = _unknown()
+        self.link_flags = _unknown()
+        self.subsystem = _unknown()
+        self.target = _unknown()
+
+    def _adjust_path(self, path):
+        return _unknown()
+
+    def _configure_cxx_flags(self):
+        return _unknown()
+
+    def _configure_defines(self):
+        return _unknown()
+
+    def _configure_flags(self):
+        return _unknown()
+
+    def _configure_fpic(self):
+        return _unknown()
+
+    def _configure_help_output(self, configure_path):
+        return _unknown()
+
+    def _configure_link_flags(self):
+        return _unknown()
+
+    def _get_host_build_target_flags(self):
+        return _unknown()
+
+    def _get_vars(self):
+        return _unknown()
+
+    @staticmethod
+    def _is_flag_in_args(varname, args):
+        return _unknown()
+
+    @staticmethod
+    def _valid_configure_flag(varname, args, available_flags):
+        return _unknown()
+
+    def configure(self, configure_dir=None, args=None, build=None, host=None, target=None, pkg_config_paths=None, vars=None, use_default_install_dirs=None):
+        return _unknown()
+
+    def install(self, args=None, make_program=None, vars=None):
+        return _unknown()
+
+    def make(self, args=None, make_program=None, target=None, vars=None):
+        return _unknown()
+
+    @property
+    def vars(self):
+        return _unknown()
+
+    @property
+    def vars_dict(self):
+        return _unknown()
+
+
+class CMake(object):
+
+    def __init__(self, conanfile, generator=None, cmake_system_name=None, parallel=None, build_type=None, toolset=None, make_program=None, set_cmake_flags=None, msbuild_verbosity=None, cmake_program=None, generator_platform=None, append_vcvars=None):
+        self._append_vcvars = _unknown()
+        self._build_type = _unknown()
+        self._cmake_program = _unknown()
+        self._conanfile = _unknown()
+        self._generator = _unknown()
+        self._generator_platform = _unknown()
+        self._generator_platform_is_assigned = _unknown()
+        self._settings = _unknown()
+        self.build_dir = _unknown()
+        self.definitions = _unknown()
+        self.msbuild_verbosity = _unknown()
+        self.parallel = _unknown()
+        self.toolset = _unknown()
+
+    def _build(self, args=None, build_dir=None, target=None):
+        return _unknown()
+
+    def _get_dirs(self, source_folder, build_folder, source_dir, build_dir, cache_build_folder):
+        return _unknown()
+
+    def _run(self, command):
+        return _unknown()
+
+    def build(self, args=None, build_dir=None, target=None):
+        return _unknown()
+
+    @property
+    def build_config(self):
+        return _unknown()
+
+    @property
+    def build_folder(self):
+        return _unknown()
+
+    @property
+    def build_type(self):
+        return _unknown()
+
+    @property
+    def command_line(self):
+        return _unknown()
+
+    def configure(self, args=None, defs=None, source_dir=None, build_dir=None, source_folder=None, build_folder=None, cache_build_folder=None, pkg_config_paths=None):
+        return _unknown()
+
+    @property
+    def flags(self):
+        return _unknown()
+
+    @property
+    def generator(self):
+        return _unknown()
+
+    @property
+    def generator_platform(self):
+        return _unknown()
+
+    @staticmethod
+    def get_version():
+        return _unknown()
+
+    @property
+    def in_local_cache(self):
+        return _unknown()
+
+    def install(self, args=None, build_dir=None):
+        return _unknown()
+
+    @property
+    def is_multi_configuration(self):
+        return _unknown()
+
+    def patch_config_paths(self):
+        return _unknown()
+
+    @property
+    def runtime(self):
+        return _unknown()
+
+    def test(self, args=None, build_dir=None, target=None, output_on_failure=None):
+        return _unknown()
+
+    @property
+    def verbose(self):
+        return _unknown()
+
+
+class MSBuild(object):
+
+    def __init__(self, conanfile):
+        self._conanfile = _unknown()
+        self._output = _unknown()
+        self._settings = _unknown()
+        self.build_env = _unknown()
+
+    def _get_props_file_contents(self, definitions=None):
+        return _unknown()
+
+    def build(self, project_file, targets=None, upgrade_project=None, build_type=None, arch=None, parallel=None, force_vcvars=None, toolset=None, platforms=None, use_env=None, vcvars_ver=None, winsdk_version=None, properties=None, output_binary_log=None, property_file_name=None, verbosity=None, definitions=None, user_property_file_name=None):
+        return _unknown()
+
+    def get_command(self, project_file, props_file_path=None, targets=None, upgrade_project=None, build_type=None, arch=None, parallel=None, toolset=None, platforms=None, use_env=None, properties=None, output_binary_log=None, verbosity=None, user_property_file_name=None):
+        return _unknown()
+
+    @staticmethod
+    def get_version(settings):
+        return _unknown()
+
+
+class Meson(object):
+
+    def __init__(self, conanfile, backend=None, build_type=None, append_vcvars=None):
+        self._append_vcvars = _unknown()
+        self._build_type = _unknown()
+        self._compiler = _unknown()
+        self._compiler_version = _unknown()
+        self._conanfile = _unknown()
+        self._os = _unknown()
+        self._settings = _unknown()
+        self.backend = _unknown()
+        self.build_dir = _unknown()
+        self.options = _unknown()
+
+    def _get_dirs(self, source_folder, build_folder, source_dir, build_dir, cache_build_folder):
+        return _unknown()
+
+    def _run(self, command):
+        return _unknown()
+
+    def _run_meson_command(self, subcommand=None, args=None, build_dir=None):
+        return _unknown()
+
+    def _run_meson_targets(self, args=None, build_dir=None, targets=None):
+        return _unknown()
+
+    def _so(self, setname):
+        return _unknown()
+
+    def _ss(self, setname):
+        return _unknown()
+
+    @property
+    def _vcvars_needed(self):
+        return _unknown()
+
+    def build(self, args=None, build_dir=None, targets=None):
+        return _unknown()
+
+    @property
+    def build_folder(self):
+        return _unknown()
+
+    @property
+    def build_type(self):
+        return _unknown()
+
+    def configure(self, args=None, defs=None, source_dir=None, build_dir=None, pkg_config_paths=None, cache_build_folder=None, build_folder=None, source_folder=None):
+        return _unknown()
+
+    @property
+    def flags(self):
+        return _unknown()
+
+    @staticmethod
+    def get_version():
+        return _unknown()
+
+    def install(self, args=None, build_dir=None):
+        return _unknown()
+
+    def meson_install(self, args=None, build_dir=None):
+        return _unknown()
+
+    def meson_test(self, args=None, build_dir=None):
+        return _unknown()
+
+    def test(self, args=None, build_dir=None, targets=None):
+        return _unknown()
+
+
+class Options(object):
+
+    def __contains__(self, option):
+        return _unknown()
+
+    def __delattr__(self, field):
+        return _unknown()
+
+    def __getattr__(self, attr):
+        return _unknown()
+
+    def __getitem__(self, item):
+        return _unknown()
+
+    def __init__(self, options):
+        self._deps_package_values = _unknown()
+        self._package_options = _unknown()
+
+    def __setattr__(self, attr, value):
+        return _unknown()
+
+    def clear(self):
+        return _unknown()
+
+    def clear_unused(self, prefs):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    @property
+    def deps_package_values(self):
+        return _unknown()
+
+    def freeze(self):
+        return _unknown()
+
+    def initialize_upstream(self, user_values, name=None):
+        return _unknown()
+
+    def propagate_downstream(self, ref, options):
+        return _unknown()
+
+    def propagate_upstream(self, down_package_values, down_ref, own_ref):
+        return _unknown()
+
+    def rm_safe(self, field):
+        return _unknown()
+
+    def validate(self):
+        return _unknown()
+
+    @property
+    def values(self):
+        return _unknown()
+
+
+class RunEnvironment(object):
+
+    def __init__(self, conanfile):
+        self.conanfile = _unknown()
+
+    @property
+    def vars(self):
+        return _unknown()
+
+
+class Settings(object):
+
+    def __delattr__(self, field):
+        return _unknown()
+
+    def __getattr__(self, field):
+        return _unknown()
+
+    def __init__(self, definition=None, name=None, parent_value=None):
+        self._data = _unknown()
+        self._name = _unknown()
+        self._parent_value = _unknown()
+
+    def __setattr__(self, field, value):
+        return _unknown()
+
+    def _check_field(self, field):
+        return _unknown()
+
+    def clear(self):
+        return _unknown()
+
+    def constraint(self, constraint_def):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    def copy_values(self):
+        return _unknown()
+
+    @property
+    def fields(self):
+        return _unknown()
+
+    def get_safe(self, name, default=None):
+        return _unknown()
+
+    def items(self):
+        return _unknown()
+
+    def iteritems(self):
+        return _unknown()
+
+    @staticmethod
+    def loads(text):
+        return _unknown()
+
+    def remove(self, item):
+        return _unknown()
+
+    def rm_safe(self, name):
+        return _unknown()
+
+    def update_values(self, vals):
+        return _unknown()
+
+    def validate(self):
+        return _unknown()
+
+    @property
+    def values(self):
+        return _unknown()
+
+    @property
+    def values_list(self):
+        return _unknown()
+
+
+class VisualStudioBuildEnvironment(object):
+
+    def __init__(self, conanfile, with_build_type_flags=None):
+        self._conanfile = _unknown()
+        self._deps_cpp_info = _unknown()
+        self._runtime = _unknown()
+        self._settings = _unknown()
+        self._with_build_type_flags = _unknown()
+        self.cxx_flags = _unknown()
+        self.defines = _unknown()
+        self.flags = _unknown()
+        self.include_paths = _unknown()
+        self.lib_paths = _unknown()
+        self.libs = _unknown()
+        self.link_flags = _unknown()
+        self.parallel = _unknown()
+        self.std = _unknown()
+
+    def _configure_flags(self):
+        return _unknown()
+
+    def _configure_link_flags(self):
+        return _unknown()
+
+    def _get_cl_list(self, quotes=None):
+        return _unknown()
+
+    def _get_link_list(self):
+        return _unknown()
+
+    def _std_cpp(self):
+        return _unknown()
+
+    @property
+    def vars(self):
+        return _unknown()
+
+    @property
+    def vars_dict(self):
+        return _unknown()
@@ -0,0 +1,142 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+EXCEPTION_CODE_MAPPING = _unknown()
+
+
+def conanfile_exception_formatter(conanfile_name, func_name):
+    return _unknown()
+
+
+def decode_text(text, encoding=None):
+    return _unknown()
+
+
+def get_env(env_key, default=None, environment=None):
+    return _unknown()
+
+
+class ConanException(Exception):
+
+    def __init__(self, *args, **kwargs):
+        self.info = _unknown()
+        self.remote = _unknown()
+
+    def __str__(self):
+        return _unknown()
+
+    def remote_message(self):
+        return _unknown()
+
+
+class AuthenticationException(ConanException):
+    pass
+
+
+class ConanConnectionError(ConanException):
+    pass
+
+
+class ConanExceptionInUserConanfileMethod(ConanException):
+    pass
+
+
+class ConanInvalidSystemRequirements(ConanException):
+    pass
+
+
+class ConanMigrationError(ConanException):
+    pass
+
+
+class ConanOutdatedClient(ConanException):
+    pass
+
+
+class ConanV2Exception(ConanException):
+
+    def __str__(self):
+        return _unknown()
+
+
+class ForbiddenException(ConanException):
+    pass
+
+
+class InternalErrorException(ConanException):
+    pass
+
+
+class InvalidNameException(ConanException):
+    pass
+
+
+class NoRemoteAvailable(ConanException):
+    pass
+
+
+class NoRestV2Available(ConanException):
+    pass
+
+
+class NotFoundException(ConanException):
+
+    def __init__(self, *args, **kwargs):
+        self.remote = _unknown()
+
+
+class OnlyV2Available(ConanException):
+
+    def __init__(self, remote_url):
+        pass
+
+
+class RequestErrorException(ConanException):
+    pass
+
+
+class CalledProcessErrorWithStderr(Exception):
+
+    def __init__(self, returncode, cmd, output=None, stderr=None):
+        self.cmd = _unknown()
+        self.output = _unknown()
+        self.returncode = _unknown()
+        self.stderr = _unknown()
+
+    def __str__(self):
+        return _unknown()
+
+    @property
+    def stdout(self):
+        return _unknown()
+
+
+class ConanInvalidConfiguration(ConanExceptionInUserConanfileMethod):
+    pass
+
+
+class PackageNotFoundException(NotFoundException):
+
+    def __init__(self, pref, remote=None, print_rev=None):
+        self.pref = _unknown()
+        self.print_rev = _unknown()
+
+    def __str__(self):
+        return _unknown()
+
+
+class RecipeNotFoundException(NotFoundException):
+
+    def __init__(self, ref, remote=None, print_rev=None):
+        self.print_rev = _unknown()
+        self.ref = _unknown()
+
+    def __str__(self):
+        return _unknown()
+
+
+class UserInterfaceErrorException(RequestErrorException):
+    pass
@@ -0,0 +1,54 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+class Generator(object):
+    __abstractmethods__ = _unknown()
+    _abc_impl = _unknown()
+    name = None
+
+    def __init__(self, conanfile):
+        self._deps_build_info = _unknown()
+        self._deps_env_info = _unknown()
+        self._deps_user_info = _unknown()
+        self._env_info = _unknown()
+        self._user_info_build = _unknown()
+        self.conanfile = _unknown()
+        self.normalize = _unknown()
+
+    @classmethod
+    def _get_name(cls, obj):
+        return _unknown()
+
+    @property
+    def content(self):
+        return _unknown()
+
+    @property
+    def deps_build_info(self):
+        return _unknown()
+
+    @property
+    def deps_env_info(self):
+        return _unknown()
+
+    @property
+    def deps_user_info(self):
+        return _unknown()
+
+    @property
+    def env_info(self):
+        return _unknown()
+
+    @property
+    def filename(self):
+        return _unknown()
+
+    def get_public_deps(self, cpp_info):
+        return _unknown()
+
+    @property
+    def settings(self):
+        return _unknown()
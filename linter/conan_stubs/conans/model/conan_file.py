@@ -0,0 +1,1061 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conans import Options
+from conans.errors import ConanException
+from conans.errors import ConanInvalidConfiguration
+from conans.tools import ConanOutput
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+RUN_LOG_NAME = 'conan_run.log'
+string_types = _unknown()
+
+
+def command_env_wrapper(conanfile, command, envfiles, envfiles_folder, scope=None):
+    return _unknown()
+
+
+def conan_v2_error(msg, condition=None):
+    return _unknown()
+
+
+def create_options(conanfile):
+    return _unknown()
+
+
+def create_requirements(conanfile):
+    return _unknown()
+
+
+def create_settings(conanfile, settings):
+    return _unknown()
+
+
+def environment_append(env_vars):
+    return _unknown()
+
+
+def from_old_cppinfo(old):
+    return _unknown()
+
+
+def get_env_context_manager(conanfile, without_python=None):
+    return _unknown()
+
+
+def no_op():
+    return _unknown()
+
+
+def pythonpath(conanfile):
+    return _unknown()
+
+
+class ConanFile(object):
+    apply_env = True
+    author = None
+    build_policy = None
+    default_channel = None
+    default_options = None
+    default_user = None
+    deprecated = None
+    description = None
+    develop = False
+    exports = None
+    exports_sources = None
+    folders = None
+    generators = _unknown()
+    homepage = None
+    in_local_cache = True
+    license = None
+    name = None
+    options = None
+    patterns = None
+    provides = None
+    revision_mode = 'hash'
+    settings = None
+    short_paths = False
+    should_build = True
+    should_configure = True
+    should_install = True
+    should_test = True
+    tested_reference_str = None
+    topics = None
+    upload_policy = None
+    url = None
+    version = None
+    win_bash = None
+    win_bash_run = None
+
+    def __init__(self, output, runner, display_name=None, user=None, channel=None):
+        self._conan_buildenv = _unknown()
+        self._conan_channel = _unknown()
+        self._conan_dep_cpp_info = _unknown()
+        self._conan_dependencies = _unknown()
+        self._conan_env_values = _unknown()
+        self._conan_new_cpp_info = _unknown()
+        self._conan_node = _unknown()
+        self._conan_requester = _unknown()
+        self._conan_runenv = _unknown()
+        self._conan_runner = _unknown()
+        self._conan_user = _unknown()
+        self._conan_using_build_profile = _unknown()
+        self.buildenv_info = _unknown()
+        self.compatible_packages = _unknown()
+        self.conf_info = _unknown()
+        self.cpp = _unknown()
+        self.cpp_info = _unknown()
+        self.deps_cpp_info = _unknown()
+        self.deps_env_info = _unknown()
+        self.deps_user_info = _unknown()
+        self.display_name = _unknown()
+        self.env_info = _unknown()
+        self.env_scripts = _unknown()
+        self.folders = _unknown()
+        self.generators = _unknown()
+        self.layouts = _unknown()
+        self.options = _unknown()
+        self.output = _unknown()
+        self.requires = _unknown()
+        self.runenv_info = _unknown()
+        self.settings = _unknown()
+        self.user_info = _unknown()
+        self.virtualbuildenv = _unknown()
+        self.virtualrunenv = _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    def build(self):
+        return _unknown()
+
+    @property
+    def build_folder(self):
+        return _unknown()
+
+    @property
+    def build_path(self):
+        return _unknown()
+
+    @property
+    def build_policy_always(self):
+        return _unknown()
+
+    @property
+    def build_policy_missing(self):
+        return _unknown()
+
+    @property
+    def buildenv(self):
+        return _unknown()
+
+    @property
+    def channel(self):
+        return _unknown()
+
+    def collect_libs(self, folder=None):
+        return _unknown()
+
+    def config_options(self):
+        return _unknown()
+
+    def configure(self):
+        return _unknown()
+
+    @property
+    def context(self):
+        return _unknown()
+
+    @property
+    def dependencies(self):
+        return _unknown()
+
+    @property
+    def env(self):
+        return _unknown()
+
+    @property
+    def export_folder(self):
+        return _unknown()
+
+    @property
+    def export_path(self):
+        return _unknown()
+
+    @property
+    def export_sources_folder(self):
+        return _unknown()
+
+    @property
+    def export_sources_path(self):
+        return _unknown()
+
+    @property
+    def generators_folder(self):
+        return _unknown()
+
+    @property
+    def generators_path(self):
+        return _unknown()
+
+    @property
+    def imports_folder(self):
+        return _unknown()
+
+    def initialize(self, settings, env, buildenv=None, runenv=None):
+        return _unknown()
+
+    @property
+    def install_folder(self):
+        return _unknown()
+
+    @property
+    def new_cpp_info(self):
+        return _unknown()
+
+    def package(self):
+        return _unknown()
+
+    @property
+    def package_folder(self):
+        return _unknown()
+
+    def package_id(self):
+        return _unknown()
+
+    def package_info(self):
+        return _unknown()
+
+    @property
+    def package_path(self):
+        return _unknown()
+
+    @property
+    def pref(self):
+        return _unknown()
+
+    @property
+    def ref(self):
+        return _unknown()
+
+    def run(self, command, output=None, cwd=None, win_bash=None, subsystem=None, msys_mingw=None, ignore_errors=None, run_environment=None, with_login=None, env=None, scope=None):
+        return _unknown()
+
+    @property
+    def runenv(self):
+        return _unknown()
+
+    def source(self):
+        return _unknown()
+
+    @property
+    def source_folder(self):
+        return _unknown()
+
+    @property
+    def source_path(self):
+        return _unknown()
+
+    def system_requirements(self):
+        return _unknown()
+
+    def test(self):
+        return _unknown()
+
+    @property
+    def user(self):
+        return _unknown()
+
+
+class Conf(object):
+    __hash__ = None
+    boolean_false_expressions = _unknown()
+
+    def __bool__(self):
+        return _unknown()
+
+    def __delitem__(self, name):
+        return _unknown()
+
+    def __eq__(self, other):
+        return _unknown()
+
+    def __getitem__(self, name):
+        return _unknown()
+
+    def __init__(self):
+        self._values = _unknown()
+
+    def __ne__(self, other):
+        return _unknown()
+
+    def __nonzero__(self):
+        return _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    def __setitem__(self, name, value):
+        return _unknown()
+
+    @staticmethod
+    def _get_boolean_value(value):
+        return _unknown()
+
+    @staticmethod
+    def _validate_lower_case(name):
+        return _unknown()
+
+    def append(self, name, value):
+        return _unknown()
+
+    def append_path(self, name, value):
+        return _unknown()
+
+    def compose_conf(self, other):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    def define(self, name, value):
+        return _unknown()
+
+    def define_path(self, name, value):
+        return _unknown()
+
+    def dumps(self):
+        return _unknown()
+
+    def filter_user_modules(self):
+        return _unknown()
+
+    def get(self, conf_name, default=None, check_type=None):
+        return _unknown()
+
+    def items(self):
+        return _unknown()
+
+    def pop(self, conf_name, default=None):
+        return _unknown()
+
+    def prepend(self, name, value):
+        return _unknown()
+
+    def prepend_path(self, name, value):
+        return _unknown()
+
+    def remove(self, name, value):
+        return _unknown()
+
+    def set_relative_base_folder(self, folder):
+        return _unknown()
+
+    @property
+    def sha(self):
+        return _unknown()
+
+    def unset(self, name):
+        return _unknown()
+
+    def update(self, name, value):
+        return _unknown()
+
+    def update_path(self, name, value):
+        return _unknown()
+
+
+class Folders(object):
+
+    def __init__(self):
+        self._base_build = _unknown()
+        self._base_export = _unknown()
+        self._base_export_sources = _unknown()
+        self._base_generators = _unknown()
+        self._base_imports = _unknown()
+        self._base_install = _unknown()
+        self._base_package = _unknown()
+        self._base_source = _unknown()
+        self.build = _unknown()
+        self.generators = _unknown()
+        self.imports = _unknown()
+        self.package = _unknown()
+        self.root = _unknown()
+        self.source = _unknown()
+        self.subproject = _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    @property
+    def base_build(self):
+        return _unknown()
+
+    @property
+    def base_export(self):
+        return _unknown()
+
+    @property
+    def base_export_sources(self):
+        return _unknown()
+
+    @property
+    def base_imports(self):
+        return _unknown()
+
+    @property
+    def base_install(self):
+        return _unknown()
+
+    @property
+    def base_package(self):
+        return _unknown()
+
+    @property
+    def base_source(self):
+        return _unknown()
+
+    @property
+    def build_folder(self):
+        return _unknown()
+
+    @property
+    def generators_folder(self):
+        return _unknown()
+
+    @property
+    def imports_folder(self):
+        return _unknown()
+
+    @property
+    def package_folder(self):
+        return _unknown()
+
+    def set_base_build(self, folder):
+        return _unknown()
+
+    def set_base_export(self, folder):
+        return _unknown()
+
+    def set_base_export_sources(self, folder):
+        return _unknown()
+
+    def set_base_folders(self, conanfile_folder, output_folder):
+        return _unknown()
+
+    def set_base_generators(self, folder):
+        return _unknown()
+
+    def set_base_imports(self, folder):
+        return _unknown()
+
+    def set_base_install(self, folder):
+        return _unknown()
+
+    def set_base_package(self, folder):
+        return _unknown()
+
+    def set_base_source(self, folder):
+        return _unknown()
+
+    @property
+    def source_folder(self):
+        return _unknown()
+
+
+class Infos(object):
+
+    def __init__(self):
+        self.build = _unknown()
+        self.package = _unknown()
+        self.source = _unknown()
+
+
+class Layouts(object):
+
+    def __init__(self):
+        self.build = _unknown()
+        self.package = _unknown()
+        self.source = _unknown()
+
+
+class OSInfo(object):
+
+    def __init__(self):
+        self.is_aix = _unknown()
+        self.is_cygwin = _unknown()
+        self.is_freebsd = _unknown()
+        self.is_linux = _unknown()
+        self.is_macos = _unknown()
+        self.is_msys = _unknown()
+        self.is_posix = _unknown()
+        self.is_solaris = _unknown()
+        self.is_windows = _unknown()
+        self.linux_distro = _unknown()
+        self.os_version = _unknown()
+        self.os_version_name = _unknown()
+
+    def _get_linux_distro_info(self):
+        return _unknown()
+
+    @staticmethod
+    def bash_path():
+        return _unknown()
+
+    @staticmethod
+    def detect_windows_subsystem():
+        return _unknown()
+
+    @staticmethod
+    def get_aix_architecture():
+        return _unknown()
+
+    @staticmethod
+    def get_aix_conf(options=None):
+        return _unknown()
+
+    @staticmethod
+    def get_aix_version():
+        return _unknown()
+
+    @staticmethod
+    def get_debian_version_name(version):
+        return _unknown()
+
+    @staticmethod
+    def get_e2k_architecture():
+        return _unknown()
+
+    @staticmethod
+    def get_freebsd_version():
+        return _unknown()
+
+    @staticmethod
+    def get_osx_version_name(version):
+        return _unknown()
+
+    @staticmethod
+    def get_solaris_architecture():
+        return _unknown()
+
+    @staticmethod
+    def get_solaris_version_name(version):
+        return _unknown()
+
+    @staticmethod
+    def get_win_os_version():
+        return _unknown()
+
+    @staticmethod
+    def get_win_version_name(version):
+        return _unknown()
+
+    @staticmethod
+    def uname(options=None):
+        return _unknown()
+
+    @property
+    def with_apt(self):
+        return _unknown()
+
+    @property
+    def with_dnf(self):
+        return _unknown()
+
+    @property
+    def with_pacman(self):
+        return _unknown()
+
+    @property
+    def with_yum(self):
+        return _unknown()
+
+    @property
+    def with_zypper(self):
+        return _unknown()
+
+
+class OptionsValues(object):
+    __hash__ = None
+
+    def __contains__(self, item):
+        return _unknown()
+
+    def __delattr__(self, attr):
+        return _unknown()
+
+    def __eq__(self, other):
+        return _unknown()
+
+    def __getattr__(self, attr):
+        return _unknown()
+
+    def __getitem__(self, item):
+        return _unknown()
+
+    def __init__(self, values=None):
+        self._package_values = _unknown()
+        self._reqs_options = _unknown()
+
+    def __ne__(self, other):
+        return _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    def __setattr__(self, attr, value):
+        return _unknown()
+
+    def __setitem__(self, item, value):
+        return _unknown()
+
+    def as_list(self):
+        return _unknown()
+
+    def clear(self):
+        return _unknown()
+
+    def clear_indirect(self):
+        return _unknown()
+
+    def clear_unscoped_options(self):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    def descope_options(self, name):
+        return _unknown()
+
+    def dumps(self):
+        return _unknown()
+
+    def filter_used(self, used_pkg_names):
+        return _unknown()
+
+    def get_safe(self, attr):
+        return _unknown()
+
+    @staticmethod
+    def loads(text):
+        return _unknown()
+
+    def pop(self, item):
+        return _unknown()
+
+    def remove(self, name, package=None):
+        return _unknown()
+
+    def rm_safe(self, attr):
+        return _unknown()
+
+    def scope_options(self, name):
+        return _unknown()
+
+    def serialize(self):
+        return _unknown()
+
+    @property
+    def sha(self):
+        return _unknown()
+
+    def update(self, other):
+        return _unknown()
+
+
+class PackageOptions(object):
+
+    def __contains__(self, option):
+        return _unknown()
+
+    def __delattr__(self, field):
+        return _unknown()
+
+    def __getattr__(self, field):
+        return _unknown()
+
+    def __init__(self, definition):
+        self._data = _unknown()
+        self._freeze = _unknown()
+        self._modified = _unknown()
+
+    def __setattr__(self, field, value):
+        return _unknown()
+
+    def _ensure_exists(self, field):
+        return _unknown()
+
+    def _items(self):
+        return _unknown()
+
+    def clear(self):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    @property
+    def fields(self):
+        return _unknown()
+
+    def freeze(self):
+        return _unknown()
+
+    def get_safe(self, field, default=None):
+        return _unknown()
+
+    def initialize_patterns(self, values):
+        return _unknown()
+
+    def items(self):
+        return _unknown()
+
+    def iteritems(self):
+        return _unknown()
+
+    @staticmethod
+    def loads(text):
+        return _unknown()
+
+    def propagate_upstream(self, package_values, down_ref, own_ref, pattern_options):
+        return _unknown()
+
+    def remove(self, item):
+        return _unknown()
+
+    def rm_safe(self, field):
+        return _unknown()
+
+    def validate(self):
+        return _unknown()
+
+    @property
+    def values(self):
+        return _unknown()
+
+
+class ConanFileDependencies(object):
+
+    def __bool__(self):
+        return _unknown()
+
+    def __delitem__(self, name):
+        return _unknown()
+
+    def __getitem__(self, name):
+        return _unknown()
+
+    def __init__(self, data, require_filter=None):
+        self._data = _unknown()
+        self._require_filter = _unknown()
+
+    def __nonzero__(self):
+        return _unknown()
+
+    def _get_require(self, ref, **kwargs):
+        return _unknown()
+
+    @property
+    def build(self):
+        return _unknown()
+
+    @property
+    def direct_build(self):
+        return _unknown()
+
+    @property
+    def direct_host(self):
+        return _unknown()
+
+    def filter(self, require_filter):
+        return _unknown()
+
+    @staticmethod
+    def from_node(node):
+        return _unknown()
+
+    def get(self, ref, **kwargs):
+        return _unknown()
+
+    @property
+    def host(self):
+        return _unknown()
+
+    def items(self):
+        return _unknown()
+
+    @property
+    def test(self):
+        return _unknown()
+
+    @property
+    def topological_sort(self):
+        return _unknown()
+
+    def values(self):
+        return _unknown()
+
+
+class DepsEnvInfo(object):
+
+    def __getattr__(self, name):
+        return _unknown()
+
+    def __getitem__(self, item):
+        return _unknown()
+
+    def __init__(self):
+        self._dependencies_ = _unknown()
+        self._values_ = _unknown()
+
+    def __setattr__(self, name, value):
+        return _unknown()
+
+    @staticmethod
+    def _adjust_casing(name):
+        return _unknown()
+
+    @property
+    def dependencies(self):
+        return _unknown()
+
+    @property
+    def deps(self):
+        return _unknown()
+
+    def dumps(self):
+        return _unknown()
+
+    @staticmethod
+    def loads(text):
+        return _unknown()
+
+    def update(self, dep_env_info, pkg_name):
+        return _unknown()
+
+    def update_deps_env_info(self, dep_env_info):
+        return _unknown()
+
+    @property
+    def vars(self):
+        return _unknown()
+
+
+class ScopedOutput(ConanOutput):
+
+    def __init__(self, scope, output):
+        self._color = _unknown()
+        self._stream = _unknown()
+        self._stream_err = _unknown()
+        self.scope = _unknown()
+
+    def write(self, data, front=None, back=None, newline=None, error=None):
+        return _unknown()
+
+
+class DepsCppInfo(object):
+
+    def __getattr__(self, config):
+        return _unknown()
+
+    def __getitem__(self, item):
+        return _unknown()
+
+    def __init__(self):
+        self._bin_paths = _unknown()
+        self._build_modules = _unknown()
+        self._build_modules_paths = _unknown()
+        self._build_paths = _unknown()
+        self._configs = _unknown()
+        self._dependencies = _unknown()
+        self._framework_paths = _unknown()
+        self._generator_properties = _unknown()
+        self._include_paths = _unknown()
+        self._lib_paths = _unknown()
+        self._name = _unknown()
+        self._res_paths = _unknown()
+        self._src_paths = _unknown()
+        self.bindirs = _unknown()
+        self.build_modules = _unknown()
+        self.builddirs = _unknown()
+        self.cflags = _unknown()
+        self.cxxflags = _unknown()
+        self.defines = _unknown()
+        self.description = _unknown()
+        self.exelinkflags = _unknown()
+        self.filenames = _unknown()
+        self.filter_empty = _unknown()
+        self.frameworkdirs = _unknown()
+        self.frameworks = _unknown()
+        self.includedirs = _unknown()
+        self.libdirs = _unknown()
+        self.libs = _unknown()
+        self.names = _unknown()
+        self.objects = _unknown()
+        self.requires = _unknown()
+        self.resdirs = _unknown()
+        self.rootpath = _unknown()
+        self.rootpaths = _unknown()
+        self.sharedlinkflags = _unknown()
+        self.srcdirs = _unknown()
+        self.sysroot = _unknown()
+        self.system_libs = _unknown()
+        self.version = _unknown()
+
+    def _filter_paths(self, paths):
+        return _unknown()
+
+    def add(self, pkg_name, cpp_info):
+        return _unknown()
+
+    @property
+    def bin_paths(self):
+        return _unknown()
+
+    @property
+    def build_modules_paths(self):
+        return _unknown()
+
+    @property
+    def build_paths(self):
+        return _unknown()
+
+    @property
+    def configs(self):
+        return _unknown()
+
+    @property
+    def cppflags(self):
+        return _unknown()
+
+    @property
+    def dependencies(self):
+        return _unknown()
+
+    @property
+    def deps(self):
+        return _unknown()
+
+    @property
+    def framework_paths(self):
+        return _unknown()
+
+    def get_build_modules(self):
+        return _unknown()
+
+    def get_cppflags(self):
+        return _unknown()
+
+    def get_filename(self, generator, default_name=None):
+        return _unknown()
+
+    def get_name(self, generator, default_name=None):
+        return _unknown()
+
+    def get_property(self, property_name):
+        return _unknown()
+
+    @property
+    def include_paths(self):
+        return _unknown()
+
+    @property
+    def lib_paths(self):
+        return _unknown()
+
+    @property
+    def name(self):
+        return _unknown()
+
+    @property
+    def res_paths(self):
+        return _unknown()
+
+    def set_cppflags(self, value):
+        return _unknown()
+
+    def set_property(self, property_name, value):
+        return _unknown()
+
+    @property
+    def src_paths(self):
+        return _unknown()
+
+    def update(self, dep_cpp_info):
+        return _unknown()
+
+
+class DepsUserInfo(dict):
+    __class_getitem__ = _unknown()
+    __copy__ = _unknown()
+    __getattribute__ = _unknown()
+    __missing__ = _unknown()
+    __or__ = _unknown()
+    __reduce__ = _unknown()
+    __repr__ = _unknown()
+    __ror__ = _unknown()
+    copy = _unknown()
+    default_factory = _unknown()
+
+    def __init__(self):
+        pass
+
+
+class Requirements(dict):
+    __delitem__ = _unknown()
+    __eq__ = _unknown()
+    __ge__ = _unknown()
+    __gt__ = _unknown()
+    __hash__ = None
+    __ior__ = _unknown()
+    __iter__ = _unknown()
+    __le__ = _unknown()
+    __lt__ = _unknown()
+    __ne__ = _unknown()
+    __or__ = _unknown()
+    __reduce__ = _unknown()
+    __reversed__ = _unknown()
+    __ror__ = _unknown()
+    __setitem__ = _unknown()
+    __sizeof__ = _unknown()
+    clear = _unknown()
+    fromkeys = _unknown()
+    items = _unknown()
+    keys = _unknown()
+    move_to_end = _unknown()
+    pop = _unknown()
+    popitem = _unknown()
+    setdefault = _unknown()
+    values = _unknown()
+
+    def __call__(self, reference, private=None, override=None, **kwargs):
+        return _unknown()
+
+    def __init__(self, *args):
+        self.__hardroot = _unknown()
+        self.__map = _unknown()
+        self.__root = _unknown()
+
+    def __repr__(self):
+        return _unknown()
+
+    def add(self, reference, private=None, override=None):
+        return _unknown()
+
+    def add_ref(self, ref, private=None, override=None):
+        return _unknown()
+
+    def copy(self):
+        return _unknown()
+
+    def iteritems(self):
+        return _unknown()
+
+    def override(self, ref):
+        return _unknown()
+
+    def update(self, down_reqs, output, own_ref, down_ref):
+        return _unknown()
@@ -0,0 +1,71 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+def _unknown():
+    raise NotImplementedError
+
+
+class Version(str):
+    version_pattern = _unknown()
+
+    def __cmp__(self, other):
+        return _unknown()
+
+    def __eq__(self, other):
+        return _unknown()
+
+    def __ge__(self, other):
+        return _unknown()
+
+    def __gt__(self, other):
+        return _unknown()
+
+    def __hash__(self):
+        return _unknown()
+
+    def __init__(self, *args, **kwargs):
+        self._base = _unknown()
+        self._build = _unknown()
+        self._cached_list = _unknown()
+
+    def __le__(self, other):
+        return _unknown()
+
+    def __lt__(self, other):
+        return _unknown()
+
+    def __ne__(self, other):
+        return _unknown()
+
+    @staticmethod
+    def __new__(cls, content):
+        return _unknown()
+
+    @property
+    def as_list(self):
+        return _unknown()
+
+    @property
+    def base(self):
+        return _unknown()
+
+    @property
+    def build(self):
+        return _unknown()
+
+    def compatible(self, other):
+        return _unknown()
+
+    def major(self, fill=None):
+        return _unknown()
+
+    def minor(self, fill=None):
+        return _unknown()
+
+    def patch(self):
+        return _unknown()
+
+    def pre(self):
+        return _unknown()
+
+    def stable(self):
+        return _unknown()
@@ -0,0 +1,1006 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from conans import RunEnvironment
+from conans import load
+from conans.errors import ConanException
+from conans.errors import ConanInvalidConfiguration
+from conans.errors import decode_text
+from conans.errors import get_env
+from conans.model.conan_file import OSInfo
+from conans.model.conan_file import environment_append
+from conans.model.conan_file import no_op
+from conans.model.conan_file import pythonpath
+
+
+def _unknown():
+    raise NotImplementedError
+
+
+CYGWIN = 'cygwin'
+INTEL_YEAR = _unknown()
+MSVS_YEAR = _unknown()
+MSYS = 'msys'
+MSYS2 = 'msys2'
+SFU = 'sfu'
+WSL = 'wsl'
+logger = _unknown()
+os_info = _unknown()
+
+
+def apple_deployment_target_env(os_, os_version):
+    return _unknown()
+
+
+def apple_deployment_target_flag(os_, os_version, os_sdk=None, os_subsystem=None, arch=None):
+    return _unknown()
+
+
+def apple_dot_clean(folder):
+    return _unknown()
+
+
+def apple_sdk_name(settings):
+    return _unknown()
+
+
+def args_to_string(args):
+    return _unknown()
+
+
+def build_sln_command(*args, **kwargs):
+    return _unknown()
+
+
+def chdir(newdir):
+    return _unknown()
+
+
+def check_md5(file_path, signature):
+    return _unknown()
+
+
+def check_min_cppstd(conanfile, cppstd, gnu_extensions=None):
+    return _unknown()
+
+
+def check_output_runner(cmd, stderr=None):
+    return _unknown()
+
+
+def check_sha1(file_path, signature):
+    return _unknown()
+
+
+def check_sha256(file_path, signature):
+    return _unknown()
+
+
+def check_with_algorithm_sum(algorithm_name, file_path, signature):
+    return _unknown()
+
+
+def collect_libs(conanfile, folder=None):
+    return _unknown()
+
+
+def cppstd_default(settings):
+    return _unknown()
+
+
+def cppstd_flag(settings):
+    return _unknown()
+
+
+def cpu_count(*args, **kwargs):
+    return _unknown()
+
+
+def cross_building(conanfile=None, self_os=None, self_arch=None, skip_x64_x86=None, settings=None):
+    return _unknown()
+
+
+def detected_architecture():
+    return _unknown()
+
+
+def detected_os():
+    return _unknown()
+
+
+def dos2unix(filepath):
+    return _unknown()
+
+
+def download(*args, **kwargs):
+    return _unknown()
+
+
+def env_diff(cmd, only_diff):
+    return _unknown()
+
+
+def escape_windows_cmd(command):
+    return _unknown()
+
+
+def files_save(path, content, only_if_modified=None, encoding=None):
+    return _unknown()
+
+
+def find_windows_10_sdk():
+    return _unknown()
+
+
+def fix_symlinks(conanfile, raise_if_error=None):
+    return _unknown()
+
+
+def ftp_download(ip, filename, login=None, password=None):
+    return _unknown()
+
+
+def get(*args, **kwargs):
+    return _unknown()
+
+
+def get_cased_path(name):
+    return _unknown()
+
+
+def get_cross_building_settings(conanfile, self_os=None, self_arch=None):
+    return _unknown()
+
+
+def get_global_instances():
+    return _unknown()
+
+
+def get_gnu_triplet(os_, arch, compiler=None):
+    return _unknown()
+
+
+def human_size(size_bytes):
+    return _unknown()
+
+
+def input_runner(cmd, run_input, folder):
+    return _unknown()
+
+
+def intel_compilervars(*args, **kwargs):
+    return _unknown()
+
+
+def intel_compilervars_command(conanfile, arch=None, compiler_version=None, force=None):
+    return _unknown()
+
+
+def intel_compilervars_dict(conanfile, arch=None, compiler_version=None, force=None, only_diff=None):
+    return _unknown()
+
+
+def intel_installation_path(version, arch):
+    return _unknown()
+
+
+def is_apple_os(os_):
+    return _unknown()
+
+
+def is_win64():
+    return _unknown()
+
+
+def latest_vs_version_installed(*args, **kwargs):
+    return _unknown()
+
+
+def md5(content):
+    return _unknown()
+
+
+def md5sum(file_path):
+    return _unknown()
+
+
+def mkdir(path):
+    return _unknown()
+
+
+def msvc_build_command(*args, **kwargs):
+    return _unknown()
+
+
+def msvs_toolset(conanfile):
+    return _unknown()
+
+
+def muted_runner(cmd, folder=None):
+    return _unknown()
+
+
+def patch(base_path=None, patch_file=None, patch_string=None, strip=None, output=None, fuzz=None):
+    return _unknown()
+
+
+def pyinstaller_bundle_env_cleaned():
+    return _unknown()
+
+
+def relative_dirs(path):
+    return _unknown()
+
+
+def remove_files_by_mask(directory, pattern):
+    return _unknown()
+
+
+def remove_from_path(command):
+    return _unknown()
+
+
+def rename(src, dst):
+    return _unknown()
+
+
+def replace_in_file(*args, **kwargs):
+    return _unknown()
+
+
+def replace_path_in_file(*args, **kwargs):
+    return _unknown()
+
+
+def replace_prefix_in_pc_file(pc_file, new_prefix):
+    return _unknown()
+
+
+def rmdir(path):
+    return _unknown()
+
+
+def run_environment(conanfile):
+    return _unknown()
+
+
+def run_in_windows_bash(conanfile, bashcmd, cwd=None, subsystem=None, msys_mingw=None, env=None, with_login=None):
+    return _unknown()
+
+
+def save(path, content, append=None):
+    return _unknown()
+
+
+def save_append(path, content, encoding=None):
+    return _unknown()
+
+
+def set_global_instances(the_output, the_requester, config):
+    return _unknown()
+
+
+def sha1sum(file_path):
+    return _unknown()
+
+
+def sha256sum(file_path):
+    return _unknown()
+
+
+def stdcpp_library(conanfile):
+    return _unknown()
+
+
+def to_android_abi(arch):
+    return _unknown()
+
+
+def to_apple_arch(arch):
+    return _unknown()
+
+
+def to_file_bytes(content, encoding=None):
+    return _unknown()
+
+
+def touch(fname, times=None):
+    return _unknown()
+
+
+def unix2dos(filepath):
+    return _unknown()
+
+
+def unix_path(path, path_flavor=None):
+    return _unknown()
+
+
+def untargz(filename, destination=None, pattern=None, strip_root=None):
+    return _unknown()
+
+
+def unzip(*args, **kwargs):
+    return _unknown()
+
+
+def valid_min_cppstd(conanfile, cppstd, gnu_extensions=None):
+    return _unknown()
+
+
+def vcvars(*args, **kwargs):
+    return _unknown()
+
+
+def vcvars_command(*args, **kwargs):
+    return _unknown()
+
+
+def vcvars_dict(*args, **kwargs):
+    return _unknown()
+
+
+def version_runner(cmd, shell=None):
+    return _unknown()
+
+
+def vs_comntools(compiler_version):
+    return _unknown()
+
+
+def vs_installation_path(version, preference=None):
+    return _unknown()
+
+
+def vswhere(all_=None, prerelease=None, products=None, requires=None, version=None, latest=None, legacy=None, property_=None, nologo=None):
+    return _unknown()
+
+
+def walk(top, **kwargs):
+    return _unknown()
+
+
+def which(filename):
+    return _unknown()
+
+
+class ConanOutput(object):
+
+    def __init__(self, stream, stream_err=None, color=None):
+        self._color = _unknown()
+        self._stream = _unknown()
+        self._stream_err = _unknown()
+
+    def _write(self, data, newline=None):
+        return _unknown()
+
+    def _write_err(self, data, newline=None):
+        return _unknown()
+
+    def error(self, data):
+        return _unknown()
+
+    def flush(self):
+        return _unknown()
+
+    def highlight(self, data):
+        return _unknown()
+
+    def info(self, data):
+        return _unknown()
+
+    def input_text(self, data):
+        return _unknown()
+
+    @property
+    def is_terminal(self):
+        return _unknown()
+
+    def rewrite_line(self, line):
+        return _unknown()
+
+    def success(self, data):
+        return _unknown()
+
+    def warn(self, data):
+        return _unknown()
+
+    def warning(self, data):
+        return _unknown()
+
+    def write(self, data, front=None, back=None, newline=None, error=None):
+        return _unknown()
+
+    def writeln(self, data, front=None, back=None, error=None):
+        return _unknown()
+
+
+class PkgConfig(object):
+
+    def __init__(self, library, pkg_config_executable=None, static=None, msvc_syntax=None, variables=None, print_errors=None):
+        self._variables = _unknown()
+        self.define_variables = _unknown()
+        self.info = _unknown()
+        self.library = _unknown()
+        self.msvc_syntax = _unknown()
+        self.pkg_config_executable = _unknown()
+        self.print_errors = _unknown()
+        self.static = _unknown()
+
+    @staticmethod
+    def _cmd_output(command):
+        return _unknown()
+
+    def _get_option(self, option):
+        return _unknown()
+
+    def _parse_output(self, option):
+        return _unknown()
+
+    @property
+    def cflags(self):
+        return _unknown()
+
+    @property
+    def cflags_only_I(self):
+        return _unknown()
+
+    @property
+    def cflags_only_other(self):
+        return _unknown()
+
+    @property
+    def libs(self):
+        return _unknown()
+
+    @property
+    def libs_only_L(self):
+        return _unknown()
+
+    @property
+    def libs_only_l(self):
+        return _unknown()
+
+    @property
+    def libs_only_other(self):
+        return _unknown()
+
+    @property
+    def provides(self):
+        return _unknown()
+
+    @property
+    def requires(self):
+        return _unknown()
+
+    @property
+    def requires_private(self):
+        return _unknown()
+
+    @property
+    def variables(self):
+        return _unknown()
+
+    @property
+    def version(self):
+        return _unknown()
+
+
+class SCMBase(object):
+    cmd_command = None
+
+    def __init__(self, folder=None, verify_ssl=None, username=None, password=None, force_english=None, runner=None, output=None):
+        self._force_eng = _unknown()
+        self._output = _unknown()
+        self._password = _unknown()
+        self._runner = _unknown()
+        self._username = _unknown()
+        self._verify_ssl = _unknown()
+        self.folder = _unknown()
+
+    def _handle_scp_pattern(self, user, domain, url):
+        return _unknown()
+
+    def _handle_url_pattern(self, scheme, url, user=None, password=None):
+        return _unknown()
+
+    @classmethod
+    def _remove_credentials_url(cls, url):
+        return _unknown()
+
+    def get_url_with_credentials(self, url):
+        return _unknown()
+
+    @classmethod
+    def get_version(cls):
+        return _unknown()
+
+    def run(self, command):
+        return _unknown()
+
+
+class Version(object):
+    __hash__ = None
+    _semver = None
+    loose = True
+
+    def __eq__(self, other):
+        return _unknown()
+
+    def __ge__(self, other):
+        return _unknown()
+
+    def __gt__(self, other):
+        return _unknown()
+
+    def __init__(self, value):
+        self._semver = _unknown()
+
+    def __le__(self, other):
+        return _unknown()
+
+    def __lt__(self, other):
+        return _unknown()
+
+    def __str__(self):
+        return _unknown()
+
+    @property
+    def build(self):
+        return _unknown()
+
+    @property
+    def major(self):
+        return _unknown()
+
+    @property
+    def minor(self):
+        return _unknown()
+
+    @property
+    def patch(self):
+        return _unknown()
+
+    @property
+    def prerelease(self):
+        return _unknown()
+
+
+class XCRun(object):
+
+    def __init__(self, settings, sdk=None):
+        self.sdk = _unknown()
+
+    def _invoke(self, args):
+        return _unknown()
+
+    @property
+    def ar(self):
+        return _unknown()
+
+    @property
+    def cc(self):
+        return _unknown()
+
+    @property
+    def cxx(self):
+        return _unknown()
+
+    def find(self, tool):
+        return _unknown()
+
+    @property
+    def libtool(self):
+        return _unknown()
+
+    @property
+    def ranlib(self):
+        return _unknown()
+
+    @property
+    def sdk_path(self):
+        return _unknown()
+
+    @property
+    def sdk_platform_path(self):
+        return _unknown()
+
+    @property
+    def sdk_platform_version(self):
+        return _unknown()
+
+    @property
+    def sdk_version(self):
+        return _unknown()
+
+    @property
+    def strip(self):
+        return _unknown()
+
+
+class Git(SCMBase):
+    cmd_command = 'git'
+
+    @property
+    def _configure_ssl_verify(self):
+        return _unknown()
+
+    def _fetch(self, url, branch, shallow):
+        return _unknown()
+
+    def check_repo(self):
+        return _unknown()
+
+    def checkout(self, element, submodule=None):
+        return _unknown()
+
+    def checkout_submodules(self, submodule=None):
+        return _unknown()
+
+    def clone(self, url, branch=None, args=None, shallow=None):
+        return _unknown()
+
+    def excluded_files(self):
+        return _unknown()
+
+    def get_branch(self):
+        return _unknown()
+
+    def get_commit(self):
+        return _unknown()
+
+    def get_commit_message(self):
+        return _unknown()
+
+    def get_remote_url(self, remote_name=None, remove_credentials=None):
+        return _unknown()
+
+    def get_repo_root(self):
+        return _unknown()
+
+    def get_revision(self):
+        return _unknown()
+
+    def get_tag(self):
+        return _unknown()
+
+    def is_local_repository(self):
+        return _unknown()
+
+    def is_pristine(self):
+        return _unknown()
+
+    def run(self, command):
+        return _unknown()
+
+    @property
+    def version(self):
+        return _unknown()
+
+
+class SVN(SCMBase):
+    API_CHANGE_VERSION = '1.9'
+    cmd_command = 'svn'
+    file_protocol = 'file://'
+
+    def __init__(self, folder=None, runner=None, *args, **kwargs):
+        pass
+
+    def _get_item(self, pattern, item_name):
+        return _unknown()
+
+    def _show_item(self, item, target=None):
+        return _unknown()
+
+    def check_repo(self):
+        return _unknown()
+
+    def checkout(self, url, revision=None):
+        return _unknown()
+
+    def excluded_files(self):
+        return _unknown()
+
+    def get_branch(self):
+        return _unknown()
+
+    def get_last_changed_revision(self, use_wc_root=None):
+        return _unknown()
+
+    def get_qualified_remote_url(self, remove_credentials=None):
+        return _unknown()
+
+    def get_remote_url(self, remove_credentials=None):
+        return _unknown()
+
+    def get_repo_root(self):
+        return _unknown()
+
+    def get_revision(self):
+        return _unknown()
+
+    def get_revision_message(self):
+        return _unknown()
+
+    def get_tag(self):
+        return _unknown()
+
+    def is_local_repository(self):
+        return _unknown()
+
+    def is_pristine(self):
+        return _unknown()
+
+    def run(self, command):
+        return _unknown()
+
+    def update(self, revision=None):
+        return _unknown()
+
+    @property
+    def version(self):
+        return _unknown()
+
+
+class SystemPackageTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._conanfile = _unknown()
+        self._default_mode = _unknown()
+        self._is_up_to_date = _unknown()
+        self._output = _unknown()
+        self._tool = _unknown()
+
+    @staticmethod
+    def _create_tool(os_info, output):
+        return _unknown()
+
+    def _get_package_names(self, packages, arch_names):
+        return _unknown()
+
+    @staticmethod
+    def _get_sudo_str():
+        return _unknown()
+
+    def _get_sysrequire_mode(self):
+        return _unknown()
+
+    def _install_all(self, packages):
+        return _unknown()
+
+    def _install_any(self, packages):
+        return _unknown()
+
+    def _installed(self, packages):
+        return _unknown()
+
+    @staticmethod
+    def _is_sudo_enabled():
+        return _unknown()
+
+    def _to_be_installed(self, packages):
+        return _unknown()
+
+    def add_repository(self, repository, repo_key=None, update=None):
+        return _unknown()
+
+    def install(self, packages, update=None, force=None, arch_names=None):
+        return _unknown()
+
+    def install_packages(self, packages, update=None, force=None, arch_names=None):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class AptTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class BrewTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class ChocolateyTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class NullTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class PacManTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class PkgTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class PkgUtilTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class YumTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class ZypperTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
+
+
+class DnfTool(object):
+
+    def __init__(self, *args, **kwargs):
+        self._output = _unknown()
+
+    def add_repository(self, repository, repo_key=None):
+        return _unknown()
+
+    def get_package_name(self, package, arch, arch_names):
+        return _unknown()
+
+    def install(self, package_name):
+        return _unknown()
+
+    def installed(self, package_name):
+        return _unknown()
+
+    def update(self):
+        return _unknown()
@@ -0,0 +1,180 @@
+# Generated by linter/generate_conan_stubs.py from Conan 1.64.1. Do not edit.
+
+from collections import OrderedDict
+
+CONAN_VERSION = "1.64.1"
+
+
+# conans.model.info.ConanInfo
+class ConanInfo(object):
+
+    def __init__(self):
+        self.env_values = None
+        self.full_options = None
+        self.full_requires = None
+        self.full_settings = None
+        self.invalid = None
+        self.options = None
+        self.python_requires = None
+        self.recipe_hash = None
+        self.requires = None
+        self.settings = None
+
+    def copy(self):
+        pass
+
+    @staticmethod
+    def create(settings, options, prefs_direct, prefs_indirect, default_package_id_mode, python_requires, default_python_requires_id_mode):
+        pass
+
+    @staticmethod
+    def loads(text):
+        pass
+
+    def dumps(self):
+        pass
+
+    def clone(self):
+        pass
+
+    def __eq__(self, other):
+        pass
+
+    def __ne__(self, other):
+        pass
+
+    @staticmethod
+    def load_file(conan_info_path):
+        pass
+
+    @staticmethod
+    def load_from_package(package_folder):
+        pass
+
+    def package_id(self):
+        pass
+
+    def serialize_min(self):
+        pass
+
+    def header_only(self):
+        pass
+
+    def msvc_compatible(self):
+        pass
+
+    def apple_clang_compatible(self):
+        pass
+
+    def vs_toolset_compatible(self):
+        pass
+
+    def vs_toolset_incompatible(self):
+        pass
+
+    def discard_build_settings(self):
+        pass
+
+    def include_build_settings(self):
+        pass
+
+    def default_std_matching(self):
+        pass
+
+    def default_std_non_matching(self):
+        pass
+
+    def shared_library_package_id(self):
+        pass
+
+    def parent_compatible(self, *_, **kwargs):
+        pass
+
+    def base_compatible(self):
+        pass
+
+    clear = header_only
+
+
+# conans.client.graph.graph_manager._RecipeBuildRequires
+class _RecipeBuildRequires(OrderedDict):
+
+    def __init__(self, conanfile, default_context):
+        self._default_context = None
+
+    def add(self, build_require, context, force_host_context=False):
+        pass
+
+    def __call__(self, build_require, force_host_context=False):
+        pass
+
+    def __str__(self):
+        pass
+
+
+# conans.client.file_copier.FileCopier
+class FileCopier(object):
+
+    def __init__(self, source_folders, root_destination_folder):
+        self._copied = None
+        self._dst_folder = None
+        self._src_folders = None
+
+    def report(self, output):
+        pass
+
+    def __call__(self, pattern, dst='', src='', keep_path=True, links=False, symlinks=None, excludes=None, ignore_case=True):
+        pass
+
+    def _copy(self, base_src, pattern, src, dst, symlinks, ignore_case, excludes, keep_path, excluded_folders):
+        pass
+
+    @staticmethod
+    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+        pass
+
+    @staticmethod
+    def link_folders(src, dst, linked_folders):
+        pass
+
+    @staticmethod
+    def _copy_files(files, src, dst, keep_path, symlinks):
+        pass
+
+
+# conans.client.importer._FileImporter
+class _FileImporter(object):
+
+    def __init__(self, conanfile, dst_folder):
+        self._conanfile = None
+        self._dst_folder = None
+        self.copied_files = None
+
+    def __call__(self, pattern, dst='', src='', root_package=None, folder=False, ignore_case=True, excludes=None, keep_path=True):
+        pass
+
+
+# conans.client.graph.python_requires.PyRequires
+class PyRequires(object):
+
+    def __init__(self):
+        self._pyrequires = None
+        self._transitive = None
+
+    def update_transitive(self, conanfile):
+        pass
+
+    def all_items(self):
+        pass
+
+    def all_refs(self):
+        pass
+
+    def items(self):
+        pass
+
+    def __getitem__(self, item):
+        pass
+
+    def __setitem__(self, key, value):
+        pass
@@ -1,4 +1,7 @@
 import argparse
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from strictyaml import (
     dirty_load,
     MapCombined,
@@ -10,10 +13,32 @@ from strictyaml import (
     Enum,
     Any,
 )
-from yaml_linting import file_path
+from yaml_linting import expand_paths, fast_compose, mapping, scalar, sequence
 
 
 CONANDATA_YAML_URL = "https://github.com/conan-io/conan-center-index/blob/master/docs/adding_packages/conandata_yml_format.md"
+PATCH_TYPES = ["official", "conan", "portability", "bugfix", "vulnerability"]
+
+PATCH_FIELDS = MapCombined(
+    {
+        "patch_file": Str(),
+        "patch_description": Str(),
+        Optional("patch_type"): Enum(PATCH_TYPES),
+        Optional("patch_source"): Str(),
+        # No longer required for v2 recipes with layouts
+        Optional("base_path"): Str(),
+    },
+    Str(),
+    Any()
+)
+SCHEMA = MapCombined(
+    {
+        "sources": MapPattern(Str(), Any(), minimum_keys=1),
+        Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
+    },
+    Str(),
+    Any(),
+)
 
 
 def main():
@@ -22,45 +47,90 @@ def main():
     )
     parser.add_argument(
         "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
+        nargs="*",
+        help="files (or glob patterns) to validate.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes when validating several files (defaults to the number of CPUs).",
     )
     args = parser.parse_args()
 
-    patch_fields = MapCombined(
-        {
-            "patch_file": Str(),
-            "patch_description": Str(),
-            Optional("patch_type"): Enum(
-                ["official", "conan", "portability", "bugfix", "vulnerability"]
-            ),
-            Optional("patch_source"): Str(),
-            # No longer required for v2 recipes with layouts
-            Optional("base_path"): Str(),
-        },
-        Str(),
-        Any()
-    )
-    schema = MapCombined(
-        {
-            "sources": MapPattern(Str(), Any(), minimum_keys=1),
-            Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
-        },
-        Str(),
-        Any(),
-    )
+    try:
+        paths = expand_paths(args.path)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+    if not paths:
+        parser.error("no files to validate")
+
+    if len(paths) == 1:
+        lint(paths[0])
+        return
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        for output in executor.map(_lint_captured, paths, chunksize=16):
+            print(output, end="")
 
-    with open(args.path, encoding="utf-8") as f:
+
+def _lint_captured(path):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        lint(path)
+    return output.getvalue()
+
+
+def is_valid_fast(content):
+    """ Check the same rules as SCHEMA and PATCH_FIELDS using the fast YAML loader.
+
+    Only returns True when strictyaml would not report anything for this content
+    """
+    document = mapping(fast_compose(content, allow_flow_style=True))
+    if document is None or "sources" not in document:
+        return False
+    sources = mapping(document["sources"])
+    if not sources:
+        return False
+    if "patches" not in document:
+        return True
+
+    patches = mapping(document["patches"])
+    if not patches:
+        return False
+    for version, version_patches in patches.items():
+        version_patches = sequence(version_patches)
+        if version not in sources or not version_patches:
+            return False
+        for patch in version_patches:
+            fields = mapping(patch)
+            if fields is None or scalar(fields.get("patch_file")) is None or \
+                    scalar(fields.get("patch_description")) is None:
+                return False
+            if "patch_type" in fields and scalar(fields["patch_type"]) not in PATCH_TYPES:
+                return False
+            for optional_field in ("patch_source", "base_path"):
+                if optional_field in fields and scalar(fields[optional_field]) is None:
+                    return False
+    return True
+
+
+def lint(path):
+    with open(path, encoding="utf-8") as f:
         content = f.read()
 
+    # strictyaml is only needed to report accurate annotations
+    if is_valid_fast(content):
+        return
+
     try:
-        parsed = dirty_load(content, schema, allow_flow_style=True)
+        parsed = dirty_load(content, SCHEMA, allow_flow_style=True)
     except YAMLValidationError as error:
-        pretty_print_yaml_validate_error(args, error) # Error when "source" is missing or when "patches" has no versions
+        pretty_print_yaml_validate_error(path, error) # Error when "source" is missing or when "patches" has no versions
         return
     except BaseException as error:
-        pretty_print_yaml_validate_error(args, error) # YAML could not be parsed
+        pretty_print_yaml_validate_error(path, error) # YAML could not be parsed
         return
 
     if "patches" in parsed:
@@ -68,7 +138,7 @@ def main():
             patches = parsed["patches"][version]
             if version not in parsed["sources"]:
                 print(
-                    f"::warning file={args.path},line={patches.start_line},endline={patches.end_line},"
+                    f"::warning file={path},line={patches.start_line},endline={patches.end_line},"
                     f"title=conandata.yml inconsistency"
                     f"::Patch(es) are listed for version `{version}`, but there is source for this version."
                     f" You should either remove `{version}` from the `patches` section, or add it to the"
@@ -77,25 +147,24 @@ def main():
             for i, patch in enumerate(patches):
                 # Individual report errors for each patch object
                 try:
-                    parsed["patches"][version][i].revalidate(patch_fields)
+                    parsed["patches"][version][i].revalidate(PATCH_FIELDS)
                 except YAMLValidationError as error:
-                    pretty_print_yaml_validate_warning(args, error) # Warning when patch fields are not followed
+                    pretty_print_yaml_validate_warning(path, error) # Warning when patch fields are not followed
                     continue
 
 
-
-def pretty_print_yaml_validate_error(args, error):
+def pretty_print_yaml_validate_error(path, error):
     snippet = error.context_mark.get_snippet().replace("\n", "%0A")
     print(
-        f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
+        f"::error file={path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
         f"title=conandata.yml schema error"
         f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
     )
     
-def pretty_print_yaml_validate_warning(args, error):
+def pretty_print_yaml_validate_warning(path, error):
     snippet = error.context_mark.get_snippet().replace("\n", "%0A")
     print(
-        f"::warning file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
+        f"::warning file={path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
         f"title=conandata.yml schema warning"
         f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
     )
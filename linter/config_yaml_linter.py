@@ -1,6 +1,21 @@
 import argparse
 from strictyaml import load, Map, Str, YAMLValidationError, MapPattern
-from yaml_linting import file_path
+from yaml_linting import file_path, fast_compose, mapping, scalar
+
+
+def is_valid_fast(content):
+    """ Check the same rules as the strictyaml schema using the fast YAML loader """
+    document = mapping(fast_compose(content))
+    if document is None or list(document) != ["versions"]:
+        return False
+    versions = mapping(document["versions"])
+    if not versions:
+        return False
+    for version in versions.values():
+        fields = mapping(version)
+        if fields is None or list(fields) != ["folder"] or scalar(fields["folder"]) is None:
+            return False
+    return True
 
 
 def main():
@@ -22,6 +37,10 @@ def main():
     with open(args.path) as f:
         content = f.read()
 
+    # strictyaml is only needed to report accurate annotations
+    if is_valid_fast(content):
+        return
+
     try:
         load(content, schema)
     except YAMLValidationError as error:
@@ -0,0 +1,352 @@
+"""
+
+Generate the stubs of the Conan v1 classes used by `transform_conanfile` to declare
+the dynamic fields of ConanFile, and the stubs of the Conan modules imported by the
+recipes, which `transform_conanfile` loads when Conan can't be imported.
+
+The stubs only keep the skeleton of each class (bases, methods and attributes) and the
+signature of each function, so astroid can load them without importing or inferring the
+real Conan client. Functions and unknown values are inferred as uninferable, so pylint
+doesn't report false errors on them.
+
+Run it with the Conan version listed in `.c3i/config_v1.yml` installed:
+
+    python3 linter/generate_conan_stubs.py
+
+"""
+
+import argparse
+import ast
+import importlib
+import inspect
+import os
+import shutil
+import textwrap
+
+import astroid
+
+
+STUBBED_CLASSES = [
+    ("conans.model.info", "ConanInfo"),
+    ("conans.client.graph.graph_manager", "_RecipeBuildRequires"),
+    ("conans.client.file_copier", "FileCopier"),
+    ("conans.client.importer", "_FileImporter"),
+    ("conans.client.graph.python_requires", "PyRequires"),
+]
+
+# Modules imported by the recipes, packages are stubbed as such so their submodules can be imported
+STUBBED_MODULES = [
+    "conan",
+    "conan.errors",
+    "conan.tools",
+    "conan.tools.android",
+    "conan.tools.apple",
+    "conan.tools.build",
+    "conan.tools.cmake",
+    "conan.tools.env",
+    "conan.tools.files",
+    "conan.tools.gnu",
+    "conan.tools.intel",
+    "conan.tools.layout",
+    "conan.tools.meson",
+    "conan.tools.microsoft",
+    "conan.tools.scm",
+    "conan.tools.system",
+    "conan.tools.system.package_manager",
+    "conans",
+    "conans.errors",
+    "conans.model",
+    "conans.model.conan_file",
+    "conans.model.version",
+    "conans.tools",
+]
+
+STUBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conan_v1_stubs.py")
+STUBS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conan_stubs")
+
+# Only builtin bases can be resolved without the Conan sources
+_KNOWN_BASES = {
+    "object": None,
+    "dict": None,
+    "OrderedDict": "from collections import OrderedDict",
+    "defaultdict": "from collections import defaultdict",
+}
+
+
+def _class_stub(classdef):
+    lines = []
+    imports = set()
+    bases = []
+    for base in classdef.basenames:
+        if base in _KNOWN_BASES:
+            bases.append(base)
+            if _KNOWN_BASES[base]:
+                imports.add(_KNOWN_BASES[base])
+    lines.append(f"class {classdef.name}({', '.join(bases) or 'object'}):")
+
+    methods = {method.name: method for method in classdef.mymethods()}
+    aliases = {}
+    for name in sorted(classdef.locals):
+        if name in methods or name.startswith("__"):
+            continue
+        assigned = classdef.locals[name][0].parent
+        if isinstance(assigned, astroid.Assign) and isinstance(assigned.value, astroid.Name) \
+                and assigned.value.name in methods:
+            aliases[name] = assigned.value.name
+        else:
+            lines.append(f"    {name} = None")
+
+    instance_attrs = sorted(classdef.instance_attrs)
+    if "__init__" not in methods and instance_attrs:
+        lines.append("")
+        lines.append("    def __init__(self):")
+        lines.extend(f"        self.{attr} = None" for attr in instance_attrs)
+
+    for name, method in methods.items():
+        lines.append("")
+        for decorator in sorted(method.decoratornames()):
+            if decorator.startswith("builtins."):
+                lines.append(f"    @{decorator[len('builtins.'):]}")
+        lines.append(f"    def {name}({method.args.as_string()}):")
+        if name == "__init__" and instance_attrs:
+            lines.extend(f"        self.{attr} = None" for attr in instance_attrs)
+        else:
+            lines.append("        pass")
+
+    if aliases:
+        lines.append("")
+        lines.extend(f"    {name} = {method}" for name, method in aliases.items())
+    return "\n".join(lines), imports
+
+
+_UNKNOWN = textwrap.dedent("""\
+    def _unknown():
+        raise NotImplementedError
+    """)
+
+_SKIPPED_MEMBERS = {"__dict__", "__doc__", "__module__", "__qualname__", "__slots__", "__weakref__"}
+
+
+def _literal(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    return "_unknown()"
+
+
+def _signature(function):
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):
+        return "*args, **kwargs"
+    params = []
+    keyword_only = False
+    for param in signature.parameters.values():
+        if param.kind == param.VAR_POSITIONAL:
+            params.append(f"*{param.name}")
+            keyword_only = True
+            continue
+        if param.kind == param.VAR_KEYWORD:
+            params.append(f"**{param.name}")
+            continue
+        if param.kind == param.KEYWORD_ONLY and not keyword_only:
+            params.append("*")
+            keyword_only = True
+        params.append(param.name if param.default is param.empty else f"{param.name}=None")
+    return ", ".join(params)
+
+
+def _function_stub(name, function, indent=""):
+    return f"{indent}def {name}({_signature(function)}):\n{indent}    return _unknown()"
+
+
+def _instance_attrs(cls):
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(cls)))
+    except (OSError, TypeError, SyntaxError):
+        return set()
+    attrs = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Store) \
+                and isinstance(node.value, ast.Name) and node.value.id == "self":
+            attrs.add(node.attr)
+    return attrs
+
+
+class _ModuleStubs:
+    """ Where each object exported by the stubbed modules is defined """
+
+    def __init__(self, module_names):
+        self.modules = {name: importlib.import_module(name) for name in module_names}
+        self.exports = {name: self._exports(module) for name, module in self.modules.items()}
+        self.homes = {}
+        for module_name, exports in self.exports.items():
+            for name, obj in exports.items():
+                if inspect.isclass(obj) or inspect.isfunction(obj):
+                    home = (obj.__module__, obj.__name__)
+                    if obj is not self.exports.get(home[0], {}).get(home[1]):
+                        home = (module_name, name)
+                    self.homes.setdefault(id(obj), home)
+
+    def _exports(self, module):
+        names = getattr(module, "__all__", None) or [
+            name for name in vars(module) if not name.startswith("_") or name == "__version__"
+        ]
+        exports = {}
+        for name in names:
+            obj = getattr(module, name)
+            if inspect.ismodule(obj):
+                continue  # Submodules are stubbed on their own
+            if (inspect.isclass(obj) or inspect.isfunction(obj)) \
+                    and obj.__module__.split(".")[0] not in ("conan", "conans"):
+                continue  # Imported from the standard library or a dependency
+            exports[name] = obj
+        return exports
+
+    def _resolve(self, module_name, cls):
+        home = self.homes.get(id(cls))
+        if home is None:
+            return None
+        if home[0] == module_name:
+            return home[1]
+        return f"{home[0]}.{home[1]}"
+
+    def _class_stub(self, module_name, name, cls, imports):
+        bases = []
+        flattened = [cls]
+        pending = list(cls.__bases__)
+        while pending:
+            base = pending.pop(0)
+            if base is object:
+                continue
+            if base.__module__ == "builtins":
+                bases.append(base.__name__)
+                continue
+            resolved = self._resolve(module_name, base)
+            if resolved:
+                if "." in resolved:
+                    home, base_name = self.homes[id(base)]
+                    imports.add(f"from {home} import {base_name}")
+                    resolved = base_name
+                bases.append(resolved)
+            else:
+                # Bases from modules that aren't stubbed are merged into the class
+                flattened.append(base)
+                pending.extend(base.__bases__)
+
+        lines = [f"class {name}({', '.join(dict.fromkeys(bases)) or 'object'}):"]
+        members = {}
+        for source in reversed(flattened):
+            members.update((key, value) for key, value in vars(source).items() if key not in _SKIPPED_MEMBERS)
+        # Class attributes are also kept, recipes override them with the values Conan replaces on the instance
+        instance_attrs = sorted(
+            attr for attr in set().union(*(_instance_attrs(source) for source in flattened))
+            if attr not in members or not callable(members[attr]) and not isinstance(members[attr], property)
+        )
+
+        for key, value in sorted(members.items()):
+            if not isinstance(value, (staticmethod, classmethod, property)) and not inspect.isfunction(value):
+                lines.append(f"    {key} = {_literal(value)}")
+        if "__init__" not in members and instance_attrs:
+            members["__init__"] = None
+        for key, value in sorted(members.items()):
+            if key == "__init__":
+                lines.append("")
+                signature = _signature(value) if value is not None else "self, *args, **kwargs"
+                lines.append(f"    def __init__({signature}):")
+                lines.extend(f"        self.{attr} = _unknown()" for attr in instance_attrs)
+                if not instance_attrs:
+                    lines.append("        pass")
+            elif isinstance(value, property):
+                lines.append("")
+                lines.append("    @property")
+                lines.append(f"    def {key}(self):")
+                lines.append("        return _unknown()")
+            elif isinstance(value, (staticmethod, classmethod)):
+                lines.append("")
+                lines.append(f"    @{type(value).__name__}")
+                lines.append(_function_stub(key, value.__func__, indent="    "))
+            elif inspect.isfunction(value):
+                lines.append("")
+                lines.append(_function_stub(key, value, indent="    "))
+        if len(lines) == 1:
+            lines.append("    pass")
+        return "\n".join(lines)
+
+    def module_stub(self, module_name, conan_version):
+        imports = set()
+        values = []
+        functions = []
+        classes = []
+        for name, obj in sorted(self.exports[module_name].items()):
+            if inspect.isclass(obj) or inspect.isfunction(obj):
+                home, home_name = self.homes[id(obj)]
+                if home != module_name:
+                    alias = f" as {name}" if home_name != name else ""
+                    imports.add(f"from {home} import {home_name}{alias}")
+                elif inspect.isclass(obj):
+                    classes.append((len(obj.__mro__), name, self._class_stub(module_name, name, obj, imports)))
+                else:
+                    functions.append(_function_stub(name, obj))
+            else:
+                values.append(f"{name} = {_literal(obj)}")
+
+        header = f"# Generated by linter/generate_conan_stubs.py from Conan {conan_version}. Do not edit.\n\n"
+        sections = ["\n".join(sorted(imports)), _UNKNOWN.rstrip("\n"), "\n".join(values)]
+        sections += functions
+        sections += [stub for _, _, stub in sorted(classes)]
+        return header + "\n\n\n".join(section for section in sections if section) + "\n"
+
+    def stub_path(self, module_name):
+        parts = module_name.split(".")
+        if hasattr(self.modules[module_name], "__path__"):
+            return os.path.join(*parts, "__init__.py")
+        return os.path.join(*parts[:-1], f"{parts[-1]}.py")
+
+
+def generate_modules(conan_version):
+    stubs = _ModuleStubs(STUBBED_MODULES)
+    return {stubs.stub_path(name): stubs.module_stub(name, conan_version) for name in STUBBED_MODULES}
+
+
+def generate(conan_version):
+    classes = []
+    imports = set()
+    for module_name, class_name in STUBBED_CLASSES:
+        module = astroid.MANAGER.ast_from_module_name(module_name)
+        stub, stub_imports = _class_stub(module[class_name])
+        classes.append(f"# {module_name}.{class_name}\n{stub}")
+        imports |= stub_imports
+
+    header = textwrap.dedent(f"""\
+        # Generated by linter/generate_conan_stubs.py from Conan {conan_version}. Do not edit.
+
+        """)
+    body = "\n".join(sorted(imports))
+    body += f"\n\nCONAN_VERSION = \"{conan_version}\"\n\n\n"
+    body += "\n\n\n".join(classes)
+    return header + body.lstrip("\n") + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate the stubs of the Conan v1 classes and modules used by the ConanFile transform."
+    )
+    parser.add_argument("--output", default=STUBS_FILE, help="file to write the class stubs to.")
+    parser.add_argument("--output-dir", default=STUBS_DIR, help="folder to write the module stubs to.")
+    args = parser.parse_args()
+
+    from conans import __version__ as conan_version
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(generate(conan_version))
+
+    shutil.rmtree(args.output_dir, ignore_errors=True)
+    for path, stub in generate_modules(conan_version).items():
+        path = os.path.join(args.output_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(stub)
+
+
+if __name__ == "__main__":
+    main()
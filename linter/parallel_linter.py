@@ -0,0 +1,159 @@
+"""
+
+Run pylint with the CCI plugins over many recipes, splitting them into shards
+that are linted by a pool of worker processes.
+
+Every worker keeps its own astroid manager alive between shards, so the Conan
+modules inferred by the transforms are only built once per process.
+
+Messages of the checkers working across modules, such as duplicate-code, are only
+reported between files of the same shard. The `--output` JSON is therefore not the same
+as the one of a single pylint run when they are enabled.
+
+With `--profile`, the workers run with the `profile_plugins` instrumentation and the
+time spent per file, rule and transform is merged into a single JSON file. Files replayed
+from the results cache are not parsed, so an enabled cache is bypassed while profiling
+and the report says so.
+
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from yaml_linting import expand_paths
+
+
+def _lint_shard(rcfile, files):
+    # Imported here so the parent process does not need to load pylint at all
+    from pylint.lint import Run
+    from pylint.reporters import JSONReporter
+
+    output = io.StringIO()
+    Run([f"--rcfile={rcfile}", "--score=n"] + files, reporter=JSONReporter(output), exit=False)
+    return json.loads(output.getvalue() or "[]")
+
+
+def split_shards(files, shards):
+    """ Split the list of files into (at most) `shards` chunks of similar size """
+    shards = max(1, min(shards, len(files)))
+    return [files[i::shards] for i in range(shards)]
+
+
+def lint(files, rcfile, jobs=None, shards_per_job=4):
+    """ Lint all the files and return the merged list of pylint JSON messages """
+    if not files:
+        # pylint prints its help and exits with code 32 when it gets no files
+        return []
+    jobs = jobs or os.cpu_count() or 1
+    shards = split_shards(sorted(files), jobs * shards_per_job)
+    messages = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for result in executor.map(_lint_shard, [rcfile] * len(shards), shards):
+            messages.extend(result)
+    messages.sort(key=lambda msg: (msg["path"], msg["line"] or 0, msg["column"] or 0, msg["message-id"]))
+    return messages
+
+
+def summary(messages, msg_type="error"):
+    """ Group messages of the given type by text, most frequent first """
+    counter = {}
+    for msg in messages:
+        if msg["type"] == msg_type:
+            counter[msg["message"]] = counter.get(msg["message"], 0) + 1
+    return sorted(counter.items(), key=lambda item: item[1], reverse=True)
+
+
+def merge_profiles(folder):
+    """ Merge the files written by the workers running with CCI_LINTER_PROFILE=folder """
+    merged = {"rules": {}, "transforms": {}, "files": {}}
+    for filename in sorted(os.listdir(folder)):
+        with open(os.path.join(folder, filename), encoding="utf-8") as f:
+            profile = json.load(f)
+        for table in ("rules", "transforms"):
+            for key, entry in profile[table].items():
+                total = merged[table].setdefault(key, {"calls": 0, "time": 0.0})
+                total["calls"] += entry["calls"]
+                total["time"] += entry["time"]
+        merged["files"].update(profile["files"])
+    return merged
+
+
+def profile_summary(profile, top=10):
+    """ Markdown lines with the slowest files and the slowest rules and transforms """
+    lines = []
+    if profile.get("cache_bypassed"):
+        lines.extend(["", "The results cache was bypassed while profiling, every recipe was linted."])
+    lines.extend(["", "### Slowest recipes", ""])
+    files = sorted(profile["files"].items(), key=lambda item: item[1]["total"], reverse=True)
+    for path, timings in files[:top]:
+        lines.append(f" * {path}: {timings['total']:.2f} s (parse {timings['parse']:.2f} s, "
+                     f"inference {timings['inference']:.2f} s)")
+    lines.extend(["", "### Slowest rules and transforms", ""])
+    entries = list(profile["rules"].items()) + list(profile["transforms"].items())
+    for key, entry in sorted(entries, key=lambda item: item[1]["time"], reverse=True)[:top]:
+        lines.append(f" * {key}: {entry['time']:.2f} s ({entry['calls']} calls)")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the ConanCenterIndex pylint rules over many recipes in parallel."
+    )
+    parser.add_argument("files", nargs="+", help="recipe files (or glob patterns) to lint.")
+    parser.add_argument("--rcfile", required=True, help="pylint rcfile to use.")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes (defaults to the number of CPUs).")
+    parser.add_argument("--output", default=None, help="write the merged JSON messages to this file.")
+    parser.add_argument("--summary", default=None,
+                        help="append a markdown summary of errors to this file (e.g. $GITHUB_STEP_SUMMARY).")
+    parser.add_argument("--profile", default=None,
+                        help="profile the CCI plugins and write the timings to this file.")
+    parser.add_argument("--profile-top", type=int, default=10,
+                        help="number of files and rules listed in the summary when profiling.")
+    args = parser.parse_args()
+
+    try:
+        files = sorted(set(expand_paths(args.files)))
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+    if not files:
+        print("No files to lint", file=sys.stderr)
+
+    if args.profile:
+        cache_bypassed = bool(os.getenv("CCI_LINTER_CACHE")) and not os.getenv("CCI_LINTER_NO_CACHE")
+        with tempfile.TemporaryDirectory() as profile_dir:
+            # Inherited by the worker processes, where the plugins are loaded
+            os.environ["CCI_LINTER_PROFILE"] = profile_dir
+            if cache_bypassed:
+                os.environ["CCI_LINTER_NO_CACHE"] = "1"
+            messages = lint(files, args.rcfile, jobs=args.jobs)
+            profile = merge_profiles(profile_dir)
+        profile["cache_bypassed"] = cache_bypassed
+        if cache_bypassed:
+            print("The results cache (CCI_LINTER_CACHE) was bypassed while profiling", file=sys.stderr)
+        with open(args.profile, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=4)
+    else:
+        messages = lint(files, args.rcfile, jobs=args.jobs)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(messages, f, indent=4)
+    else:
+        print(json.dumps(messages, indent=4))
+
+    if args.summary:
+        with open(args.summary, "a", encoding="utf-8") as f:
+            for message, length in summary(messages):
+                f.write(f" * {message}: {length}\n")
+            if args.profile:
+                f.write("\n".join(profile_summary(profile, args.profile_top)) + "\n")
+
+
+if __name__ == "__main__":
+    main()
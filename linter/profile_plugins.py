@@ -0,0 +1,159 @@
+"""
+
+Pylint plugin that measures where the time of the CCI plugins goes. It does nothing
+unless `CCI_LINTER_PROFILE` is set to a folder.
+
+It records the wall time and number of calls of every CCI rule handler and astroid
+transform, and for every file the time spent parsing it (including the transforms),
+running astroid inference and checking it. Every pylint run writes one JSON file in
+the `CCI_LINTER_PROFILE` folder, `parallel_linter.py --profile` merges them.
+
+Files replayed by `cache_results` are not parsed, do not enable the cache to profile
+them (`parallel_linter.py --profile` bypasses it and says so in its report).
+
+"""
+
+import functools
+import json
+import os
+import time
+import uuid
+
+import astroid
+from astroid import nodes
+from pylint.lint import PyLinter
+
+from linter.checker_core import ConanCenterChecker
+
+
+PROFILE_DIR = os.getenv("CCI_LINTER_PROFILE")
+_PROFILED = "_cci_profiled"
+
+
+class Profile:
+    """ Accumulated wall time per rule, transform and file """
+
+    def __init__(self):
+        self.rules = {}
+        self.transforms = {}
+        self.files = {}
+        self.inference = 0.0
+        self._inference_depth = 0
+
+    @staticmethod
+    def _add(table, key, elapsed):
+        entry = table.setdefault(key, {"calls": 0, "time": 0.0})
+        entry["calls"] += 1
+        entry["time"] += elapsed
+
+    def timed(self, table, key, func):
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._add(table, key, time.perf_counter() - start)
+        setattr(_wrapper, _PROFILED, True)
+        return _wrapper
+
+    def timed_inference(self, infer):
+        """ Time spent in the outermost inference calls, nested ones are already included """
+        profile = self
+
+        @functools.wraps(infer)
+        def _infer(node, context=None, **kwargs):
+            results = infer(node, context=context, **kwargs)
+            while True:
+                start = time.perf_counter()
+                profile._inference_depth += 1
+                try:
+                    result = next(results)
+                except StopIteration:
+                    return
+                finally:
+                    profile._inference_depth -= 1
+                    if not profile._inference_depth:
+                        profile.inference += time.perf_counter() - start
+                yield result
+        setattr(_infer, _PROFILED, True)
+        return _infer
+
+    def save(self, folder):
+        """ Write the profile to a new file in `folder` and start over """
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{os.getpid()}-{uuid.uuid4().hex}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"rules": self.rules, "transforms": self.transforms, "files": self.files}, f)
+        self.rules, self.transforms, self.files = {}, {}, {}
+
+
+def _instrument_checker(checker: ConanCenterChecker, profile: Profile):
+    def _wrap(handler):
+        key = f"{type(handler.__self__).__name__}.{handler.__name__}"
+        return profile.timed(profile.rules, key, handler)
+
+    checker._conanfile_handlers = [_wrap(h) for h in checker._conanfile_handlers]
+    checker._call_handlers = [_wrap(h) for h in checker._call_handlers]
+    checker._importfrom_handlers = [_wrap(h) for h in checker._importfrom_handlers]
+    checker._importfrom_handlers_by_modname = {
+        modname: [_wrap(h) for h in handlers]
+        for modname, handlers in checker._importfrom_handlers_by_modname.items()
+    }
+
+
+def _instrument_transforms(profile: Profile):
+    # Only the transforms of the CCI plugins, which are registered when pylint imports them.
+    # They are global, so they are wrapped once even if pylint runs several times in the process
+    for node_class, transforms in astroid.MANAGER._transform.transforms.items():
+        for i, (transform, predicate) in enumerate(transforms):
+            if getattr(transform, "__module__", "").startswith("linter.") and not hasattr(transform, _PROFILED):
+                key = f"{node_class.__name__}:{transform.__name__}"
+                transforms[i] = (profile.timed(profile.transforms, key, transform), predicate)
+
+
+_profile = Profile()
+
+
+def register(linter: PyLinter) -> None:
+    if not PROFILE_DIR:
+        return
+
+    for checker in linter.get_checkers():
+        if isinstance(checker, ConanCenterChecker):
+            _instrument_checker(checker, _profile)
+    _instrument_transforms(_profile)
+    if not hasattr(nodes.NodeNG.infer, _PROFILED):
+        nodes.NodeNG.infer = _profile.timed_inference(nodes.NodeNG.infer)
+
+    check_file = linter._check_file
+
+    def _check_file_profiled(get_ast, check_astroid_module, file):
+        timings = {"parse": 0.0}
+
+        def _get_ast(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return get_ast(*args, **kwargs)
+            finally:
+                timings["parse"] += time.perf_counter() - start
+
+        inference = _profile.inference
+        start = time.perf_counter()
+        try:
+            return check_file(_get_ast, check_astroid_module, file)
+        finally:
+            timings["total"] = time.perf_counter() - start
+            timings["inference"] = _profile.inference - inference
+            _profile.files[file.filepath] = timings
+
+    check = linter.check
+
+    def _check_profiled(files_or_modules):
+        try:
+            check(files_or_modules)
+        finally:
+            _profile.save(PROFILE_DIR)
+
+    linter._check_file = _check_file_profiled
+    linter.check = _check_profiled
@@ -0,0 +1,100 @@
+import os
+import textwrap
+
+import astroid
+import pytest
+from astroid.exceptions import AstroidImportError
+from astroid.manager import AstroidManager
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+
+
+RCFILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pylintrc_recipe")
+
+
+@pytest.fixture
+def conan_not_importable(monkeypatch):
+    file_from_module_name = AstroidManager.file_from_module_name
+
+    def _file_from_module_name(self, modname, contextfile):
+        if modname.split(".")[0] in ("conan", "conans"):
+            raise AstroidImportError("No module named {modname}", modname=modname)
+        return file_from_module_name(self, modname, contextfile)
+
+    monkeypatch.setattr(AstroidManager, "file_from_module_name", _file_from_module_name)
+    astroid.MANAGER.clear_cache()
+    yield
+    astroid.MANAGER.clear_cache()
+
+
+def test_lint_recipe_without_conan(tmp_path, conan_not_importable):
+    recipe = tmp_path / "conanfile.py"
+    recipe.write_text(textwrap.dedent("""\
+        from conan import ConanFile
+        from conan.errors import ConanInvalidConfiguration
+        from conan.tools.build import check_min_cppstd
+        from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+        from conan.tools.files import copy, get, rmdir
+        from conan.tools.scm import Version
+
+        required_conan_version = ">=1.53.0"
+
+
+        class FooConan(ConanFile):
+            name = "foo"
+            description = "Foo"
+            license = "MIT"
+            url = "https://github.com/conan-io/conan-center-index"
+            homepage = "https://example.com/foo"
+            topics = ("foo",)
+            package_type = "library"
+            settings = "os", "arch", "compiler", "build_type"
+            options = {"shared": [True, False], "fPIC": [True, False]}
+            default_options = {"shared": False, "fPIC": True}
+
+            def config_options(self):
+                if self.settings.os == "Windows":
+                    del self.options.fPIC
+
+            def configure(self):
+                if self.options.shared:
+                    self.options.rm_safe("fPIC")
+                self.settings.rm_safe("compiler.libcxx")
+
+            def layout(self):
+                cmake_layout(self, src_folder="src")
+
+            def validate(self):
+                if self.settings.compiler.get_safe("cppstd"):
+                    check_min_cppstd(self, 11)
+                if Version(self.version) < "1.0" and self.settings.compiler == "msvc":
+                    raise ConanInvalidConfiguration(f"{self.ref} is not supported by msvc")
+
+            def source(self):
+                get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+            def generate(self):
+                tc = CMakeToolchain(self)
+                tc.variables["FOO_SHARED"] = self.options.shared
+                tc.generate()
+
+            def build(self):
+                cmake = CMake(self)
+                cmake.configure()
+                cmake.build()
+
+            def package(self):
+                copy(self, "LICENSE", self.source_folder, self.package_folder)
+                cmake = CMake(self)
+                cmake.install()
+                rmdir(self, self.package_path / "lib" / "cmake")
+
+            def package_info(self):
+                self.cpp_info.libs = ["foo"]
+        """))
+
+    reporter = CollectingReporter()
+    Run([f"--rcfile={RCFILE}", str(recipe)], reporter=reporter, exit=False)
+
+    symbols = {"import-error", "no-name-in-module", "no-member", "abstract-method"}
+    assert [message.msg for message in reporter.messages if message.symbol in symbols] == []
@@ -0,0 +1,34 @@
+import textwrap
+
+from linter.yaml_linting import fast_compose, mapping, scalar
+
+
+def test_fast_compose():
+    node = fast_compose(textwrap.dedent("""\
+        sources:
+          "1.0":
+            url: "https://example.com/1.0.tar.gz"
+            sha256: "abc"
+        """))
+    sources = mapping(mapping(node)["sources"])
+    assert scalar(mapping(sources["1.0"])["sha256"]) == "abc"
+
+
+def test_fast_compose_duplicated_key_in_sources_entry():
+    # strictyaml rejects duplicated keys at any depth, the fast path must not accept them
+    assert fast_compose(textwrap.dedent("""\
+        sources:
+          "1.0":
+            url: "https://example.com/1.0.tar.gz"
+            sha256: "abc"
+            sha256: "def"
+        """)) is None
+
+
+def test_fast_compose_unsupported():
+    assert fast_compose("a: &anchor 1\nb: *anchor\n") is None
+    assert fast_compose("a: !!str 1\n") is None
+    assert fast_compose("a: [1, 2]\n") is None
+    assert fast_compose("a: [1, 2]\n", allow_flow_style=True) is not None
+    assert fast_compose("a: 1\n---\nb: 2\n") is None
+    assert fast_compose("a: b: c\n") is None
@@ -2,11 +2,19 @@
 # Class ConanFile doesn't declare all the valid members and functions,
 #   some are injected by Conan dynamically to the class.
 
+import os
 import textwrap
 import astroid
 from astroid.builder import AstroidBuilder
+from astroid.exceptions import AstroidBuildingError
 from astroid.manager import AstroidManager
 
+# Skeletons of the Conan classes, see generate_conan_stubs.py
+CONAN_STUBS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conan_v1_stubs.py")
+# Skeletons of the Conan modules, used when Conan can't be imported
+CONAN_STUBS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conan_stubs")
+_conan_stubs = None
+
 
 def _settings_transform():
     module = AstroidBuilder(AstroidManager()).string_build(
@@ -30,6 +38,23 @@ def _user_info_build_transform():
     return module['UserInfoBuild']
 
 
+def _conan_stubs_module():
+    global _conan_stubs
+    if _conan_stubs is None:
+        _conan_stubs = AstroidBuilder(AstroidManager()).file_build(CONAN_STUBS_FILE, "conan_v1_stubs")
+    return _conan_stubs
+
+
+def _conan_module_stub(modname):
+    """Build the stub of a Conan module that can't be imported, so recipes are linted without Conan installed"""
+    if modname.split(".")[0] in ("conan", "conans"):
+        path = os.path.join(CONAN_STUBS_DIR, *modname.split("."))
+        for stub_file in (os.path.join(path, "__init__.py"), path + ".py"):
+            if os.path.isfile(stub_file):
+                return AstroidBuilder(AstroidManager()).file_build(stub_file, modname)
+    raise AstroidBuildingError(modname=modname)
+
+
 def register(_):
     pass
 
@@ -38,16 +63,12 @@ def transform_conanfile(node):
 
     str_class = astroid.builtin_lookup("str")
     dict_class = astroid.builtin_lookup("dict")
-    info_class = astroid.MANAGER.ast_from_module_name("conans.model.info").lookup(
-        "ConanInfo")
-    build_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.graph_manager").lookup("_RecipeBuildRequires")
-    file_copier_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.file_copier").lookup("FileCopier")
-    file_importer_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.importer").lookup("_FileImporter")
-    python_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.python_requires").lookup("PyRequires")
+    conan_stubs = _conan_stubs_module()
+    info_class = conan_stubs.lookup("ConanInfo")
+    build_requires_class = conan_stubs.lookup("_RecipeBuildRequires")
+    file_copier_class = conan_stubs.lookup("FileCopier")
+    file_importer_class = conan_stubs.lookup("_FileImporter")
+    python_requires_class = conan_stubs.lookup("PyRequires")
 
     dynamic_fields = {
         "conan_data": str_class,
@@ -73,3 +94,5 @@ def transform_conanfile(node):
 astroid.MANAGER.register_transform(
     astroid.ClassDef, transform_conanfile,
     lambda node: node.qname() == "conans.model.conan_file.ConanFile")
+
+astroid.MANAGER.register_failed_import_hook(_conan_module_stub)
@@ -7,3 +7,114 @@ def file_path(a_string):
     if not isfile(a_string):
         raise argparse.ArgumentTypeError(f"{a_string} does not point to a file")
     return a_string
+
+
+def is_pattern(path):
+    """ Whether the path contains glob wildcards, quoted by the caller so the shell did not expand them """
+    return any(char in path for char in "*?[")
+
+
+def expand_paths(patterns):
+    """ Expand glob patterns (e.g. 'recipes/*/*/conandata.yml') and validate plain file paths """
+    import glob
+
+    paths = []
+    for pattern in patterns:
+        if is_pattern(pattern):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            paths.append(file_path(pattern))
+    return paths
+
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _compose_node(event, events, allow_flow_style):
+    """ Build the node of `event` consuming its children from `events`, like yaml.compose """
+    if isinstance(event, yaml.AliasEvent) or event.anchor is not None or getattr(event, "tag", None) is not None:
+        raise _Unsupported()
+    if isinstance(event, yaml.ScalarEvent):
+        return yaml.ScalarNode("tag:yaml.org,2002:str", event.value, event.start_mark, event.end_mark,
+                               style=event.style)
+    if not allow_flow_style and event.flow_style:
+        raise _Unsupported()
+    if isinstance(event, yaml.SequenceStartEvent):
+        items = []
+        for child in events:
+            if isinstance(child, yaml.SequenceEndEvent):
+                return yaml.SequenceNode("tag:yaml.org,2002:seq", items, event.start_mark, child.end_mark,
+                                         flow_style=event.flow_style)
+            items.append(_compose_node(child, events, allow_flow_style))
+    if isinstance(event, yaml.MappingStartEvent):
+        pairs = []
+        keys = set()
+        for child in events:
+            if isinstance(child, yaml.MappingEndEvent):
+                return yaml.MappingNode("tag:yaml.org,2002:map", pairs, event.start_mark, child.end_mark,
+                                        flow_style=event.flow_style)
+            key = _compose_node(child, events, allow_flow_style)
+            value = _compose_node(next(events), events, allow_flow_style)
+            # Duplicated keys are rejected at any depth, as strictyaml does
+            if not isinstance(key, yaml.ScalarNode) or key.value in keys:
+                raise _Unsupported()
+            keys.add(key.value)
+            pairs.append((key, value))
+    raise _Unsupported()
+
+
+def fast_compose(content, allow_flow_style=False):
+    """ Compose the YAML document with the C-accelerated PyYAML parser, if available.
+
+    Returns None when the document cannot be validated this way (no PyYAML, syntax
+    errors, anchors, tags, duplicated keys or forbidden flow style), so callers fall
+    back to strictyaml
+    """
+    if yaml is None:
+        return None
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        events = iter(yaml.parse(content, Loader=loader))
+        if not isinstance(next(events), yaml.StreamStartEvent) or \
+                not isinstance(next(events), yaml.DocumentStartEvent):
+            return None
+        node = _compose_node(next(events), events, allow_flow_style)
+        if not isinstance(next(events), yaml.DocumentEndEvent) or not isinstance(next(events), yaml.StreamEndEvent):
+            return None
+        return node
+    except (yaml.YAMLError, _Unsupported, StopIteration):
+        return None
+
+
+def scalar(node):
+    """ Value of a non-empty scalar node, None otherwise """
+    if isinstance(node, yaml.ScalarNode) and node.value != "":
+        return node.value
+    return None
+
+
+def sequence(node):
+    """ List of item nodes of a sequence node, None otherwise """
+    if isinstance(node, yaml.SequenceNode):
+        return node.value
+    return None
+
+
+def mapping(node):
+    """ Dict (key -> value node) of a mapping node with unique, non-empty scalar keys, None otherwise """
+    if not isinstance(node, yaml.MappingNode):
+        return None
+    result = {}
+    for key, value in node.value:
+        key = scalar(key)
+        if key is None or key in result:
+            return None
+        result[key] = value
+    return result
@@ -24,11 +24,17 @@ class FollyConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "use_sse4_2" : [True, False],
+        "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
+        "with_libaio": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
-        "use_sse4_2" : False
+        "use_sse4_2" : False,
+        "with_jemalloc": False,
+        "with_liburing": False,
+        "with_libaio": False,
     }
 
     generators = "cmake", "cmake_find_package"
@@ -68,31 +74,46 @@ class FollyConan(ConanFile):
         if str(self.settings.arch) not in ['x86', 'x86_64']:
             del self.options.use_sse4_2
 
+        # folly::IoUringBackend and folly::AsyncIO are only built on Linux, since 2020.08.10.00
+        if self.settings.os != "Linux" or Version(self.version) < "2020.08.10.00":
+            del self.options.with_liburing
+            del self.options.with_libaio
+
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
 
     def requirements(self):
-        self.requires("boost/1.78.0")
+        # Older releases keep the versions they were tested with
+        recent = Version(self.version) >= "2022.01.31.00"
+        self.requires("boost/1.83.0" if recent else "boost/1.78.0")
         self.requires("bzip2/1.0.8")
-        self.requires("double-conversion/3.2.0")
+        self.requires("double-conversion/3.3.0" if recent else "double-conversion/3.2.0")
         self.requires("gflags/2.2.2")
-        self.requires("glog/0.4.0")
+        self.requires("glog/0.6.0" if recent else "glog/0.4.0")
         self.requires("libevent/2.1.12")
-        self.requires("openssl/1.1.1q")
-        self.requires("lz4/1.9.3")
-        self.requires("snappy/1.1.9")
-        self.requires("zlib/1.2.12")
-        self.requires("zstd/1.5.2")
+        self.requires("openssl/[>=1.1 <4]" if recent else "openssl/1.1.1q")
+        self.requires("lz4/1.9.4" if recent else "lz4/1.9.3")
+        self.requires("snappy/1.1.10" if recent else "snappy/1.1.9")
+        self.requires("zlib/[>=1.2.11 <2]" if recent else "zlib/1.2.12")
+        self.requires("zstd/1.5.5" if recent else "zstd/1.5.2")
         if not is_msvc(self):
             self.requires("libdwarf/20191104")
-        self.requires("libsodium/1.0.18")
-        self.requires("xz_utils/5.2.5")
-        # FIXME: Causing compilation issues on clang: self.requires("jemalloc/5.2.1")
+        self.requires("libsodium/1.0.19" if recent else "libsodium/1.0.18")
+        self.requires("xz_utils/5.4.5" if recent else "xz_utils/5.2.5")
+        if self.options.with_jemalloc:
+            self.requires("jemalloc/5.3.0")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.6")
+        if self.options.get_safe("with_libaio"):
+            self.requires("libaio/0.3.113")
         if self.settings.os == "Linux":
             self.requires("libiberty/9.1.0")
-            self.requires("libunwind/1.5.0")
-        if Version(self.version) >= "2020.08.10.00":
+            self.requires("libunwind/1.7.2" if recent else "libunwind/1.5.0")
+        if recent:
+            # Version used by the getdeps.py manifests of this release
+            self.requires("fmt/8.0.1")
+        elif Version(self.version) >= "2020.08.10.00":
             self.requires("fmt/7.1.3")
 
     @property
@@ -143,6 +164,10 @@ class FollyConan(ConanFile):
         if self.options.get_safe("use_sse4_2") and str(self.settings.arch) not in ['x86', 'x86_64']:
             raise ConanInvalidConfiguration(f"{self.ref} can use the option use_sse4_2 only on x86 and x86_64 archs.")
 
+        if self.options.with_jemalloc and self.dependencies["jemalloc"].options.prefix:
+            # folly/portability/Malloc.h calls mallocx, sallocx, nallocx and mallctl without prefix
+            raise ConanInvalidConfiguration(f"{self.ref} with_jemalloc=True requires jemalloc:prefix to be empty")
+
     # FIXME: Freeze max. CMake version at 3.16.2 to fix the Linux build
     def build_requirements(self):
         self.build_requires("cmake/3.16.9")
@@ -173,6 +198,9 @@ class FollyConan(ConanFile):
                 cmake.definitions["CMAKE_CXX_FLAGS"] = "/arch:FMA"
 
         cmake.definitions["CMAKE_POSITION_INDEPENDENT_CODE"] = self.options.get_safe("fPIC", True)
+        # Found by the Find modules of folly, which would also pick them from the system
+        cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_LibUring"] = not self.options.get_safe("with_liburing", False)
+        cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_LibAIO"] = not self.options.get_safe("with_libaio", False)
 
         cxx_std_flag = tools.cppstd_flag(self.settings)
         cxx_std_value = cxx_std_flag.split('=')[1] if cxx_std_flag else "c++{}".format(self._minimum_cpp_standard)
@@ -247,6 +275,14 @@ class FollyConan(ConanFile):
         if self.settings.os == "Linux":
             self.cpp_info.components["libfolly"].requires.extend(["libiberty::libiberty", "libunwind::libunwind"])
             self.cpp_info.components["libfolly"].system_libs.extend(["pthread", "dl", "rt"])
+        if self.options.with_jemalloc:
+            self.cpp_info.components["libfolly"].requires.append("jemalloc::jemalloc")
+            # Checked by folly/portability/Malloc.h, also in the headers used by consumers
+            self.cpp_info.components["libfolly"].defines.append("FOLLY_USE_JEMALLOC")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["libfolly"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_libaio"):
+            self.cpp_info.components["libfolly"].requires.append("libaio::libaio")
 
         if Version(self.version) >= "2020.08.10.00":
             self.cpp_info.components["libfolly"].requires.append("fmt::fmt")
@@ -266,7 +302,7 @@ class FollyConan(ConanFile):
             self.cpp_info.components["libfolly"].system_libs.append("c++abi")
 
         if self.options.get_safe("use_sse4_2") and str(self.settings.arch) in ['x86', 'x86_64']:
-            self.cpp_info.components["libfolly"].defines = ["FOLLY_SSE=4", "FOLLY_SSE_MINOR=2"]
+            self.cpp_info.components["libfolly"].defines.extend(["FOLLY_SSE=4", "FOLLY_SSE_MINOR=2"])
 
         # TODO: to remove in conan v2 once cmake_find_package_* & pkg_config generators removed
         self.cpp_info.filenames["cmake_find_package"] = "folly"
@@ -29,10 +29,22 @@ class LibVPXConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "runtime_cpu_detect": [True, False],
+        "multithread": [True, False],
+        "realtime_only": [True, False],
+        "vp9_postproc": [True, False],
+        "vp9_temporal_denoising": [True, False],
+        "neon": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "runtime_cpu_detect": True,
+        "multithread": True,
+        "realtime_only": False,
+        "vp9_postproc": False,
+        "vp9_temporal_denoising": False,
+        "neon": True,
     }
 
     _arch_options = ['mmx', 'sse', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'avx', 'avx2', 'avx512']
@@ -53,6 +65,8 @@ class LibVPXConan(ConanFile):
         if str(self.settings.arch) not in ['x86', 'x86_64']:
             for name in self._arch_options:
                 delattr(self.options, name)
+        if not str(self.settings.arch).startswith("arm"):
+            del self.options.neon
 
     def configure(self):
         if self.settings.os == "Windows":
@@ -159,6 +173,18 @@ class LibVPXConan(ConanFile):
             for name in self._arch_options:
                 if not self.options.get_safe(name):
                     tc.configure_args.append(f"--disable-{name}")
+        # Enabled by default by libvpx where supported, explicitly enabling them fails on the other targets
+        for name in ["neon", "runtime_cpu_detect", "multithread"]:
+            if not self.options.get_safe(name, True):
+                tc.configure_args.append(f"--disable-{name.replace('_', '-')}")
+        features = {
+            "realtime_only": ["--enable-realtime-only"],
+            "vp9_postproc": ["--enable-postproc", "--enable-vp9-postproc"],
+            "vp9_temporal_denoising": ["--enable-vp9-temporal-denoising"],
+        }
+        for name, flags in features.items():
+            if self.options.get_safe(name):
+                tc.configure_args.extend(flags)
 
         tc.update_configure_args({
             # libvpx does not like --prefix=/ as it fails the test for "libdir
@@ -268,4 +294,6 @@ class LibVPXConan(ConanFile):
             if libcxx:
                 self.cpp_info.system_libs.append(libcxx)
         if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.system_libs.extend(["m", "pthread"])
+            self.cpp_info.system_libs.append("m")
+            if self.options.multithread:
+                self.cpp_info.system_libs.append("pthread")
@@ -23,10 +23,18 @@ class LlamaCppConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "instruction_set": ["native", "generic", "avx", "avx2", "avx512"],
+        "fma": [True, False],
+        "f16c": [True, False],
+        "with_openblas": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "instruction_set": "avx2",
+        "fma": True,
+        "f16c": True,
+        "with_openblas": False,
     }
  
     package_type = "library"
@@ -41,13 +49,31 @@ class LlamaCppConan(ConanFile):
             "gcc": "8"
         }
 
+    @property
+    def _is_x86(self):
+        return str(self.settings.arch) in ("x86", "x86_64")
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if not self._is_x86:
+            del self.options.instruction_set
+            del self.options.fma
+            del self.options.f16c
+        if is_apple_os(self):
+            # Accelerate is used instead
+            del self.options.with_openblas
 
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if self.options.get_safe("instruction_set") in ("native", "generic"):
+            self.options.rm_safe("fma")
+            self.options.rm_safe("f16c")
+
+    def requirements(self):
+        if self.options.get_safe("with_openblas"):
+            self.requires("openblas/0.3.27")
 
     def validate(self):
         if self.settings.compiler.cppstd:
@@ -57,6 +83,8 @@ class LlamaCppConan(ConanFile):
             raise ConanInvalidConfiguration(
                 f"{self.ref} requires {str(self.settings.compiler)}>={minimum_version}."
             )
+        if self.options.get_safe("instruction_set") == "native" and cross_building(self):
+            raise ConanInvalidConfiguration(f"{self.ref} can't use instruction_set=native when cross-building")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -66,6 +94,7 @@ class LlamaCppConan(ConanFile):
 
     def generate(self):
         deps = CMakeDeps(self)
+        deps.set_property("openblas", "cmake_file_name", "BLAS")
         deps.generate()
 
         tc = CMakeToolchain(self)
@@ -73,8 +102,20 @@ class LlamaCppConan(ConanFile):
         tc.variables["LLAMA_BUILD_TESTS"] = False
         tc.variables["LLAMA_BUILD_EXAMPLES"] = False
         tc.variables["BUILD_SHARED_LIBS"] = bool(self.options.shared)
-        if hasattr(self, "settings_build") and cross_building(self):
+        if self._is_x86:
+            instruction_set = str(self.options.instruction_set)
+            tc.variables["LLAMA_NATIVE"] = instruction_set == "native"
+            if instruction_set != "native":
+                tc.variables["LLAMA_AVX"] = instruction_set in ("avx", "avx2", "avx512")
+                tc.variables["LLAMA_AVX2"] = instruction_set in ("avx2", "avx512")
+                tc.variables["LLAMA_AVX512"] = instruction_set == "avx512"
+                tc.variables["LLAMA_FMA"] = bool(self.options.get_safe("fma", False))
+                tc.variables["LLAMA_F16C"] = bool(self.options.get_safe("f16c", False))
+        elif hasattr(self, "settings_build") and cross_building(self):
             tc.variables["LLAMA_NATIVE"] = False
+        if self.options.get_safe("with_openblas"):
+            tc.variables["LLAMA_BLAS"] = True
+            tc.variables["LLAMA_BLAS_VENDOR"] = "OpenBLAS"
         tc.generate()
 
     def build(self):
@@ -101,6 +142,8 @@ class LlamaCppConan(ConanFile):
         self.cpp_info.components["llama"].resdirs = ["res"]
         self.cpp_info.components["llama"].libdirs = ["lib"]
 
+        if self.options.get_safe("with_openblas"):
+            self.cpp_info.components["llama"].requires.append("openblas::openblas")
         if is_apple_os(self):
             self.cpp_info.components["llama"].frameworks.extend(["Foundation", "Accelerate", "Metal"])
         elif self.settings.os in ("Linux", "FreeBSD"):
@@ -6,6 +6,7 @@ from conan.tools.layout import basic_layout
 from conan.tools.gnu import Autotools, AutotoolsToolchain
 from conan.tools.apple import is_apple_os
 from conan.tools.build import cross_building
+from conan.tools.env import Environment
 from conan.errors import ConanInvalidConfiguration
 import os
 
@@ -22,8 +23,26 @@ class LuajitConan(ConanFile):
     topics = ("lua", "jit")
     provides = "lua"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "gc64": [True, False],
+        "jit": [True, False],
+        "ffi": [True, False],
+        "lua52compat": [True, False],
+        "sysmalloc": [True, False],
+        "optimize": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "gc64": False,
+        "jit": True,
+        "ffi": True,
+        "lua52compat": False,
+        "sysmalloc": False,
+        "optimize": True,
+    }
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -31,6 +50,9 @@ class LuajitConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # GC64 mode (heaps larger than 2 GB) is only available since 2.1 on 64 bit archs
+        if Version(self.version) < "2.1.0-beta1" or self.settings.arch not in ["x86_64", "armv8"]:
+            del self.options.gc64
 
     def configure(self):
         if self.options.shared:
@@ -46,6 +68,9 @@ class LuajitConan(ConanFile):
             raise ConanInvalidConfiguration(f"{self.ref} can not be cross-built to Mac M1. Please, try any version >=2.1")
         elif Version(self.version) <= "2.1.0-beta1" and self.settings.os == "Macos" and self.settings.arch == "armv8":
             raise ConanInvalidConfiguration(f"{self.ref} is not supported by Mac M1. Please, try any version >=2.1")
+        # msvcbuild.bat always builds the interpreter with JIT and FFI
+        if is_msvc(self) and not (self.options.jit and self.options.ffi):
+            raise ConanInvalidConfiguration(f"{self.ref} can't disable JIT or FFI with msvc")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
@@ -58,8 +83,26 @@ class LuajitConan(ConanFile):
             tc.generate()
         else:
             tc = AutotoolsToolchain(self)
+            if not self.options.optimize:
+                # Appended after the -O2 -fomit-frame-pointer of the Makefile and the flags of the build type
+                tc.extra_cflags.extend(["-O0", "-g", "-fno-omit-frame-pointer"])
             tc.generate()
 
+    @property
+    def _defines(self):
+        defines = []
+        if self.options.get_safe("gc64"):
+            defines.append("LUAJIT_ENABLE_GC64")
+        if not self.options.jit:
+            defines.append("LUAJIT_DISABLE_JIT")
+        if not self.options.ffi:
+            defines.append("LUAJIT_DISABLE_FFI")
+        if self.options.lua52compat:
+            defines.append("LUAJIT_ENABLE_LUA52COMPAT")
+        if self.options.sysmalloc:
+            defines.append("LUAJIT_USE_SYSMALLOC")
+        return defines
+
     def _patch_sources(self):
         if not is_msvc(self):
             buildmode = 'shared' if self.options.shared else 'static'
@@ -94,6 +137,10 @@ class LuajitConan(ConanFile):
         args = [f"PREFIX={unix_path(self, self.package_folder)}"]
         if is_apple_os(self) and self._macosx_deployment_target:
             args.append(f"MACOSX_DEPLOYMENT_TARGET={self._macosx_deployment_target}")
+        if self._defines:
+            # Also used by the Makefile to select the features of the VM built by DynASM
+            xcflags = " ".join(f"-D{define}" for define in self._defines)
+            args.append(f'XCFLAGS="{xcflags}"')
         return args
 
     @property
@@ -107,9 +154,19 @@ class LuajitConan(ConanFile):
         apply_conandata_patches(self)
         self._patch_sources()
         if is_msvc(self):
-            with chdir(self, os.path.join(self.source_folder, "src")):
-                variant = '' if self.options.shared else 'static'
-                self.run(f"msvcbuild.bat {variant}", env="conanbuild")
+            # Arguments must be given in this order
+            variant = []
+            if self.options.get_safe("gc64"):
+                variant.append("gc64")
+            if not self.options.optimize:
+                variant.append("debug")
+            if not self.options.shared:
+                variant.append("static")
+            env = Environment()
+            # Read by cl.exe, the remaining defines don't change the VM
+            env.append("CL", [f"/D{define}" for define in self._defines if define != "LUAJIT_ENABLE_GC64"])
+            with chdir(self, os.path.join(self.source_folder, "src")), env.vars(self).apply():
+                self.run(f"msvcbuild.bat {' '.join(variant)}", env="conanbuild")
         else:
             with chdir(self, self.source_folder):
                 autotools = Autotools(self)
@@ -141,3 +198,6 @@ class LuajitConan(ConanFile):
         self.cpp_info.includedirs = [os.path.join("include", self._luajit_include_folder)]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs.extend(["m", "dl"])
+        if self.settings.os == "Macos" and self.settings.arch == "x86_64" and not self.options.get_safe("gc64"):
+            # Without GC64, the memory of LuaJIT must be in the lower 2 GB of the address space
+            self.cpp_info.exelinkflags = ["-Wl,-pagezero_size,10000", "-Wl,-image_base,100000000"]